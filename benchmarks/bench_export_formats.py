@@ -0,0 +1,75 @@
+"""
+합성 테이블을 CSV / CSV(gzip) / Parquet / Arrow IPC로 내보내며 소요 시간과 파일 크기를 비교합니다.
+로컬 SQLite 파일만 사용합니다. (Parquet/Arrow는 pyarrow 필요)
+
+예)
+  python benchmarks/bench_export_formats.py --rows 500000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from data_shuttle import utils
+from data_shuttle.columnar import export_origin_to_columnar
+
+
+def _make_table(engine, rows: int) -> None:
+    with engine.begin() as c:
+        c.execute(text("DROP TABLE IF EXISTS bench"))
+        c.execute(text(
+            "CREATE TABLE bench (id INTEGER, name VARCHAR(100), amount NUMERIC(12, 2),"
+            " qty INTEGER, created_at TIMESTAMP, memo TEXT)"
+        ))
+    insert = "INSERT INTO bench VALUES (?, ?, ?, ?, ?, ?)"
+    with engine.begin() as c:
+        batch = []
+        for i in range(rows):
+            batch.append((
+                i, f"name_{i % 5000}", round(i * 1.25 % 100_000, 2), i % 97,
+                f"2025-01-{i % 28 + 1:02d} {i % 24:02d}:{i % 60:02d}:00", "memo " * (i % 7),
+            ))
+            if len(batch) == 10_000:
+                c.exec_driver_sql(insert, batch)
+                batch = []
+        if batch:
+            c.exec_driver_sql(insert, batch)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="CSV vs Parquet/Arrow export benchmark")
+    ap.add_argument("--rows", type=int, default=200_000)
+    ap.add_argument("--chunk-size", type=int, default=10_000)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'src.db')}")
+        _make_table(engine, args.rows)
+
+        cases = [
+            ("csv", "bench.csv", lambda p: utils.export_origin_to_csv(
+                engine, "main", "bench", "", p, chunk_size=args.chunk_size)),
+            ("csv/gzip", "bench.csv.gz", lambda p: utils.export_origin_to_csv(
+                engine, "main", "bench", "", p, chunk_size=args.chunk_size, compression="gzip")),
+            ("parquet/zstd", "bench.parquet", lambda p: export_origin_to_columnar(
+                engine, "main", "bench", "", p, chunk_size=args.chunk_size, compression="zstd")),
+            ("arrow/zstd", "bench.arrow", lambda p: export_origin_to_columnar(
+                engine, "main", "bench", "", p, file_format="arrow", chunk_size=args.chunk_size, compression="zstd")),
+        ]
+        print(f"rows={args.rows} chunk_size={args.chunk_size}")
+        for name, file_name, run in cases:
+            path = os.path.join(tmp, file_name)
+            t0 = time.perf_counter()
+            n = run(path)
+            sec = time.perf_counter() - t0
+            size = os.path.getsize(path)
+            print(f"{name:<13} {n:>9} rows  {sec:7.2f}s  {n / sec:10,.0f} rows/sec  {size / 2**20:8.1f} MiB")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+로컬 PostgreSQL에서 INSERT(executemany) 와 COPY 적재 속도(rows/sec)를 비교합니다.
+
+예)
+  python benchmarks/bench_pg_copy.py --host 127.0.0.1 --db bench --user postgres --password pw --rows 500000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from data_shuttle import utils
+
+
+def _prepare(engine, schema: str, rows: int) -> None:
+    with engine.begin() as c:
+        c.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+        c.execute(text(f"DROP TABLE IF EXISTS {schema}.bench_src"))
+        c.execute(text(
+            f"CREATE TABLE {schema}.bench_src ("
+            " id bigint primary key, name varchar(100), amount numeric(12,2), created_at timestamp)"
+        ))
+        c.execute(text(
+            f"INSERT INTO {schema}.bench_src "
+            "SELECT g, 'name_' || g, g * 1.25, now() - (g || ' seconds')::interval "
+            "FROM generate_series(1, :n) g"
+        ), {"n": rows})
+
+
+def _run(engine, schema: str, chunk_size: int, **mode) -> tuple[int, float]:
+    with engine.begin() as c:
+        c.execute(text(f"DROP TABLE IF EXISTS {schema}.bench_dst"))
+        c.execute(text(f"CREATE TABLE {schema}.bench_dst (LIKE {schema}.bench_src)"))
+
+    inserted = 0
+    t0 = time.perf_counter()
+    for ev in utils.run_migration_stream(
+        engine, engine,
+        src_schema=schema, src_table="bench_src",
+        dst_schema=schema, dst_table="bench_dst",
+        chunk_size=chunk_size, **mode,
+    ):
+        if ev["type"] == "progress":
+            inserted += ev["inserted_delta"]
+        elif ev["type"] == "error":
+            print(f"  error row {ev['row_index']}: {ev['error']}")
+    return inserted, time.perf_counter() - t0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="PostgreSQL INSERT vs COPY benchmark")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=5432)
+    ap.add_argument("--db", required=True)
+    ap.add_argument("--user", required=True)
+    ap.add_argument("--password", default="")
+    ap.add_argument("--schema", default="ds_bench")
+    ap.add_argument("--rows", type=int, default=200_000)
+    ap.add_argument("--chunk-size", type=int, default=10_000)
+    args = ap.parse_args()
+
+    engine = utils.create_engine_from_config({
+        "db_type": "PostgreSQL", "host": args.host, "port": args.port,
+        "service_or_db": args.db, "user": args.user, "password": args.password,
+    })
+    _prepare(engine, args.schema, args.rows)
+
+    modes = [
+        ("insert", {"load_mode": "insert"}),
+        ("copy/text", {"load_mode": "copy", "copy_format": "text"}),
+        ("copy/binary", {"load_mode": "copy", "copy_format": "binary"}),
+    ]
+    print(f"rows={args.rows} chunk_size={args.chunk_size}")
+    for name, mode in modes:
+        n, sec = _run(engine, args.schema, args.chunk_size, **mode)
+        print(f"{name:<12} {n:>10} rows  {sec:8.2f}s  {n / sec if sec else 0:12,.0f} rows/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+"""
+재현 가능한 처리량 벤치마크 모음: 합성 테이블(narrow / wide / text / lob)을 만들고
+run_migration_stream, export_origin_to_csv를 청크 크기 × 적재 모드 조합으로 실행합니다.
+
+- 백엔드: 로컬 SQLite 파일(항상) + --pg-url(또는 DATASHUTTLE_BENCH_PG_URL)이 연결되면 PostgreSQL
+- 측정: rows/sec, MB/sec(생성 데이터 기준 행 크기), 최대 RSS, 단계별 시간(count / first_chunk / load / verify),
+  원본 커서 fetchmany 호출 수(fetch_calls, 실행 옵션 ds_cursor_wrapper로 계측)
+- fetch_round_trips: PostgreSQL 서버측 커서는 fetchmany 1회 = FETCH 1회 = 왕복 1회라 fetch_calls와 같습니다.
+  SQLite는 네트워크 왕복이 없으므로 None — SQLite 결과로는 왕복 감소(fetch_size 효과)를 판단할 수 없습니다.
+  원거리 효과는 --pg-url로 원격 PostgreSQL에 대해 실행해 확인하세요.
+- 각 케이스는 별도 프로세스에서 실행하여 최대 RSS가 케이스별로 분리됩니다.
+- 결과는 JSON(커밋 해시·환경 포함)으로 저장하고, --compare로 이전 결과와 비교합니다.
+
+예)
+  python benchmarks/bench_suite.py --rows 1000000 --profiles narrow wide --chunk-sizes 5000 20000
+  python benchmarks/bench_suite.py --rows 50000000 --profiles narrow --workdir /data/bench   # 원본 재사용
+  python benchmarks/bench_suite.py --pg-url postgresql+psycopg://postgres:pw@127.0.0.1/bench --compare old.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sqlalchemy
+from sqlalchemy import text
+from data_shuttle import converters, utils
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+# 프로필: [(컬럼, SQLite 타입, PostgreSQL 타입, 값 생성 함수)]
+_TEXT_200 = "x" * 200
+_LOB_TEXT = "lorem ipsum " * 700          # 약 8 KiB
+_LOB_BYTES = bytes(range(256)) * 16       # 4 KiB
+
+
+def _profile(name: str):
+    if name == "narrow":
+        return [
+            ("id", "INTEGER", "bigint", lambda i: i),
+            ("qty", "INTEGER", "integer", lambda i: i % 97),
+            ("amount", "NUMERIC(12,2)", "numeric(12,2)", lambda i: round(i * 1.25 % 100_000, 2)),
+            ("name", "VARCHAR(40)", "varchar(40)", lambda i: f"name_{i % 5000}"),
+            ("created_at", "TIMESTAMP", "timestamp",
+             lambda i: f"2025-01-{i % 28 + 1:02d} {i % 24:02d}:{i % 60:02d}:00"),
+        ]
+    if name == "wide":
+        cols = [("id", "INTEGER", "bigint", lambda i: i)]
+        for c in range(1, 100):
+            if c % 2:
+                cols.append((f"n{c}", "INTEGER", "bigint", lambda i, c=c: i * c % 1_000_003))
+            else:
+                cols.append((f"s{c}", "VARCHAR(20)", "varchar(20)", lambda i, c=c: f"v{i % 1000}_{c}"))
+        return cols
+    if name == "text":
+        return [("id", "INTEGER", "bigint", lambda i: i)] + [
+            (f"t{c}", "VARCHAR(400)", "varchar(400)", lambda i, c=c: f"{i}:{c}:{_TEXT_200}") for c in range(5)
+        ]
+    if name == "lob":
+        return [
+            ("id", "INTEGER", "bigint", lambda i: i),
+            ("body", "TEXT", "text", lambda i: _LOB_TEXT),
+            ("payload", "BLOB", "bytea", lambda i: _LOB_BYTES),
+        ]
+    raise ValueError(f"unknown profile: {name}")
+
+
+PROFILES = ("narrow", "wide", "text", "lob")
+
+# 적재 모드: (이름, run_migration_stream 인자, PostgreSQL 전용 여부)
+# src_fetch_size는 인자가 아니라 원본 접속 설정 fetch_size — 드라이버 기본 왕복 크기(100행)와 비교용
+MIGRATE_MODES = [
+    ("insert", {}, False),
+    ("insert-fetch100", {"src_fetch_size": 100}, False),
+    ("insert-noprefetch", {"prefetch_chunks": 0}, False),
+    ("adaptive", {"adaptive_chunks": True}, False),
+    ("copy", {"load_mode": "copy"}, True),
+    ("copy-binary", {"load_mode": "copy", "copy_format": "binary"}, True),
+]
+EXPORT_MODES = [("csv", {}), ("csv-gzip", {"compression": "gzip"})]
+
+
+def _placeholder(engine) -> str:
+    return "?" if engine.dialect.paramstyle == "qmark" else "%s"
+
+
+def _ddl(engine, schema: str, table: str, cols) -> str:
+    pg = engine.dialect.name == "postgresql"
+    body = ", ".join(f"{c} {pg_t if pg else lite_t}" for c, lite_t, pg_t, _ in cols)
+    return f"CREATE TABLE {schema}.{table} ({body})"
+
+
+def _row_bytes(cols) -> float:
+    """생성 데이터 기준 평균 행 크기 (MB/sec 계산용)"""
+    sample = [tuple(gen(i) for *_, gen in cols) for i in range(1, 1001)]
+    total = sum(len(v) if isinstance(v, (bytes, str)) else len(str(v)) for row in sample for v in row)
+    return total / len(sample)
+
+
+def _source_rows(engine, schema: str, table: str) -> int | None:
+    try:
+        with engine.connect() as c:
+            return c.execute(text(f"SELECT COUNT(*) FROM {schema}.{table}")).scalar()
+    except Exception:
+        return None
+
+
+def _generate(engine, schema: str, table: str, cols, rows: int) -> float:
+    """원본 테이블 생성 (같은 행 수로 이미 있으면 재사용) → 소요 초"""
+    if _source_rows(engine, schema, table) == rows:
+        return 0.0
+    t0 = time.perf_counter()
+    with engine.begin() as c:
+        if engine.dialect.name == "postgresql":
+            c.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+        c.execute(text(f"DROP TABLE IF EXISTS {schema}.{table}"))
+        c.execute(text(_ddl(engine, schema, table, cols)))
+    insert = f"INSERT INTO {schema}.{table} VALUES ({', '.join(_placeholder(engine) for _ in cols)})"
+    gens = [gen for *_, gen in cols]
+    batch_size = max(100, 200_000 // len(cols))
+    with engine.begin() as c:
+        for start in range(1, rows + 1, batch_size):
+            batch = [tuple(g(i) for g in gens) for i in range(start, min(rows + 1, start + batch_size))]
+            c.exec_driver_sql(insert, batch)
+    return time.perf_counter() - t0
+
+
+def _peak_rss_bytes() -> int | None:
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss)
+    except ImportError:
+        return None
+
+
+class _CountingCursor:
+    """fetchmany 호출만 세고 나머지 속성(arraysize / itersize / prefetchrows ...)은 드라이버 커서로 넘깁니다."""
+
+    def __init__(self, cur, counter: dict):
+        object.__setattr__(self, "_cur", cur)
+        object.__setattr__(self, "_counter", counter)
+
+    def fetchmany(self, *args, **kwargs):
+        self._counter["calls"] += 1
+        return self._cur.fetchmany(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._cur, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._cur, name, value)
+
+
+# ───────────── 케이스 1개 (자식 프로세스) ─────────────
+def _run_case(case: dict) -> dict:
+    base_rss = _peak_rss_bytes()
+    options = dict(case["options"])
+    fetch_size = options.pop("src_fetch_size", None)
+    src_base = utils.create_engine_from_config(dict(case["src_cfg"], fetch_size=fetch_size))
+    fetches = {"calls": 0}
+    # _fetch_chunks가 이 실행 옵션으로 드라이버 커서를 감쌉니다. (같은 풀을 쓰는 옵션 Engine)
+    src = src_base.execution_options(ds_cursor_wrapper=lambda cur: _CountingCursor(cur, fetches))
+    dst = utils.create_engine_from_config(case["dst_cfg"])
+    schema, table = case["schema"], case["table"]
+    phases = {}
+
+    t0 = time.perf_counter()
+    counted = utils.count_rows(src, schema, table, "")
+    phases["count"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    first = None
+    if case["kind"] == "migrate":
+        dst_table = f"{table}_dst"
+        with dst.begin() as c:
+            if dst.dialect.name == "postgresql":
+                c.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+            c.execute(text(f"DROP TABLE IF EXISTS {schema}.{dst_table}"))
+            c.execute(text(_ddl(dst, schema, dst_table, _profile(case["profile"]))))
+        phases["prepare"] = time.perf_counter() - t0
+
+        n, errors = 0, 0
+        t0 = time.perf_counter()
+        for ev in utils.run_migration_stream(
+            src, dst, src_schema=schema, src_table=table, dst_schema=schema, dst_table=dst_table,
+            chunk_size=case["chunk_size"], **options,
+        ):
+            if ev["type"] == "progress":
+                if first is None:
+                    first = time.perf_counter() - t0
+                n += ev["inserted_delta"]
+            elif ev["type"] == "error":
+                errors += 1
+        load = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        verified = _source_rows(dst, schema, dst_table)
+        phases["verify"] = time.perf_counter() - t0
+        output_bytes = None
+    else:
+        path = os.path.join(case["workdir"], f"{table}_{case['mode']}.csv")
+        if options.get("compression") == "gzip":
+            path += ".gz"
+        phases["prepare"] = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        n = utils.export_origin_to_csv(src, schema, table, "", path, chunk_size=case["chunk_size"], **options)
+        load = time.perf_counter() - t0
+        errors, verified = 0, n
+        output_bytes = os.path.getsize(path)
+        os.remove(path)
+
+    phases["first_chunk"] = first
+    phases["load"] = load
+    # Oracle LOB(CLOB/BLOB) 테이블은 청크 크기가 lob_chunk_rows(기본 1000)로 제한됩니다.
+    kinds = converters.column_kinds(src, schema, table, utils._get_columns(src, schema, table))
+    batch = fetch_size or converters.lob_chunk_size(case["chunk_size"], kinds, 1_000)
+    src_base.dispose()
+    dst.dispose()
+    return {
+        "processed_rows": n,
+        "source_rows": counted,
+        "verified_rows": verified,
+        "errors": errors,
+        "seconds": round(load, 4),
+        "rows_per_sec": round(n / load, 1) if load else None,
+        "mb_per_sec": round(n * case["row_bytes"] / load / 2**20, 2) if load else None,
+        "output_bytes": output_bytes,
+        # fetch_size: 설정한 왕복 크기(없으면 시작 청크 크기), fetch_calls: 실제 fetchmany 호출 수(마지막 빈 fetch 포함)
+        # fetch_round_trips: 네트워크 왕복 — PostgreSQL 서버측 커서만 측정 가능, SQLite는 None
+        "fetch_size": batch,
+        "fetch_calls": fetches["calls"],
+        "fetch_round_trips": fetches["calls"] if case["backend"] == "postgresql" else None,
+        "peak_rss_mb": round(_peak_rss_bytes() / 2**20, 1) if base_rss else None,
+        "base_rss_mb": round(base_rss / 2**20, 1) if base_rss else None,
+        "phases": {k: (round(v, 4) if v is not None else None) for k, v in phases.items()},
+    }
+
+
+def _spawn(case: dict) -> dict:
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--case", json.dumps(case)],
+        capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        return {"error": (proc.stderr or proc.stdout).strip().splitlines()[-1:] or ["failed"]}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+# ───────────── 메타 / 비교 ─────────────
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def _case_key(r: dict) -> tuple:
+    return (r["backend"], r["profile"], r["rows"], r["kind"], r["mode"], r["chunk_size"])
+
+
+def _compare(results: list, baseline_path: str) -> None:
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        base = {_case_key(r): r for r in json.load(f).get("results", [])}
+    print(f"\ncompare with {baseline_path}")
+    for r in results:
+        old = base.get(_case_key(r))
+        if not old or not old.get("rows_per_sec") or not r.get("rows_per_sec"):
+            continue
+        ratio = r["rows_per_sec"] / old["rows_per_sec"]
+        print(f"  {'/'.join(str(k) for k in _case_key(r)):<55} {old['rows_per_sec']:>12,.0f} → "
+              f"{r['rows_per_sec']:>12,.0f} rows/sec  ({ratio - 1:+.1%})")
+
+
+def _backends(args, workdir: str) -> list:
+    out = [("sqlite",
+            {"db_type": "SQLite", "service_or_db": os.path.join(workdir, "src.db")},
+            {"db_type": "SQLite", "service_or_db": os.path.join(workdir, "dst.db")},
+            "main")]
+    pg_url = args.pg_url or os.environ.get("DATASHUTTLE_BENCH_PG_URL")
+    if pg_url:
+        cfg = {"db_type": "URL", "url": pg_url}
+        try:
+            eng = utils.create_engine_from_config(cfg)
+            with eng.connect():
+                pass
+            eng.dispose()
+            out.append(("postgresql", cfg, cfg, args.pg_schema))
+        except Exception as e:
+            print(f"PostgreSQL skipped: {e}")
+    return out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="DataShuttle throughput benchmark suite")
+    ap.add_argument("--rows", type=int, nargs="+", default=[100_000])
+    ap.add_argument("--profiles", nargs="+", choices=PROFILES, default=["narrow", "wide"])
+    ap.add_argument("--chunk-sizes", type=int, nargs="+", default=[2_000, 10_000])
+    ap.add_argument("--modes", nargs="+", default=[m for m, *_ in MIGRATE_MODES] + [m for m, _ in EXPORT_MODES],
+                    help="migrate: insert insert-fetch100 insert-noprefetch adaptive copy copy-binary / export: csv csv-gzip")
+    ap.add_argument("--pg-url", help="로컬 PostgreSQL SQLAlchemy URL (없으면 SQLite만)")
+    ap.add_argument("--pg-schema", default="ds_bench")
+    ap.add_argument("--workdir", help="원본 DB/임시 파일 폴더 (지정하면 생성한 원본을 다음 실행에 재사용)")
+    ap.add_argument("--out", help=f"결과 JSON (기본: {RESULTS_DIR}/<시각>_<커밋>.json)")
+    ap.add_argument("--compare", help="이전 결과 JSON과 rows/sec 비교")
+    ap.add_argument("--case", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.case:
+        print(json.dumps(_run_case(json.loads(args.case))))
+        return
+
+    tmp = None if args.workdir else tempfile.TemporaryDirectory()
+    workdir = args.workdir or tmp.name
+    os.makedirs(workdir, exist_ok=True)
+    commit = _git_commit()
+    started = datetime.now(timezone.utc)
+    results = []
+    try:
+        for backend, src_cfg, dst_cfg, schema in _backends(args, workdir):
+            src = utils.create_engine_from_config(src_cfg)
+            for profile in args.profiles:
+                cols = _profile(profile)
+                row_bytes = _row_bytes(cols)
+                for rows in args.rows:
+                    table = f"bench_{profile}_{rows}"
+                    gen_sec = _generate(src, schema, table, cols, rows)
+                    print(f"[{backend}] {profile} rows={rows} ({len(cols)} cols, ~{row_bytes:.0f} B/row)"
+                          + (f" generated in {gen_sec:.1f}s" if gen_sec else " (reused)"))
+                    cases = [("migrate", m, o) for m, o, pg_only in MIGRATE_MODES
+                             if m in args.modes and (backend == "postgresql" or not pg_only)]
+                    cases += [("export", m, o) for m, o in EXPORT_MODES if m in args.modes]
+                    for kind, mode, options in cases:
+                        for chunk_size in args.chunk_sizes:
+                            case = dict(
+                                backend=backend, profile=profile, rows=rows, kind=kind, mode=mode,
+                                chunk_size=chunk_size, options=options, src_cfg=src_cfg, dst_cfg=dst_cfg,
+                                schema=schema, table=table, row_bytes=row_bytes, workdir=workdir,
+                            )
+                            res = _spawn(case)
+                            r = {k: case[k] for k in ("backend", "profile", "rows", "kind", "mode", "chunk_size")}
+                            r.update(row_bytes=round(row_bytes, 1), **res)
+                            results.append(r)
+                            if "error" in res:
+                                print(f"  {kind:<7} {mode:<18} chunk={chunk_size:<7} FAILED {res['error']}")
+                                continue
+                            print(f"  {kind:<7} {mode:<18} chunk={chunk_size:<7} {res['seconds']:8.2f}s "
+                                  f"{res['rows_per_sec']:>11,.0f} rows/s {res['mb_per_sec']:>8.1f} MB/s "
+                                  f"fetch {res['fetch_calls']:>7,} calls "
+                                  f"trips {'n/a' if res['fetch_round_trips'] is None else format(res['fetch_round_trips'], ',')} "
+                                  f"rss {res['peak_rss_mb']} MiB")
+            src.dispose()
+    finally:
+        if tmp:
+            tmp.cleanup()
+
+    out = args.out or os.path.join(RESULTS_DIR, f"{started:%Y%m%dT%H%M%SZ}_{commit or 'nogit'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump({
+            "meta": {
+                "commit": commit,
+                "started_at": started.isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "sqlalchemy": sqlalchemy.__version__,
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "args": {k: v for k, v in vars(args).items() if k not in ("case", "pg_url")},
+            },
+            "results": results,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"saved → {out}")
+    if args.compare:
+        _compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
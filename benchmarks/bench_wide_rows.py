@@ -0,0 +1,109 @@
+"""
+넓은 합성 테이블(기본 200컬럼)에서 행별 dict 방식과 튜플 위치 바인드 방식의
+rows/sec 및 최대 메모리(tracemalloc)를 비교합니다. 로컬 SQLite 파일만 사용합니다.
+
+예)
+  python benchmarks/bench_wide_rows.py --rows 50000 --cols 200
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from data_shuttle import utils
+
+
+def _make_tables(src, dst, rows: int, ncols: int) -> None:
+    cols = [f"c{i}" for i in range(ncols)]
+    ddl = ", ".join(f"{c} {'INTEGER' if i % 2 else 'TEXT'}" for i, c in enumerate(cols))
+    for eng in (src, dst):
+        with eng.begin() as c:
+            c.execute(text("DROP TABLE IF EXISTS wide"))
+            c.execute(text(f"CREATE TABLE wide ({ddl})"))
+    insert = f"INSERT INTO wide VALUES ({', '.join('?' for _ in cols)})"
+    with src.begin() as c:
+        batch = []
+        for r in range(rows):
+            batch.append(tuple(r if i % 2 else f"v{r}_{i}" for i in range(ncols)))
+            if len(batch) == 5_000:
+                c.exec_driver_sql(insert, batch)
+                batch = []
+        if batch:
+            c.exec_driver_sql(insert, batch)
+
+
+def _truncate(dst) -> None:
+    with dst.begin() as c:
+        c.execute(text("DELETE FROM wide"))
+
+
+def _legacy_dict_path(src, dst, chunk_size: int) -> int:
+    """이전 구현: Row._mapping → 행별 dict → text() executemany"""
+    cols = utils._get_columns(src, "main", "wide")
+    select_sql = text(f"SELECT {', '.join(f'{c} AS {c}' for c in cols)} FROM main.wide")
+    insert_sql = text(f"INSERT INTO main.wide ({', '.join(cols)}) VALUES ({', '.join(f':{c}' for c in cols)})")
+    n = 0
+    with src.connect() as s, dst.begin() as d:
+        result = s.execution_options(stream_results=True).execute(select_sql)
+        while True:
+            rows = result.fetchmany(chunk_size)
+            if not rows:
+                break
+            payload = []
+            for r in rows:
+                m = r._mapping
+                payload.append({c: m.get(c) for c in cols})
+            d.execute(insert_sql, payload)
+            n += len(payload)
+    return n
+
+
+def _tuple_path(src, dst, chunk_size: int) -> int:
+    n = 0
+    for ev in utils.run_migration_stream(
+        src, dst, src_schema="main", src_table="wide", dst_schema="main", dst_table="wide",
+        chunk_size=chunk_size, prefetch_chunks=0,
+    ):
+        if ev["type"] == "progress":
+            n += ev["inserted_delta"]
+    return n
+
+
+def _measure(fn, *args) -> tuple[int, float, int]:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    n = fn(*args)
+    sec = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return n, sec, peak
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="wide-table row payload micro-benchmark")
+    ap.add_argument("--rows", type=int, default=50_000)
+    ap.add_argument("--cols", type=int, default=200)
+    ap.add_argument("--chunk-size", type=int, default=2_000)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = create_engine(f"sqlite:///{os.path.join(tmp, 'src.db')}")
+        dst = create_engine(f"sqlite:///{os.path.join(tmp, 'dst.db')}")
+        _make_tables(src, dst, args.rows, args.cols)
+
+        print(f"rows={args.rows} cols={args.cols} chunk_size={args.chunk_size}")
+        for name, fn in (("dict (before)", _legacy_dict_path), ("tuple (after)", _tuple_path)):
+            _truncate(dst)
+            n, sec, peak = _measure(fn, src, dst, args.chunk_size)
+            print(f"{name:<14} {n:>9} rows  {sec:7.2f}s  {n / sec:10,.0f} rows/sec  peak {peak / 2**20:8.1f} MiB")
+        src.dispose()
+        dst.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import sys
+
+from data_shuttle.cli import main
+
+sys.exit(main())
@@ -0,0 +1,305 @@
+"""
+목적지 벌크 적재 모드 (options.bulk_load, 테이블별 options.tables.<T>.bulk_load)
+- 적재 전: 보조 인덱스 제거(Oracle은 UNUSABLE), FK 제약·트리거 비활성화, 선택적으로 UNLOGGED(PostgreSQL)
+  Oracle NOLOGGING은 direct-path 적재에만 적용되고 이 도구의 배열 INSERT(batcherrors)는 redo를 그대로
+  남기므로, Oracle에서는 bulk_unlogged를 무시하고 경고만 남깁니다.
+- 적재 후(실패해도): 로깅 → 인덱스 재생성(병렬) → FK → 트리거 순으로 원래 상태 복구
+- 복구 DDL은 준비 전에 카탈로그에서 계산해 상태 파일에 저장합니다.
+  프로세스가 중간에 죽어도 다음 실행 시작 때 restore_pending()이 마저 복구합니다.
+- PK/UNIQUE 인덱스는 그대로 둡니다. (중복 검출, upsert ON CONFLICT / MERGE 키)
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Generator, Iterable, List
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+# 복구 순서: 로깅을 먼저 되돌려야 SET LOGGED가 인덱스까지 다시 쓰지 않고, 인덱스가 있어야 FK 검증이 빠릅니다.
+RESTORE_ORDER = ("logging", "indexes", "constraints", "triggers")
+
+
+def _q(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _catalog(conn, sql: str, schema: str, table: str) -> list:
+    return list(conn.execute(text(sql), {"s": schema, "t": table}))
+
+
+def _plan_postgresql(conn, schema: str, table: str, *, unlogged: bool, parallel: int) -> List[tuple]:
+    target = f"{schema}.{table}"
+    rel = ("JOIN pg_class t ON t.oid = {col} JOIN pg_namespace n ON n.oid = t.relnamespace "
+           "WHERE n.nspname = lower(:s) AND t.relname = lower(:t)")
+    indexes = _catalog(conn, (
+        "SELECT n.nspname, i.relname, pg_get_indexdef(i.oid) FROM pg_index x "
+        "JOIN pg_class i ON i.oid = x.indexrelid " + rel.format(col="x.indrelid") +
+        " AND NOT x.indisprimary AND NOT x.indisunique"
+        " AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = x.indexrelid)"
+    ), schema, table)
+    fks = _catalog(conn, (
+        "SELECT c.conname, pg_get_constraintdef(c.oid) FROM pg_constraint c " + rel.format(col="c.conrelid") +
+        " AND c.contype = 'f'"
+    ), schema, table)
+    triggers = _catalog(conn, (
+        "SELECT g.tgname FROM pg_trigger g " + rel.format(col="g.tgrelid") +
+        " AND NOT g.tgisinternal AND g.tgenabled <> 'D'"
+    ), schema, table)
+    logged = unlogged and bool(_catalog(conn, (
+        "SELECT 1 FROM pg_class t JOIN pg_namespace n ON n.oid = t.relnamespace "
+        "WHERE n.nspname = lower(:s) AND t.relname = lower(:t) AND t.relpersistence = 'p'"
+    ), schema, table))
+    # 인덱스 재생성은 서버 설정 max_parallel_maintenance_workers로도 병렬화됩니다.
+    return (
+        [("triggers", f"ALTER TABLE {target} DISABLE TRIGGER {_q(g)}",
+          f"ALTER TABLE {target} ENABLE TRIGGER {_q(g)}") for (g,) in triggers]
+        + [("constraints", f"ALTER TABLE {target} DROP CONSTRAINT {_q(c)}",
+            f"ALTER TABLE {target} ADD CONSTRAINT {_q(c)} {d}") for c, d in fks]
+        + [("indexes", f"DROP INDEX {_q(s)}.{_q(i)}", [ddl]) for s, i, ddl in indexes]
+        + ([("logging", f"ALTER TABLE {target} SET UNLOGGED", f"ALTER TABLE {target} SET LOGGED")] if logged else [])
+    )
+
+
+def _plan_oracle(conn, schema: str, table: str, *, unlogged: bool, parallel: int) -> List[tuple]:
+    # unlogged는 쓰지 않습니다: NOLOGGING은 배열 INSERT(conventional path)의 redo를 줄이지 못합니다.
+    target = f"{schema}.{table}"
+    # 파티션 인덱스는 인덱스 자체 status가 N/A이고, REBUILD도 파티션(복합이면 서브파티션)별로 해야 합니다.
+    indexes = _catalog(conn, (
+        "SELECT owner, index_name, partitioned FROM all_indexes "
+        "WHERE table_owner = upper(:s) AND table_name = upper(:t) "
+        "AND uniqueness = 'NONUNIQUE' AND index_type <> 'LOB' "
+        "AND (status = 'VALID' OR (partitioned = 'YES' AND status = 'N/A'))"
+    ), schema, table)
+    parts: Dict[tuple, List[tuple]] = {}
+    if any(p == "YES" for _, _, p in indexes):
+        owned = ("JOIN all_indexes i ON i.owner = p.index_owner AND i.index_name = p.index_name "
+                 "WHERE i.table_owner = upper(:s) AND i.table_name = upper(:t)")
+        for o, i, name, composite in _catalog(conn, (
+            "SELECT p.index_owner, p.index_name, p.partition_name, p.composite FROM all_ind_partitions p "
+            + owned + " ORDER BY p.index_owner, p.index_name, p.partition_position"
+        ), schema, table):
+            if composite != "YES":
+                parts.setdefault((o, i), []).append(("PARTITION", name))
+        for o, i, name in _catalog(conn, (
+            "SELECT p.index_owner, p.index_name, p.subpartition_name FROM all_ind_subpartitions p "
+            + owned + " ORDER BY p.index_owner, p.index_name, p.partition_name, p.subpartition_position"
+        ), schema, table):
+            parts.setdefault((o, i), []).append(("SUBPARTITION", name))
+    fks = _catalog(conn, (
+        "SELECT constraint_name FROM all_constraints WHERE owner = upper(:s) AND table_name = upper(:t) "
+        "AND constraint_type = 'R' AND status = 'ENABLED'"
+    ), schema, table)
+    triggers = _catalog(conn, (
+        "SELECT owner, trigger_name FROM all_triggers WHERE table_owner = upper(:s) AND table_name = upper(:t) "
+        "AND status = 'ENABLED'"
+    ), schema, table)
+
+    def rebuild(owner: str, name: str) -> List[str]:
+        """파티션 인덱스는 전체 REBUILD가 실패하므로 (서브)파티션마다 REBUILD"""
+        idx = f"{_q(owner)}.{_q(name)}"
+        degree = f" PARALLEL {parallel}" if parallel > 1 else ""
+        targets = [f" {kind} {_q(p)}" for kind, p in parts.get((owner, name), [])] or [""]
+        stmts = [f"ALTER INDEX {idx} REBUILD{t}{degree}" for t in targets]
+        if parallel > 1:
+            stmts.append(f"ALTER INDEX {idx} NOPARALLEL")
+        return stmts
+
+    # UNUSABLE 인덱스는 skip_unusable_indexes(기본 TRUE)로 DML 중 유지 비용 없이 건너뜁니다.
+    return (
+        [("triggers", f"ALTER TRIGGER {_q(o)}.{_q(g)} DISABLE", f"ALTER TRIGGER {_q(o)}.{_q(g)} ENABLE")
+         for o, g in triggers]
+        + [("constraints", f"ALTER TABLE {target} DISABLE CONSTRAINT {_q(c)}",
+            f"ALTER TABLE {target} ENABLE CONSTRAINT {_q(c)}") for (c,) in fks]
+        + [("indexes", f"ALTER INDEX {_q(o)}.{_q(i)} UNUSABLE", rebuild(o, i)) for o, i, _ in indexes]
+    )
+
+
+def _plan_sqlite(conn, schema: str, table: str, *, unlogged: bool, parallel: int) -> List[tuple]:
+    # 로컬 벤치마크/시험용: FK는 접속별 PRAGMA라 건드리지 않음, 로깅 개념 없음
+    master = f"{_q(schema)}.sqlite_master" if schema else "sqlite_master"
+    rows = list(conn.execute(
+        text(f"SELECT type, name, sql FROM {master} WHERE tbl_name = :t AND type IN ('index', 'trigger') "
+             "AND sql IS NOT NULL AND sql NOT LIKE 'CREATE UNIQUE%'"),
+        {"t": table},
+    ))
+    prefix = f"{_q(schema)}." if schema else ""
+    indexes = [(n, sql) for typ, n, sql in rows if typ == "index"]
+    triggers = [(n, sql) for typ, n, sql in rows if typ == "trigger"]
+    return (
+        [("triggers", f"DROP TRIGGER {prefix}{_q(n)}", sql) for n, sql in triggers]
+        + [("indexes", f"DROP INDEX {prefix}{_q(n)}", [sql]) for n, sql in indexes]
+    )
+
+
+_PLANNERS = {"postgresql": _plan_postgresql, "oracle": _plan_oracle, "sqlite": _plan_sqlite}
+
+
+def plan_bulk_load(engine: Engine, schema: str, table: str, *, unlogged: bool = False, parallel: int = 1) -> List[tuple] | None:
+    """
+    카탈로그를 읽어 준비 순서대로 [(단계, 준비 DDL, 복구 항목)]을 만듭니다. (지원하지 않는 DB면 None)
+    - 단계: RESTORE_ORDER 중 하나. "indexes"의 복구 항목은 같은 커넥션에서 차례로 실행할 DDL 목록
+    """
+    planner = _PLANNERS.get((engine.dialect.name or "").lower())
+    if planner is None:
+        return None
+    with engine.connect() as conn:
+        return planner(conn, schema, table, unlogged=unlogged, parallel=max(1, parallel))
+
+
+def _run_ddl(engine: Engine, statements: Iterable[str]) -> None:
+    with engine.begin() as conn:
+        for sql in statements:
+            conn.exec_driver_sql(sql)
+
+
+def restore(engine: Engine, steps: Dict, *, workers: int = 2) -> tuple:
+    """
+    RESTORE_ORDER 순서로 복구 DDL을 실행합니다. 실패한 문장이 있어도 나머지는 계속 시도합니다.
+    - 인덱스는 workers개 커넥션에서 동시에 재생성
+    - 반환: (남은 단계 dict — 실패한 것만, 인덱스 재생성 초, 그 외 DDL 초, 오류 메시지 목록)
+    """
+    left: Dict[str, list] = {}
+    errors: List[str] = []
+    rebuild_s = ddl_s = 0.0
+    for step in RESTORE_ORDER:
+        items = steps.get(step) or []
+        if not items:
+            continue
+        t0 = time.perf_counter()
+        failed = []
+        if step == "indexes":
+            def _one(stmts):
+                try:
+                    _run_ddl(engine, stmts)
+                    return None
+                except Exception as e:
+                    return stmts, f"{stmts[0]}: {e}"
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(items)))) as pool:
+                for res in pool.map(_one, items):
+                    if res:
+                        failed.append(res[0])
+                        errors.append(res[1])
+            rebuild_s += time.perf_counter() - t0
+        else:
+            for sql in items:
+                try:
+                    _run_ddl(engine, [sql])
+                except Exception as e:
+                    failed.append(sql)
+                    errors.append(f"{sql}: {e}")
+            ddl_s += time.perf_counter() - t0
+        if failed:
+            left[step] = failed
+    return left, rebuild_s, ddl_s, errors
+
+
+def restore_steps(items: Iterable[tuple]) -> Dict[str, list]:
+    """준비를 마친 항목들의 복구 DDL을 단계별로 모읍니다. (상태 파일에 JSON으로 저장)"""
+    steps: Dict[str, list] = {}
+    for step, _, undo in items:
+        steps.setdefault(step, []).append(undo)
+    return steps
+
+
+def _summary(steps: Dict) -> str:
+    return (f"인덱스 {len(steps.get('indexes') or [])}개, FK {len(steps.get('constraints') or [])}개, "
+            f"트리거 {len(steps.get('triggers') or [])}개"
+            + (", 로깅" if steps.get("logging") else ""))
+
+
+def _restore_events(engine: Engine, label: str, steps: Dict, workers: int,
+                    on_left: Callable[[Dict], None] | None) -> List[Dict]:
+    left, rebuild_s, ddl_s, errors = restore(engine, steps, workers=workers)
+    if on_left:
+        on_left(left)
+    events = [{"type": "log", "message": (
+        f"[벌크] {label}: 복구 완료 — 인덱스 재생성 {rebuild_s:.2f}s (동시 {workers}), "
+        f"제약/트리거/로깅 DDL {ddl_s:.2f}s"
+    )}]
+    for msg in errors:
+        events.append({"type": "log", "message": f"[경고] {label} 복구 실패: {msg}"})
+    if left:
+        events.append({"type": "log", "message": (
+            f"[경고] {label}: 복구하지 못한 항목({_summary(left)})은 상태 파일에 남겨 다음 실행 때 다시 시도합니다."
+        )})
+    return events
+
+
+def bulk_load_stream(
+    engine: Engine,
+    schema: str,
+    table: str,
+    stream: Callable[[], Iterable[Dict]],
+    *,
+    unlogged: bool = False,
+    rebuild_workers: int = 2,
+    save_pending: Callable[[Dict | None], None] | None = None,
+) -> Generator[Dict, None, None]:
+    """
+    stream() 이벤트를 그대로 내보내되, 앞뒤로 벌크 적재 준비/복구를 수행합니다.
+    - 복구는 적재가 실패하거나(예외) 중단돼도 실행됩니다. 예외는 복구 로그를 내보낸 뒤 다시 올립니다.
+    - save_pending(steps): 준비 전 복구 DDL 저장, 복구 후 남은 항목(없으면 None) 저장 — StateStore 연동
+    - DDL(준비·복구)과 인덱스 재생성 시간은 log 이벤트로 따로 보고합니다.
+    """
+    label = f"{schema}.{table}"
+    if unlogged and (engine.dialect.name or "").lower() == "oracle":
+        yield {"type": "log", "message": (
+            f"[주의] {label}: Oracle NOLOGGING은 direct-path 적재에만 적용되어 배열 INSERT의 redo를 줄이지 못하므로 "
+            "bulk_unlogged를 무시합니다."
+        )}
+    plan = plan_bulk_load(engine, schema, table, unlogged=unlogged, parallel=rebuild_workers)
+    if plan is None:
+        yield {"type": "log", "message": f"[벌크] {engine.dialect.name}는 벌크 적재 모드를 지원하지 않아 일반 적재합니다."}
+        yield from stream()
+        return
+    if not plan:
+        yield {"type": "log", "message": f"[벌크] {label}: 비활성화할 인덱스/제약/트리거가 없습니다."}
+        yield from stream()
+        return
+
+    def on_left(left: Dict) -> None:
+        if save_pending:
+            save_pending(left or None)
+
+    # 실행 전에 전체 복구 목록을 저장 (DDL 도중 프로세스가 죽는 경우 대비)
+    if save_pending:
+        save_pending(restore_steps(plan))
+    t0 = time.perf_counter()
+    done = 0
+    try:
+        for _, sql, _ in plan:
+            _run_ddl(engine, [sql])
+            done += 1
+    except Exception as e:
+        # 적용된 항목만 되돌림
+        for ev in _restore_events(engine, label, restore_steps(plan[:done]), rebuild_workers, on_left):
+            yield ev
+        raise RuntimeError(f"벌크 적재 준비 실패 ({done}/{len(plan)}): {e}") from e
+    steps = restore_steps(plan)
+    prepare_s = time.perf_counter() - t0
+
+    try:
+        yield {"type": "log", "message": f"[벌크] {label}: {_summary(steps)} 비활성화 (DDL {prepare_s:.2f}s)"}
+        yield from stream()
+    except GeneratorExit:
+        # 소비 측이 스트림을 닫음: 이벤트는 내보낼 수 없으므로 복구만 수행
+        restore_left, *_ = restore(engine, steps, workers=rebuild_workers)
+        on_left(restore_left)
+        raise
+    except BaseException:
+        for ev in _restore_events(engine, label, steps, rebuild_workers, on_left):
+            yield ev
+        raise
+    yield from _restore_events(engine, label, steps, rebuild_workers, on_left)
+
+
+def restore_pending(engine: Engine, pending: Dict[str, Dict], *, workers: int = 2,
+                    save_pending: Callable[[str, Dict | None], None] | None = None) -> List[Dict]:
+    """이전 실행에서 남은 복구 항목({"SCHEMA.TABLE": 단계 dict})을 실행하고 log 이벤트 목록을 돌려줍니다."""
+    events = []
+    for label, steps in pending.items():
+        events.append({"type": "log", "message": f"[벌크] {label}: 이전 실행에서 복구되지 않은 {_summary(steps)}를 복구합니다."})
+        events += _restore_events(
+            engine, label, steps, workers,
+            (lambda left, key=label: save_pending(key, left or None)) if save_pending else None,
+        )
+    return events
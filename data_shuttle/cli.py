@@ -0,0 +1,279 @@
+"""
+GUI 없이 프리셋을 실행하는 명령행 진입점 (PyQt 불필요 — cron/스케줄러, 헤드리스 서버용)
+- migrate: connection_1 → connection_2 마이그레이션 (GUI와 같은 options/체크포인트/워터마크/거부 파일)
+- export : Origin 조회 결과를 폴더에 CSV / Parquet / Arrow로 내보내기
+- 진행 상황은 stdout, 에러 행은 stderr로 출력하고, 끝나면 JSON 실행 요약을 기록합니다.
+
+예)
+  python -m data_shuttle migrate --preset data/data_shuttle_preset.txt
+  python -m data_shuttle export --preset data/data_shuttle_preset.txt --out ./export --summary -
+
+종료 코드: 0 성공 / 1 실패(테이블 실패·중단 포함) / 2 인자·프리셋 오류 / 3 완료했으나 거부된 행 있음
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Tuple
+from data_shuttle import utils
+from data_shuttle.engines import engine_registry
+from data_shuttle.fileio import COMPRESSION_SUFFIX, normalize_compression
+from data_shuttle.jobs import MigrationJob
+from data_shuttle.metrics import open_metrics_sink
+from data_shuttle.state import state_path_for_preset
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_ROW_ERRORS = 3
+
+
+def load_preset(path: str) -> dict:
+    """설정 내보내기로 저장한 프리셋(JSON, BOM 허용)을 읽고 필수 항목을 확인합니다."""
+    with open(path, "r", encoding="utf-8-sig") as f:
+        data = json.load(f)
+    if not isinstance(data.get("settings"), dict):
+        raise ValueError("프리셋에 settings 객체가 없습니다.")
+    if not isinstance(data.get("options", {}), dict):
+        raise ValueError("프리셋 options는 객체여야 합니다.")
+    return data
+
+
+def _origin_scope(args, preset: dict) -> Tuple[str, List[str]]:
+    """--tables/프리셋 origin에서 (schema, 테이블 목록)을 구합니다. 둘 중 하나라도 비면 ValueError."""
+    origin = preset.get("origin", {})
+    schema = origin.get("schema", "")
+    tables = args.tables or origin.get("tables", "")
+    if isinstance(tables, list):
+        tables = ",".join(tables)
+    names = [t.strip() for t in tables.split(",") if t.strip()]
+    if not schema or not names:
+        raise ValueError("Origin의 schema와 tables는 필수입니다.")
+    return schema, names
+
+
+def _export_format(args, options: dict) -> str:
+    file_format = (args.format or str(options.get("export_format", "csv"))).lower()
+    if file_format not in ("csv", "parquet", "arrow"):
+        raise ValueError(f"지원하지 않는 export_format: {file_format} (csv / parquet / arrow)")
+    return file_format
+
+
+def _check_usage(args, preset: dict) -> None:
+    """접속 전에 실행 범위를 확인합니다 (사용법 오류는 EXIT_USAGE로 끝나야 하므로)."""
+    _origin_scope(args, preset)
+    if args.command == "export":
+        _export_format(args, preset.get("options") or {})
+
+
+def _now() -> str:
+    return datetime.now().strftime("%H:%M:%S")
+
+
+class CliJob(MigrationJob):
+    """로그/진행은 stdout, 에러 행은 stderr로 출력하는 MigrationJob"""
+
+    def __init__(self, *args, progress_seconds: float = 5.0, quiet: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.quiet = quiet
+        self.error_count = 0
+        self._progress_seconds = progress_seconds
+        self._last_progress = 0.0
+        self._pending_inserted = None
+
+    def _log(self, message: str) -> None:
+        if not self.quiet:
+            print(f"{_now()} {message}", flush=True)
+
+    def _on_progress(self, inserted_total: int) -> None:
+        self._pending_inserted = inserted_total
+        self._flush()
+
+    def _on_error(self, row_index: int, message: str) -> None:
+        self.error_count += 1
+        if not self.quiet:
+            print(f"{_now()} [에러] row {row_index if row_index >= 0 else '?'}: {message}", file=sys.stderr, flush=True)
+
+    def _flush(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if self._pending_inserted is None or (not force and now - self._last_progress < self._progress_seconds):
+            return
+        self._last_progress = now
+        total, kind = self._source_total()
+        if kind == "unknown":
+            suffix = "건"
+        else:
+            suffix = f"/{'약 ' if kind == 'estimate' else ''}{total}건"
+        self._log(f"[진행] 누적 {self._pending_inserted}{suffix}")
+        self._pending_inserted = None
+
+
+def _run_migrate(args, preset: dict, summary: Dict) -> int:
+    origin = preset.get("origin", {})
+    dest = preset.get("destination", {})
+    options = preset.get("options") or {}
+    src_schema, names = _origin_scope(args, preset)
+    src_tables = ",".join(names)
+
+    job = CliJob(
+        preset["settings"], src_schema, src_tables,
+        args.where if args.where is not None else origin.get("where", ""),
+        dst_schema=dest.get("schema") or src_schema,
+        dst_tables=dest.get("tables", "") if not args.tables else "",
+        chunk_size=int(options.get("chunk_size", 10_000)),
+        options=options, resume=args.resume,
+        state_path=state_path_for_preset(args.preset),
+        progress_seconds=args.progress_seconds, quiet=args.quiet,
+    )
+    try:
+        total = job.execute()
+    finally:
+        source_total, kind = job._source_total()
+        summary.update(
+            rows=sum(r["rows"] for r in job.results),
+            errors=job.error_count,
+            source_rows=source_total if kind != "unknown" else None,
+            source_rows_kind=kind,
+            tables=job.results,
+        )
+    job._log(f"[완료] 총 {total}건 적재, 에러 {job.error_count}건")
+    if any(r["status"] != "ok" for r in job.results):
+        return EXIT_FAILED
+    return EXIT_ROW_ERRORS if job.error_count else EXIT_OK
+
+
+def _run_export(args, preset: dict, summary: Dict) -> int:
+    origin = preset.get("origin", {})
+    options = preset.get("options") or {}
+    schema, tables = _origin_scope(args, preset)
+    where = args.where if args.where is not None else origin.get("where", "")
+
+    file_format = _export_format(args, options)
+    export_kwargs = dict(
+        chunk_size=int(options.get("chunk_size", 10_000)),
+        lob_chunk_rows=int(options.get("lob_chunk_rows", 1_000)),
+    )
+    if file_format == "csv":
+        compression = normalize_compression(
+            args.compression if args.compression is not None else options.get("export_compression")
+        )
+        export_kwargs["part_max_bytes"] = int(float(options.get("export_part_mb", 0) or 0) * 1024 * 1024)
+        export_kwargs["lob_fetch"] = options.get("lob_fetch", "inline")
+    else:
+        compression = str(args.compression or options.get("export_compression") or "zstd").lower()
+
+    os.makedirs(args.out, exist_ok=True)
+    engine = engine_registry.get(preset["settings"].get("connection_1", {}))
+    # options.metrics_file: 상대 경로는 프리셋 폴더 기준 (마이그레이션과 같은 규칙)
+    sink = None
+    if options.get("metrics_file"):
+        path = options["metrics_file"]
+        if not os.path.isabs(path):
+            path = os.path.join(os.path.dirname(os.path.abspath(args.preset)), path)
+        sink = open_metrics_sink(path)
+        export_kwargs["on_metrics"] = sink.write
+    started = time.monotonic()
+    results: List[Dict] = []
+    summary["tables"] = results
+    try:
+        for t, n, files, err in utils.export_tables_to_csv(
+            engine, schema, tables, where, args.out,
+            max_workers=int(options.get("export_workers", 4) or 1),
+            compression=compression, file_format=file_format, **export_kwargs,
+        ):
+            results.append({
+                "source": f"{schema}.{t}", "status": "failed" if err else "ok", "rows": n, "files": files,
+                "seconds": round(time.monotonic() - started, 3), "error": err,
+            })
+            if err:
+                print(f"{_now()} [오류] {t} 내보내기 실패: {err}", file=sys.stderr, flush=True)
+            elif not args.quiet:
+                print(f"{_now()} [내보내기] {t}: {n}건 → {', '.join(files)}", flush=True)
+    finally:
+        if sink:
+            sink.close()
+    summary["rows"] = sum(r["rows"] for r in results)
+    summary["format"] = file_format + (COMPRESSION_SUFFIX.get(compression, "") if file_format == "csv" else "")
+    return EXIT_FAILED if any(r["error"] for r in results) else EXIT_OK
+
+
+def _write_summary(path: str, summary: Dict) -> None:
+    text = json.dumps(summary, ensure_ascii=False, indent=2, default=str)
+    if path == "-":
+        print(text, flush=True)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text + "\n")
+
+
+def main(argv: List[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m data_shuttle", description="DataShuttle headless runner")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--preset", required=True, help="설정 내보내기로 저장한 프리셋 파일")
+    common.add_argument("--tables", help="콤마 구분 Origin 테이블 (기본: 프리셋 origin.tables)")
+    common.add_argument("--where", help="Origin WHERE 조건 (기본: 프리셋 origin.where)")
+    common.add_argument("--summary", help="JSON 실행 요약 경로, '-'는 stdout (기본: <프리셋>.summary.json)")
+    common.add_argument("--quiet", action="store_true", help="진행 로그 생략 (오류와 요약만)")
+
+    mig = sub.add_parser("migrate", parents=[common], help="connection_1 → connection_2 마이그레이션")
+    mig.add_argument("--resume", action="store_true", help="저장된 체크포인트부터 이어하기")
+    mig.add_argument("--progress-seconds", type=float, default=5.0, help="진행 로그 간격(초)")
+
+    exp = sub.add_parser("export", parents=[common], help="Origin → 파일 내보내기")
+    exp.add_argument("--out", default=".", help="출력 폴더")
+    exp.add_argument("--format", choices=("csv", "parquet", "arrow"), help="기본: options.export_format")
+    exp.add_argument("--compression", help="CSV: gzip/zstd, Parquet/Arrow: zstd/snappy/lz4 ...")
+
+    args = ap.parse_args(argv)
+    summary_path = args.summary or os.path.splitext(args.preset)[0] + ".summary.json"
+    summary: Dict = {
+        "command": args.command,
+        "preset": os.path.abspath(args.preset),
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "status": "failed",
+        "rows": 0,
+        "errors": 0,
+        "tables": [],
+        "error": None,
+    }
+    started = time.monotonic()
+    try:
+        preset = load_preset(args.preset)
+    except (OSError, ValueError) as e:
+        print(f"[오류] 프리셋을 읽지 못했습니다: {e}", file=sys.stderr)
+        return EXIT_USAGE
+    try:
+        _check_usage(args, preset)
+    except ValueError as e:
+        print(f"[오류] {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    try:
+        run = _run_migrate if args.command == "migrate" else _run_export
+        code = run(args, preset, summary)
+    except Exception as e:
+        print(f"[오류] 실행 실패: {e}", file=sys.stderr, flush=True)
+        summary["error"] = str(e)
+        code = EXIT_FAILED
+    finally:
+        engine_registry.dispose_all()
+
+    summary.update(
+        status={EXIT_OK: "ok", EXIT_ROW_ERRORS: "completed_with_errors"}.get(code, "failed"),
+        exit_code=code,
+        finished_at=datetime.now().isoformat(timespec="seconds"),
+        seconds=round(time.monotonic() - started, 3),
+    )
+    try:
+        _write_summary(summary_path, summary)
+    except OSError as e:
+        print(f"[경고] 실행 요약 기록 실패: {e}", file=sys.stderr)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+"""
+Origin 조회 결과를 Parquet / Arrow IPC(Feather v2) 파일로 내보냅니다.
+- fetchmany 청크 1개 → 타입이 있는 RecordBatch 1개 → Parquet 행 그룹 1개 (메모리는 청크 1개 분량)
+- 컬럼 타입은 소스 테이블 리플렉션 결과(NUMBER 정밀도, DATE/TIMESTAMP, CLOB 등)에서 정합니다.
+- pyarrow가 필요합니다: pip install pyarrow
+
+헤드리스 실행은 CLI를 사용합니다. (python -m data_shuttle.columnar는 같은 명령의 별칭)
+  python -m data_shuttle export --preset data_shuttle_preset.txt --format parquet --out ./export
+"""
+import sys
+from datetime import date, datetime
+from decimal import Decimal
+from functools import partial
+from typing import Callable, Dict, List
+from sqlalchemy import inspect, types as sqltypes
+from sqlalchemy.engine import Engine
+from data_shuttle import converters, utils
+from data_shuttle.metadata import metadata_cache
+from data_shuttle.metrics import LoadMeter, timed_chunks
+
+# 형식별 확장자
+COLUMNAR_SUFFIX = {"parquet": ".parquet", "arrow": ".arrow"}
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError("Parquet/Arrow 내보내기에는 pyarrow 패키지가 필요합니다 → pip install pyarrow")
+    return pyarrow
+
+
+def _arrow_type(pa, col_type):
+    """SQLAlchemy 리플렉션 타입 → Arrow 타입 (모르는 타입은 문자열)"""
+    name = type(col_type).__name__.upper()
+    if isinstance(col_type, sqltypes.Boolean):
+        return pa.bool_()
+    if isinstance(col_type, sqltypes.Integer):
+        return pa.int64()
+    if isinstance(col_type, sqltypes.Float) or name in ("BINARY_DOUBLE", "BINARY_FLOAT", "DOUBLE_PRECISION", "REAL"):
+        return pa.float64()
+    if isinstance(col_type, sqltypes.Numeric):
+        p, s = col_type.precision, col_type.scale
+        if p is None:
+            # 정밀도 없는 NUMBER: 자릿수·스케일을 알 수 없어 float64(2^53 초과 정수 손실)나
+            # 고정 스케일 decimal은 값이 깨질 수 있으므로 무손실 문자열로 보존
+            return pa.string()
+        if not s and p <= 18:
+            return pa.int64()
+        return pa.decimal128(min(p, 38), s or 0)
+    if isinstance(col_type, sqltypes.DateTime):
+        # Oracle DATE는 DateTime 계열(시각 포함)이므로 timestamp
+        return pa.timestamp("us", tz="UTC") if getattr(col_type, "timezone", False) else pa.timestamp("us")
+    if isinstance(col_type, sqltypes.Date):
+        return pa.date32()
+    if isinstance(col_type, sqltypes.Time):
+        return pa.time64("us")
+    if isinstance(col_type, sqltypes.Interval):
+        return pa.duration("us")
+    if isinstance(col_type, sqltypes.LargeBinary) or name in ("BLOB", "RAW", "BYTEA", "LONG RAW"):
+        return pa.large_binary()
+    if isinstance(col_type, sqltypes.Text) or name in ("CLOB", "NCLOB", "LONG"):
+        return pa.large_string()
+    return pa.string()
+
+
+def arrow_schema(engine: Engine, schema: str, table: str, cols: List[str]):
+    """cols 순서의 Arrow 스키마 (접속·테이블별로 캐시)"""
+    pa = _pyarrow()
+
+    def build():
+        reflected: Dict[str, object] = {
+            str(c["name"]).lower(): c["type"] for c in inspect(engine).get_columns(table, schema=schema)
+        }
+        return pa.schema([
+            pa.field(c, _arrow_type(pa, reflected[c]) if c in reflected else pa.string()) for c in cols
+        ])
+
+    key = (*metadata_cache.statement_key(engine, schema, table), "arrow_schema", tuple(cols))
+    return metadata_cache.statement(key, build)
+
+
+def _column_values(pa, values: tuple, field):
+    """
+    드라이버 값을 필드 타입에 맞춥니다.
+    - 문자열 컬럼의 비문자 값은 str로 (LOB 로케이터는 조회 단계의 converters가 이미 읽음)
+    - 불리언 컬럼의 0/1 → bool, decimal 컬럼의 float(oracledb 기본 NUMBER 반환) → Decimal
+    - 날짜/시각 컬럼의 ISO 문자열(SQLite 등) → date/datetime
+    """
+    t = field.type
+    if pa.types.is_string(t) or pa.types.is_large_string(t):
+        return tuple(v if v is None or isinstance(v, str) else str(v) for v in values)
+    if pa.types.is_boolean(t):
+        return tuple(v if v is None or isinstance(v, bool) else bool(v) for v in values)
+    if pa.types.is_decimal(t):
+        return tuple(Decimal(repr(v)) if isinstance(v, float) else v for v in values)
+    if pa.types.is_timestamp(t):
+        return tuple(datetime.fromisoformat(v) if isinstance(v, str) else v for v in values)
+    if pa.types.is_date(t):
+        return tuple(date.fromisoformat(v[:10]) if isinstance(v, str) else v for v in values)
+    return values
+
+
+def _record_batch(pa, rows: List[tuple], arrow_schema_):
+    columns = list(zip(*rows))
+    arrays = [
+        pa.array(_column_values(pa, values, field), type=field.type)
+        for values, field in zip(columns, arrow_schema_)
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=arrow_schema_)
+
+
+def export_origin_to_columnar(
+    engine: Engine,
+    schema: str,
+    table: str,
+    where_text: str,
+    file_path: str,
+    file_format: str = "parquet",
+    chunk_size: int = 10_000,
+    compression: str | None = "zstd",
+    files: List[str] | None = None,
+    on_metrics: Callable[[Dict], None] | None = None,
+    lob_chunk_rows: int = 1_000,
+) -> int:
+    """
+    Origin 조회 결과를 청크 단위 RecordBatch로 변환해 Parquet(행 그룹) / Arrow IPC 파일에 이어 씁니다.
+    - compression: Parquet 코덱(zstd/snappy/gzip/None), Arrow IPC는 zstd/lz4/None
+    - on_metrics: 주면 청크마다/끝에 metrics 이벤트로 호출 (fetch / transform=RecordBatch 변환 / write)
+    - LOB 컬럼은 fetch 왕복 안에서 인라인으로 받고, 행 그룹 크기는 lob_chunk_rows로 제한합니다.
+    - 반환: 내보낸 총 행 수
+    """
+    pa = _pyarrow()
+    cols = utils._get_columns(engine, schema, table)
+    if not cols:
+        return 0
+    schema_ = arrow_schema(engine, schema, table, cols)
+
+    where_sql = f" WHERE {where_text} " if where_text.strip() else ""
+    if (engine.dialect.name or "").lower() == "oracle":
+        select_cols = ", ".join(f'{c.upper()} AS "{c}"' for c in cols)
+    else:
+        select_cols = ", ".join(f'"{c}" AS "{c}"' for c in cols)
+    select_sql = f"SELECT {select_cols} FROM {schema}.{table}{where_sql}"
+
+    if file_format == "parquet":
+        writer = pa.parquet.ParquetWriter(file_path, schema_, compression=compression or "none")
+    elif file_format == "arrow":
+        options = pa.ipc.IpcWriteOptions(compression=compression if compression in ("zstd", "lz4") else None)
+        writer = pa.ipc.new_file(file_path, schema_, options=options)
+    else:
+        raise ValueError(f"지원하지 않는 형식: {file_format}")
+    if files is not None:
+        files.append(file_path)
+
+    out_count = 0
+    meter = LoadMeter(file_path, f"{schema}.{table}".upper(), fetch_inline=True) if on_metrics else None
+    kinds = converters.column_kinds(engine, schema, table, cols)
+    chunks = partial(
+        utils._fetch_chunks, engine, select_sql, converters.lob_chunk_size(chunk_size, kinds, lob_chunk_rows),
+        output_handler=utils._lob_handler(engine, kinds, "inline"),
+        convert=converters.row_converter(kinds, "load"),
+    )
+    try:
+        for item in (timed_chunks(chunks) if meter else chunks()):
+            if meter:
+                rows, fetch_s = item
+                meter.begin(len(rows), utils._estimate_row_bytes(rows) * len(rows), fetch_s)
+            else:
+                rows = item
+            batch = _record_batch(pa, rows, schema_)
+            if meter:
+                meter.lap("transform")
+            writer.write_batch(batch)
+            out_count += len(rows)
+            if meter:
+                meter.count(written=len(rows))
+                meter.lap("write")
+                on_metrics(meter.end())
+                meter.skip()
+    finally:
+        writer.close()
+    if meter:
+        on_metrics(meter.summary())
+    return out_count
+
+
+def main(argv: List[str] | None = None) -> int:
+    """`python -m data_shuttle export`의 별칭입니다. 인자는 그대로 넘기고 --format이 없으면 parquet"""
+    from data_shuttle import cli
+
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not any(a == "--format" or a.startswith("--format=") for a in argv):
+        argv += ["--format", "parquet"]
+    return cli.main(["export", *argv])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
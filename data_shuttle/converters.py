@@ -0,0 +1,205 @@
+"""
+소스 컬럼 타입별 값 변환기 (테이블·대상마다 1회 만들어 metadata_cache에 보관)
+- 컬럼 분류: 리플렉션 타입 문자열 → "clob" / "blob"(Oracle 로케이터 LOB) / "binary"(값이 행에 바로 오는 바이너리) / None
+  PostgreSQL·SQLite TEXT/BYTEA/BLOB 같은 인라인 타입은 LOB로 보지 않습니다. (청크 상한·로케이터 변환 없음)
+- Oracle LOB 인라인 조회: outputtypehandler로 CLOB/NCLOB/BLOB를 문자열/바이트로 바로 받아
+  행마다 로케이터 read() 왕복이 생기지 않게 합니다. (lob_fetch="inline", 기본)
+- lob_fetch="stream": 로케이터를 그대로 받아 lob_piece_bytes 조각으로 읽습니다.
+  CSV 내보내기는 조각을 합치지 않고 파일에 바로 씁니다. (행 하나의 큰 LOB도 메모리에 전부 올리지 않음)
+- 대상별 행 변환: "load"(드라이버 바인드) / "csv"(바이너리 → base64, importer가 되돌림)
+- 목적지 바인드 변환: 위치 바인드 executemany는 SQLAlchemy bind processor를 거치지 않으므로
+  드라이버가 받지 못하는 값만 바꿉니다. (bind_converter)
+"""
+import base64
+from decimal import Decimal
+from typing import Callable, Dict, List, Sequence
+from sqlalchemy.engine import Engine
+from data_shuttle.metadata import metadata_cache
+
+LOB_FETCH_MODES = ("inline", "stream")
+
+# Oracle에서 로케이터로 조회되는 타입만 LOB
+_LOCATOR_KINDS = {"CLOB": "clob", "NCLOB": "clob", "BLOB": "blob"}
+# CSV에서 base64로 쓰는 인라인 바이너리 (다른 DB의 BLOB 포함)
+_BINARY_TYPES = {"BLOB", "BYTEA", "LONG RAW", "RAW", "VARBINARY", "BINARY"}
+
+# base64 조각이 이어 붙어도 깨지지 않도록 3바이트 배수
+DEFAULT_PIECE_BYTES = 3 * (1 << 20)
+
+
+def column_kind(type_name: str, locators: bool = True) -> str | None:
+    """타입 문자열 → "clob" | "blob" | "binary" | None (일반 스칼라). locators=False면 LOB 분류 없음"""
+    name = str(type_name or "").upper().split("(")[0].strip()
+    if locators and name in _LOCATOR_KINDS:
+        return _LOCATOR_KINDS[name]
+    return "binary" if name in _BINARY_TYPES else None
+
+
+def column_kinds(engine: Engine, schema: str, table: str, cols: Sequence[str]) -> List[str | None]:
+    """cols 순서의 컬럼 분류 (접속·테이블별로 캐시). LOB 로케이터는 Oracle 소스에만 있습니다."""
+    locators = (engine.dialect.name or "").lower() == "oracle"
+
+    def build():
+        types = metadata_cache.column_types(engine, schema, table)
+        return [column_kind(types.get(c, ""), locators) for c in cols]
+
+    key = (*metadata_cache.statement_key(engine, schema, table), "column_kinds", tuple(cols))
+    return metadata_cache.statement(key, build)
+
+
+def has_lobs(kinds: Sequence[str | None]) -> bool:
+    return any(k in ("clob", "blob") for k in kinds)
+
+
+def is_locator(v) -> bool:
+    """드라이버 LOB 로케이터(oracledb.LOB 등) 여부"""
+    return hasattr(v, "read") and not isinstance(v, (str, bytes, bytearray, memoryview))
+
+
+def iter_lob(v, piece_bytes: int = DEFAULT_PIECE_BYTES):
+    """로케이터를 piece_bytes(CLOB은 문자 수) 조각으로 읽어 내보냅니다. (oracledb LOB.read는 1부터)"""
+    offset = 1
+    while True:
+        piece = v.read(offset, piece_bytes)
+        if not piece:
+            return
+        yield piece
+        if len(piece) < piece_bytes:
+            return
+        offset += len(piece)
+
+
+def read_lob(v, piece_bytes: int = DEFAULT_PIECE_BYTES):
+    """로케이터 → str/bytes 전체 (그 외 값은 그대로)"""
+    if not is_locator(v):
+        return v
+    pieces = list(iter_lob(v, piece_bytes))
+    if not pieces:
+        return v.read()
+    return pieces[0][:0].join(pieces)
+
+
+def _b64(v):
+    if v is None:
+        return None
+    if is_locator(v):
+        v = read_lob(v)
+    if isinstance(v, (bytes, bytearray, memoryview)):
+        return base64.b64encode(bytes(v)).decode("ascii")
+    return v
+
+
+def _converters(kinds: Sequence[str | None], target: str) -> Dict[int, Callable]:
+    out = {}
+    for i, kind in enumerate(kinds):
+        if target == "csv" and kind in ("blob", "binary"):
+            out[i] = _b64
+        elif kind in ("clob", "blob"):
+            out[i] = read_lob
+    return out
+
+
+def row_converter(
+    kinds: Sequence[str | None], target: str = "load", keep_lobs: bool = False
+) -> Callable[[List[tuple]], List[tuple]] | None:
+    """
+    청크(튜플 리스트) 변환 함수를 1회 만듭니다. 바꿀 컬럼이 없으면 None (추가 비용 없음)
+    - target="load": 남은 LOB 로케이터만 str/bytes로 (인라인 조회면 사실상 그대로 통과)
+    - target="csv": + 바이너리는 base64 문자열
+    - keep_lobs: CLOB/BLOB 컬럼은 건드리지 않음 (write_csv_row가 조각 단위로 기록)
+    """
+    conv = _converters(kinds, target)
+    if keep_lobs:
+        conv = {i: f for i, f in conv.items() if kinds[i] not in ("clob", "blob")}
+    if not conv:
+        return None
+    plan = [conv.get(i) for i in range(len(kinds))]
+
+    def convert(rows: List[tuple]) -> List[tuple]:
+        return [tuple(v if f is None or v is None else f(v) for f, v in zip(plan, r)) for r in rows]
+
+    return convert
+
+
+def _sqlite_binds(rows: List[tuple]) -> List[tuple]:
+    # 행에 Decimal이 없으면 튜플을 새로 만들지 않습니다.
+    return [
+        tuple(str(v) if isinstance(v, Decimal) else v for v in r)
+        if any(isinstance(v, Decimal) for v in r) else r
+        for r in rows
+    ]
+
+
+def bind_converter(engine: Engine) -> Callable[[List[tuple]], List[tuple]] | None:
+    """
+    목적지 드라이버가 바인드하지 못하는 값을 바꾸는 청크 변환 함수 (필요 없으면 None)
+    - SQLite(sqlite3): Decimal → str (정밀도 보존, NUMERIC/REAL 컬럼은 affinity로 숫자 저장)
+    - oracledb / psycopg는 Decimal·날짜를 그대로 받으므로 변환하지 않습니다.
+    """
+    if (engine.dialect.name or "").lower() == "sqlite":
+        return _sqlite_binds
+    return None
+
+
+def oracle_output_handler(kinds: Sequence[str | None]):
+    """
+    Oracle 커서 outputtypehandler: CLOB/NCLOB → LONG(문자열), BLOB → LONG RAW(바이트)로 받아
+    fetch 왕복 안에서 값이 함께 옵니다. (python-oracledb fetch_lobs=False와 같은 효과, 커서 단위)
+    - 커서 메타데이터 기준이라 리플렉션 타입을 모르는 뷰/동의어에도 적용됩니다. (kinds는 참고용)
+    """
+    import oracledb
+
+    mapping = {
+        oracledb.DB_TYPE_CLOB: oracledb.DB_TYPE_LONG,
+        oracledb.DB_TYPE_NCLOB: oracledb.DB_TYPE_LONG_NVARCHAR,
+        oracledb.DB_TYPE_BLOB: oracledb.DB_TYPE_LONG_RAW,
+    }
+
+    def handler(cursor, metadata):
+        target = mapping.get(metadata.type_code)
+        if target is not None:
+            return cursor.var(target, arraysize=cursor.arraysize)
+        return None
+
+    return handler
+
+
+def lob_chunk_size(chunk_size, kinds: Sequence[str | None], lob_chunk_rows: int):
+    """LOB 컬럼이 있는 테이블은 고정 청크 크기를 lob_chunk_rows로 제한 (적응형은 메모리 예산이 제한)"""
+    if callable(chunk_size) or lob_chunk_rows <= 0 or not has_lobs(kinds):
+        return chunk_size
+    return min(int(chunk_size), lob_chunk_rows)
+
+
+def _csv_field(v) -> str:
+    """csv.writer 기본 방언(QUOTE_MINIMAL)과 같은 필드 표기 (바이너리는 base64)"""
+    if v is None:
+        return ""
+    if isinstance(v, (bytes, bytearray, memoryview)):
+        return base64.b64encode(bytes(v)).decode("ascii")
+    s = v if isinstance(v, str) else str(v)
+    if any(ch in s for ch in ',"\r\n'):
+        return '"' + s.replace('"', '""') + '"'
+    return s
+
+
+def write_csv_row(f, row: Sequence, piece_bytes: int = DEFAULT_PIECE_BYTES) -> None:
+    """
+    로케이터가 섞인 행을 CSV 한 줄로 씁니다. LOB는 조각 단위로 읽어 바로 기록
+    (CLOB은 따옴표 이스케이프, BLOB은 base64 — piece_bytes는 3의 배수로 맞춥니다)
+    """
+    piece_bytes = max(3, piece_bytes - piece_bytes % 3)
+    for i, v in enumerate(row):
+        if i:
+            f.write(",")
+        if not is_locator(v):
+            f.write(_csv_field(v))
+            continue
+        f.write('"')
+        for piece in iter_lob(v, piece_bytes):
+            if isinstance(piece, (bytes, bytearray)):
+                f.write(base64.b64encode(piece).decode("ascii"))
+            else:
+                f.write(piece.replace('"', '""'))
+        f.write('"')
+    f.write("\r\n")
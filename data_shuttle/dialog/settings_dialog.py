@@ -24,7 +24,7 @@ class SettingsDialog(QDialog):
         self.setWindowTitle("Settings")
         self.setWindowFlag(Qt.WindowContextHelpButtonHint, False)
         self.setModal(True)
-        self.resize(560, 360)
+        self.resize(560, 420)
         self.settings = settings or {"connection_1": {}, "connection_2": {}}
 
         self.tabs = QTabWidget()
@@ -72,6 +72,9 @@ class SettingsDialog(QDialog):
        
         user = QLineEdit(); user.setPlaceholderText("계정 ID")
         pw = QLineEdit(); pw.setPlaceholderText("비밀번호"); pw.setEchoMode(QLineEdit.Password)
+        # 조회 튜닝: 비우면 자동 (마이그레이션 chunk_size와 같은 크기로 1회 왕복)
+        fetch = QLineEdit(); fetch.setPlaceholderText("자동 (chunk_size) — 드라이버 1회 왕복 행 수")
+        prefetch = QLineEdit(); prefetch.setPlaceholderText("자동 (Fetch 행 수) — Oracle prefetchrows")
 
         lbl_dbtype   = QLabel("DB 타입")
         lbl_proto    = QLabel("프로토콜")
@@ -79,6 +82,8 @@ class SettingsDialog(QDialog):
         lbl_port     = QLabel("Port")
         lbl_user     = QLabel("ID")
         lbl_pw       = QLabel("Password")
+        lbl_fetch    = QLabel("Fetch 행 수")
+        lbl_prefetch = QLabel("Prefetch 행 수")
 
         def _max_label_width(label: QLabel, samples, extra_px: int = 16) -> int:
             fm = QFontMetrics(label.font())
@@ -89,10 +94,11 @@ class SettingsDialog(QDialog):
             label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Preferred)
             label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
             
-        label_samples = ["DB 타입", "프로토콜", "Host", "Port", "SERVICE_NAME/SID", "DB 이름", "ID", "Password"]
+        label_samples = ["DB 타입", "프로토콜", "Host", "Port", "SERVICE_NAME/SID", "DB 이름", "ID", "Password",
+                         "Fetch 행 수", "Prefetch 행 수"]
         common_width = _max_label_width(lbl_dbtype, label_samples)
 
-        for lab in (lbl_dbtype, lbl_proto, lbl_host, lbl_port, svc_label, lbl_user, lbl_pw):
+        for lab in (lbl_dbtype, lbl_proto, lbl_host, lbl_port, svc_label, lbl_user, lbl_pw, lbl_fetch, lbl_prefetch):
             _apply_fixed_label(lab, common_width)
         
         form.addRow(lbl_dbtype, db_type)
@@ -102,6 +108,8 @@ class SettingsDialog(QDialog):
         form.addRow(svc_label, svc)
         form.addRow(lbl_user, user)
         form.addRow(lbl_pw, pw)
+        form.addRow(lbl_fetch, fetch)
+        form.addRow(lbl_prefetch, prefetch)
 
         setattr(self, f"{env_key}_db_type", db_type)
         setattr(self, f"{env_key}_protocol", protocol)
@@ -111,6 +119,8 @@ class SettingsDialog(QDialog):
         setattr(self, f"{env_key}_svc", svc)
         setattr(self, f"{env_key}_user", user)
         setattr(self, f"{env_key}_pw", pw)
+        setattr(self, f"{env_key}_fetch", fetch)
+        setattr(self, f"{env_key}_prefetch", prefetch)
 
         db_type.currentTextChanged.connect(lambda _: self._apply_db_type(env_key))
         return w
@@ -144,6 +154,8 @@ class SettingsDialog(QDialog):
         getattr(self, f"{env_key}_svc").setText(data.get("service_or_db", ""))
         getattr(self, f"{env_key}_user").setText(data.get("user", ""))
         getattr(self, f"{env_key}_pw").setText(data.get("password", ""))
+        getattr(self, f"{env_key}_fetch").setText(str(data.get("fetch_size") or ""))
+        getattr(self, f"{env_key}_prefetch").setText(str(data.get("prefetch_rows") or ""))
 
         self._apply_db_type(env_key)
 
@@ -151,6 +163,8 @@ class SettingsDialog(QDialog):
         dbt = getattr(self, f"{env_key}_db_type").currentText()
         svc_label = getattr(self, f"{env_key}_svc_label")
         svc_edit  = getattr(self, f"{env_key}_svc")
+        # prefetchrows는 python-oracledb 전용
+        getattr(self, f"{env_key}_prefetch").setEnabled(dbt != "PostgreSQL")
 
         if dbt == "PostgreSQL":
             svc_label.setText("DB 이름")
@@ -190,6 +204,8 @@ class SettingsDialog(QDialog):
                 "service_or_db": self.connection_1_svc.text().strip(),
                 "user": self.connection_1_user.text().strip(),
                 "password": self.connection_1_pw.text(),
+                "fetch_size": self._to_int(self.connection_1_fetch.text()),
+                "prefetch_rows": self._to_int(self.connection_1_prefetch.text()),
             },
             "connection_2": {
                 "db_type": self.connection_2_db_type.currentText(),
@@ -199,6 +215,8 @@ class SettingsDialog(QDialog):
                 "service_or_db": self.connection_2_svc.text().strip(),
                 "user": self.connection_2_user.text().strip(),
                 "password": self.connection_2_pw.text(),
+                "fetch_size": self._to_int(self.connection_2_fetch.text()),
+                "prefetch_rows": self._to_int(self.connection_2_prefetch.text()),
             },
         }
     
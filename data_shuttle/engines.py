@@ -0,0 +1,70 @@
+import threading
+from typing import Dict, List, Tuple
+from sqlalchemy.engine import Engine
+from data_shuttle import utils
+
+
+def _config_key(cfg: Dict) -> tuple:
+    """
+    접속 설정 정규화 키 (대소문자·공백·포트 타입 차이는 같은 접속으로 취급)
+    - 풀 크기는 키에 넣지 않습니다. (같은 DB는 풀 하나, 크기는 EngineRegistry.get에서 맞춤)
+    """
+    return (
+        (cfg.get("db_type") or "").strip().lower(),
+        (cfg.get("protocol") or "TCP").strip().upper(),
+        (cfg.get("host") or "").strip().lower(),
+        str(cfg.get("port") or "").strip(),
+        (cfg.get("service_or_db") or "").strip(),
+        (cfg.get("user") or "").strip(),
+        cfg.get("password") or "",
+        (cfg.get("url") or "").strip(),
+        tuple(sorted(utils.fetch_tuning(cfg).items())),
+    )
+
+
+class EngineRegistry:
+    """
+    접속 설정별 Engine(커넥션 풀) 공유
+    - 마이그레이션 워커, CSV 내보내기, 병렬 테이블/조각 작업이 같은 풀의 커넥션을 재사용합니다.
+    - 설정이 바뀌거나 앱을 닫을 때 dispose_all()로 풀을 정리합니다.
+    - 접속마다 풀은 하나이며, 더 큰 풀 크기를 요청하면 그 크기로 한 번 다시 만듭니다. (작은 요청은 기존 풀 사용)
+      이전 Engine은 사용 중인 작업이 있을 수 있어 바로 닫지 않고 dispose_all()에서 정리합니다.
+    """
+
+    def __init__(self, pool_size: int = 5, max_overflow: int = 10):
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self._lock = threading.Lock()
+        # 접속 키 → (Engine, pool_size, max_overflow)
+        self._engines: Dict[tuple, Tuple[Engine, int, int]] = {}
+        self._retired: List[Engine] = []
+
+    def get(self, cfg: Dict, pool_size: int | None = None, max_overflow: int | None = None) -> Engine:
+        """같은 설정이면 기존 Engine을 돌려주고, 요청한 풀이 더 크면 큰 크기로 다시 만들어 등록합니다."""
+        size = int(pool_size or self.pool_size)
+        overflow = int(self.max_overflow if max_overflow is None else max_overflow)
+        key = _config_key(cfg)
+        with self._lock:
+            hit = self._engines.get(key)
+            if hit is not None:
+                engine, cur_size, cur_overflow = hit
+                if size <= cur_size and overflow <= cur_overflow:
+                    return engine
+                self._retired.append(engine)
+                size, overflow = max(size, cur_size), max(overflow, cur_overflow)
+            engine = utils.create_engine_from_config(cfg, pool_size=size, max_overflow=overflow)
+            self._engines[key] = (engine, size, overflow)
+            return engine
+
+    def dispose_all(self) -> int:
+        """등록된(교체된 것 포함) 모든 풀을 닫고 비웁니다. 반환: 정리한 Engine 수"""
+        with self._lock:
+            engines = [e for e, _, _ in self._engines.values()] + self._retired
+            self._engines, self._retired = {}, []
+        for engine in engines:
+            engine.dispose()
+        return len(engines)
+
+
+# 프로세스 공용 레지스트리
+engine_registry = EngineRegistry()
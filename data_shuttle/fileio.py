@@ -0,0 +1,101 @@
+import gzip
+import io
+import os
+
+# 압축 방식별 확장자
+COMPRESSION_SUFFIX = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError("zstd 압축에는 zstandard 패키지가 필요합니다 → pip install zstandard")
+    return zstandard
+
+
+def normalize_compression(value) -> str | None:
+    """options 값("gz", "gzip", "zst", "zstd", "", None)을 None | "gzip" | "zstd"로 정리"""
+    v = (value or "").strip().lower()
+    if v in ("", "none"):
+        return None
+    if v in ("gz", "gzip"):
+        return "gzip"
+    if v in ("zst", "zstd"):
+        return "zstd"
+    raise ValueError(f"지원하지 않는 압축 방식: {value}")
+
+
+def compression_from_path(path: str) -> str | None:
+    lower = path.lower()
+    if lower.endswith(".gz"):
+        return "gzip"
+    if lower.endswith(".zst"):
+        return "zstd"
+    return None
+
+
+def part_path(path: str, part: int) -> str:
+    """data.csv.gz → data.part0001.csv.gz (압축 확장자와 본 확장자 모두 유지)"""
+    head, tail = os.path.split(path)
+    name, dot, rest = tail.partition(".")
+    return os.path.join(head, f"{name}.part{part:04d}{dot}{rest}")
+
+
+class TextOutput:
+    """
+    큰 쓰기 버퍼 + 선택적 스트리밍 압축(gzip / zstd) 텍스트 출력
+    - bytes_written: 원본 파일 위치 기준 압축 후 바이트 수 — 파트 분할 기준
+      (압축기를 flush하지 않으므로 아직 압축기/텍스트 버퍼에 있는 만큼은 늦게 반영됩니다)
+    """
+
+    def __init__(self, path: str, compression: str | None = None, *, encoding: str = "utf-8",
+                 newline: str = "", buffer_bytes: int = 1 << 20, level: int | None = None):
+        self.path = path
+        # 코덱 확인은 파일을 만들기 전에 (zstandard가 없으면 빈 .zst 파일이 남지 않도록)
+        zstd = _zstd() if compression == "zstd" else None
+        self._raw = open(path, "wb", buffering=buffer_bytes)
+        if compression == "gzip":
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode="wb", compresslevel=6 if level is None else level)
+        elif zstd is not None:
+            self._stream = zstd.ZstdCompressor(level=3 if level is None else level, threads=-1).stream_writer(
+                self._raw, closefd=False
+            )
+        else:
+            self._stream = None
+        self.text = io.TextIOWrapper(
+            self._stream or self._raw, encoding=encoding, newline=newline,
+            write_through=False, line_buffering=False,
+        )
+
+    @property
+    def bytes_written(self) -> int:
+        # text.flush()를 부르면 gzip Z_SYNC_FLUSH / zstd 블록 종료가 매번 일어나 압축률이 떨어집니다.
+        return self._raw.tell()
+
+    def close(self) -> None:
+        # TextIOWrapper → 압축 스트림 → 원본 파일 순서로 닫아야 압축 끝부분이 기록됩니다.
+        self.text.flush()
+        self.text.detach()
+        if self._stream is not None:
+            self._stream.close()
+        self._raw.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_text_input(path: str, encoding: str = "utf-8-sig", buffer_bytes: int = 1 << 20):
+    """확장자(.gz / .zst)에 따라 압축을 풀며 읽는 텍스트 스트림 (CSV 가져오기용, 닫으면 파일까지 닫힘)"""
+    compression = compression_from_path(path)
+    if compression == "gzip":
+        stream = gzip.open(path, "rb")
+    elif compression == "zstd":
+        raw = open(path, "rb", buffering=buffer_bytes)
+        stream = io.BufferedReader(_zstd().ZstdDecompressor().stream_reader(raw, closefd=True), buffer_bytes)
+    else:
+        stream = open(path, "rb", buffering=buffer_bytes)
+    return io.TextIOWrapper(stream, encoding=encoding, newline="")
@@ -1,79 +1,163 @@
 import os
 import json
+import threading
+import time
+from functools import partial
 from PyQt5.QtWidgets import (
     QWidget,
-    QTableWidgetItem,
     QFileDialog,
-    QHeaderView,
     QMessageBox,
 )
-from PyQt5.QtCore import QThread, pyqtSignal
-from data_shuttle import ui_setup, utils
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal
+from data_shuttle import importer, ui_setup, utils
+from data_shuttle.columnar import COLUMNAR_SUFFIX, export_origin_to_columnar
+from data_shuttle.engines import engine_registry
+from data_shuttle.fileio import COMPRESSION_SUFFIX, normalize_compression
+from data_shuttle.jobs import MigrationJob
+from data_shuttle.metadata import metadata_cache
+from data_shuttle.rejects import RejectLimitExceeded
+from data_shuttle.state import state_path_for_preset
 from data_shuttle.dialog.settings_dialog import SettingsDialog
 
-class MigrationWorker(QThread):
+# 2: options(테이블별 key_column / watermark_column / merge_keys 등) 포함
+PRESET_VERSION = 2
+
+
+class MigrationWorker(QThread, MigrationJob):
     log = pyqtSignal(str)
-    progress = pyqtSignal(int, int)   # inserted, total
-    error = pyqtSignal(int, str)      # row_index, error_message
-    done = pyqtSignal(int, int)       # inserted_total, source_total
+    progress = pyqtSignal(int, int, str)   # inserted, total, total_kind("exact" | "estimate" | "unknown")
+    errors = pyqtSignal(list)              # [(row_index, error_message), ...] — ui_update_ms 간격으로 묶어서 전달
+    done = pyqtSignal(int, int, str)       # inserted_total, source_total, total_kind
+    metrics = pyqtSignal(dict)             # {"type": "metrics", "scope": "chunk" | "table", ...} (options.metrics)
 
     def __init__(self, settings: dict, src_schema: str, src_tables_csv: str, where_text: str,
-                 dst_schema: str, dst_tables: str | None = None, chunk_size: int = 10_000):
-        super().__init__()
-        self.settings = settings
-        self.src_schema = src_schema
-        self.src_tables_csv = src_tables_csv
-        self.where_text = where_text
-        self.dst_schema = dst_schema
-        self.dst_tables = dst_tables or ""
-        self.chunk_size = chunk_size
+                 dst_schema: str, dst_tables: str | None = None, chunk_size: int = 10_000,
+                 options: dict | None = None, resume: bool = False, state_path: str | None = None):
+        QThread.__init__(self)
+        MigrationJob.__init__(
+            self, settings, src_schema, src_tables_csv, where_text, dst_schema, dst_tables,
+            chunk_size=chunk_size, options=options, resume=resume, state_path=state_path,
+        )
+        # 진행/에러 이벤트 묶음: 행 단위 재시도에서 행마다 신호를 보내 GUI가 멈추지 않도록
+        self._flush_interval = max(0, int(self.options.get("ui_update_ms", 200))) / 1000.0
+        self._last_flush = 0.0
+        self._pending_inserted = None
+        self._pending_errors = []
+        # 워커가 긴 커밋 등으로 멈춰 새 이벤트가 없어도 쌓인 진행/에러를 보내도록 GUI 스레드 타이머로도 비웁니다.
+        self._flush_lock = threading.RLock()
+        self._flush_timer = QTimer()
+        if self._flush_interval > 0:
+            self._flush_timer.setInterval(int(self._flush_interval * 1000))
+            self._flush_timer.timeout.connect(self._flush)
+            self.started.connect(self._flush_timer.start)
+            self.finished.connect(self._flush_timer.stop)
+
+    def _log(self, message: str) -> None:
+        self.log.emit(message)
+
+    def _on_progress(self, inserted_total: int) -> None:
+        with self._flush_lock:
+            self._pending_inserted = inserted_total
+            self._flush()
+
+    def _on_error(self, row_index: int, message: str) -> None:
+        with self._flush_lock:
+            self._pending_errors.append((row_index, message))
+            self._flush()
+
+    def _on_metrics(self, src_tbl: str, dst_tbl: str, event: dict) -> None:
+        super()._on_metrics(src_tbl, dst_tbl, event)
+        self.metrics.emit(event)
+
+    def _flush(self, force: bool = False) -> None:
+        """
+        마지막 전송 후 ui_update_ms가 지났으면(또는 force) 최신 진행 값과 쌓인 에러를 한 번에 보냅니다.
+        워커 스레드(이벤트 도착 시)와 GUI 스레드 타이머(_flush_timer) 양쪽에서 호출됩니다.
+        """
+        with self._flush_lock:
+            now = time.monotonic()
+            if not force and now - self._last_flush < self._flush_interval:
+                return
+            self._last_flush = now
+            if self._pending_inserted is not None:
+                self.progress.emit(self._pending_inserted, *self._source_total())
+                self._pending_inserted = None
+            if self._pending_errors:
+                self.errors.emit(self._pending_errors)
+                self._pending_errors = []
 
     def run(self):
         try:
-            src_tables = [t.strip() for t in self.src_tables_csv.split(',') if t.strip()]
-            dst_names  = [t.strip() for t in self.dst_tables.split(',')] if self.dst_tables else []
-            # 목적지 테이블 매핑: 개수 같으면 페어 매핑, 아니면 동일명
-            table_pairs = []
-            for i, s in enumerate(src_tables):
-                d = dst_names[i] if i < len(dst_names) and dst_names[i] else s
-                table_pairs.append((s, d))
-
-            # 엔진 생성
-            src_engine = utils.create_engine_from_config(self.settings.get("connection_1", {}))
-            dst_engine = utils.create_engine_from_config(self.settings.get("connection_2", {}))
-
-            total_inserted = 0
-            total_source = 0
-
-            for src_tbl, dst_tbl in table_pairs:
-                self.log.emit(f"[실행] 테이블 매핑: {self.src_schema}.{src_tbl}  →  {self.dst_schema}.{dst_tbl}")
-
-                cnt = utils.count_rows(src_engine, self.src_schema, src_tbl, self.where_text)
-                total_source += cnt
-                self.log.emit(f"[진행] 전체 조회 {cnt}건 진행 예정 (소스: {src_tbl})")
-
-                inserted_for_table = 0
-                for event in utils.run_migration_stream(
-                    src_engine, dst_engine,
-                    src_schema=self.src_schema, src_table=src_tbl,
-                    dst_schema=self.dst_schema, dst_table=dst_tbl,
-                    where_text=self.where_text, chunk_size=self.chunk_size,
-                ):
+            total_inserted = self.execute()
+            self.done.emit(total_inserted, *self._source_total())
+        except Exception as e:
+            self.log.emit(f"[오류] 워커 실행 실패: {e}")
+            self.done.emit(0, 0, "exact")
+
+
+class ImportWorker(MigrationWorker):
+    """
+    로컬 파일(CSV[.gz|.zst] / Parquet / Arrow) → Destination 테이블 적재
+    - 신호·이벤트 묶음·거부 파일·적재 옵션은 MigrationWorker와 같습니다.
+    - options.import_encoding / import_delimiter / import_null 로 CSV 읽기 방식을 지정합니다.
+    """
+
+    def __init__(self, settings: dict, file_path: str, dst_schema: str, dst_table: str,
+                 chunk_size: int = 10_000, options: dict | None = None, state_path: str | None = None):
+        super().__init__(settings, "", dst_table, "", dst_schema=dst_schema, dst_tables=dst_table,
+                         chunk_size=chunk_size, options=options, state_path=state_path)
+        self.file_path = file_path
+        self.dst_table = dst_table
+
+    def run(self):
+        total_inserted = 0
+        try:
+            dst_engine = engine_registry.get(self.settings.get("connection_2", {}), **self._pool_options())
+            self._restore_pending_bulk(dst_engine)
+            self._open_rejects()
+            self._open_metrics()
+            self._totals[("", self.dst_table)] = None   # 파일 행 수는 미리 세지 않음
+            self._log(f"[가져오기] {self.file_path} → {self.dst_schema}.{self.dst_table}")
+            stream_options = self._stream_options()
+            stream_options.pop("lob_fetch")   # 파일 원본에는 LOB 로케이터가 없음
+            try:
+                for event in self._bulk_stream(dst_engine, self.dst_table, self.dst_table, partial(
+                    importer.run_import_stream,
+                    dst_engine, self.file_path,
+                    dst_schema=self.dst_schema, dst_table=self.dst_table,
+                    encoding=self.options.get("import_encoding", "utf-8-sig"),
+                    delimiter=self.options.get("import_delimiter", ","),
+                    null_value=self.options.get("import_null", ""),
+                    **stream_options,
+                    commit_every=int(self._table_option(self.dst_table, "commit_every", 0) or 0),
+                    reject_sink=self._rejects,
+                    max_errors=int(self._table_option(self.dst_table, "max_errors", 0) or 0),
+                )):
                     et = event.get("type")
                     if et == "log":
-                        self.log.emit(event["message"])
+                        self._log(event["message"])
                     elif et == "progress":
-                        inserted_for_table += event["inserted_delta"]
                         total_inserted += event["inserted_delta"]
-                        self.progress.emit(total_inserted, total_source)
+                        self._on_progress(total_inserted)
                     elif et == "error":
-                        self.error.emit(event.get("row_index", -1), event.get("error", ""))
-
-                self.log.emit(f"[완료] {src_tbl} → {dst_tbl}: {inserted_for_table}/{cnt}건")
-            self.done.emit(total_inserted, total_source)
+                        self._on_error(event.get("row_index", -1), event.get("error", ""))
+                    elif et == "metrics":
+                        self._on_metrics(os.path.basename(self.file_path), self.dst_table, event)
+            except RejectLimitExceeded as e:
+                self._flush(force=True)
+                self._log(f"[중단] {e}")
+            self._log(f"[완료] {os.path.basename(self.file_path)} → {self.dst_table}: {total_inserted}건")
+            self._flush(force=True)
+            self._close_rejects()
+            self._close_metrics()
+            self.done.emit(total_inserted, *self._source_total())
         except Exception as e:
-            self.log.emit(f"[오류] 워커 실행 실패: {e}")
-            self.done.emit(0, 0)
+            self._flush(force=True)
+            self._close_rejects()
+            self._close_metrics()
+            self._log(f"[오류] 파일 가져오기 실패: {e}")
+            self.done.emit(total_inserted, -1, "unknown")
+
 
 class DataShuttleApp(QWidget):
     def __init__(self):
@@ -84,28 +168,20 @@ class DataShuttleApp(QWidget):
                 "connection_1": {"db_type":"Oracle","protocol":"TCP","host":"127.0.0.1","port":1521,"service_or_db":"","user":"","password":""},
                 "connection_2": {"db_type":"PostgreSQL","protocol":"TCP","host":"127.0.0.1","port":5432,"service_or_db":"","user":"","password":""},
             }
+        if not hasattr(self, "options"):
+            # 프리셋 "options" 섹션 (예: {"load_mode": "copy", "copy_format": "binary"})
+            self.options = {}
         self._worker = None
         self._last_origin = None
+        self._preset_path = None
 
     # ─────────────────────────────────
     def log_to_console(self, message: str) -> None:
         ui_setup.log_to_console(self, message)
 
     def _append_result(self, step: str, detail: str) -> None:
-        table = self.result_table
-        if table.columnCount() == 0:
-            table.setColumnCount(2)
-            table.setHorizontalHeaderLabels(["Step", "Detail"])
-            h = table.horizontalHeader()
-            h.setStretchLastSection(True)
-            h.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-            h.setSectionResizeMode(1, QHeaderView.Stretch)
-
-        r = table.rowCount()
-        table.insertRow(r)
-        table.setItem(r, 0, QTableWidgetItem(step))
-        table.setItem(r, 1, QTableWidgetItem(detail))
-        table.scrollToBottom()
+        self.result_model.append_rows([(step, detail)])
+        self.result_table.scrollToBottom()
     # ─────────────────────────────────
 
     # ─────────────────────────────────
@@ -115,9 +191,7 @@ class DataShuttleApp(QWidget):
             self.schema_input.clear()
             self.table_input.clear()
             self.where_input.clear()
-            self.result_table.clear()
-            self.result_table.setRowCount(0)
-            self.result_table.setColumnCount(0)
+            self.result_model.clear()
             self.console_output.clear()
             if hasattr(self, "dest_schema_input"): self.dest_schema_input.clear()
             if hasattr(self, "dest_table_input"):  self.dest_table_input.clear()
@@ -125,11 +199,23 @@ class DataShuttleApp(QWidget):
         except Exception as e:
             self.log_to_console(f"초기화 오류: {str(e)}")
 
+    def _release_connections(self) -> None:
+        """설정이 바뀌면 이전 접속의 풀과 메타데이터 캐시를 정리합니다. (실행 중인 커넥션은 반납 시 닫힘)"""
+        n = engine_registry.dispose_all()
+        metadata_cache.invalidate()
+        if n:
+            self.log_to_console(f"[설정] 이전 연결 풀 {n}개를 정리했습니다.")
+
+    def closeEvent(self, event) -> None:
+        engine_registry.dispose_all()
+        super().closeEvent(event)
+
     def open_settings(self) -> None:
         try:
             dlg = SettingsDialog(parent=self, settings=self.settings)
             if dlg.exec_():
                 self.settings = dlg.values()
+                self._release_connections()
                 self.log_to_console("[설정] 연결 정보가 업데이트되었습니다.")
             else:
                 self.log_to_console("[설정] 변경 없이 닫았습니다.")
@@ -170,11 +256,15 @@ class DataShuttleApp(QWidget):
 
             self._worker = MigrationWorker(
                 self.settings, src_schema, src_tables, where,
-                dst_schema=dst_schema, dst_tables=dst_tables, chunk_size=10_000
+                dst_schema=dst_schema, dst_tables=dst_tables,
+                chunk_size=int(self.options.get("chunk_size", 10_000)),
+                options=self.options,
+                resume=self.resume_checkbox.isChecked() if hasattr(self, "resume_checkbox") else False,
+                state_path=state_path_for_preset(self._preset_path),
             )
             self._worker.log.connect(self.log_to_console)
             self._worker.progress.connect(self._on_progress)
-            self._worker.error.connect(self._on_error)
+            self._worker.errors.connect(self._on_errors)
             self._worker.done.connect(self._on_done)
             self._worker.start()
         except Exception as e:
@@ -187,45 +277,111 @@ class DataShuttleApp(QWidget):
                 return
 
             src_cfg = self.settings.get("connection_1", {})
-            engine = utils.create_engine_from_config(src_cfg)
+            engine = engine_registry.get(src_cfg)
 
             schema = self._last_origin["schema"]
             tables = self._last_origin["tables"]
             where  = self._last_origin.get("where", "")
+            chunk_size = int(self.options.get("chunk_size", 10_000))
 
-            # 빠른 안내: 총건수 0이면 파일 저장 다이얼로그 전에 메시지
-            total_cnt = 0
-            for t in tables:
-                total_cnt += utils.count_rows(engine, schema, t, where)
-            if total_cnt == 0:
+            # 빠른 안내: 결과가 0건이면 파일 저장 다이얼로그 전에 메시지
+            # (count_mode=exact 외에는 COUNT(*) 대신 첫 행 존재 여부만 확인)
+            if str(self.options.get("count_mode", "exact")).lower() == "exact":
+                empty = sum(utils.count_rows(engine, schema, t, where) for t in tables) == 0
+            else:
+                empty = not any(utils.has_rows(engine, schema, t, where) for t in tables)
+            if empty:
                 self.log_to_console("Origin 조회 결과가 없습니다. (총 0건)")
                 return
 
+            # options.export_format(csv/parquet/arrow), export_compression(gzip/zstd),
+            # export_part_mb(CSV 파트 분할), export_workers(동시 테이블 수), lob_fetch / lob_chunk_rows(LOB 테이블)
+            file_format = str(self.options.get("export_format", "csv")).lower()
+            export_kwargs = dict(chunk_size=chunk_size, lob_chunk_rows=int(self.options.get("lob_chunk_rows", 1_000)))
+            if file_format == "csv":
+                compression = normalize_compression(self.options.get("export_compression"))
+                suffix = ".csv" + COMPRESSION_SUFFIX[compression]
+                export_kwargs["part_max_bytes"] = int(float(self.options.get("export_part_mb", 0) or 0) * 1024 * 1024)
+                export_kwargs["lob_fetch"] = self.options.get("lob_fetch", "inline")
+                export_one = utils.export_origin_to_csv
+            elif file_format in COLUMNAR_SUFFIX:
+                compression = str(self.options.get("export_compression") or "zstd").lower()
+                suffix = COLUMNAR_SUFFIX[file_format]
+                export_one = partial(export_origin_to_columnar, file_format=file_format)
+            else:
+                self.log_to_console(f"지원하지 않는 export_format: {file_format} (csv / parquet / arrow)")
+                return
+
             if len(tables) == 1:
                 t = tables[0]
-                default_name = f"{t}.csv"
+                default_name = f"{t}{suffix}"
                 file_name, _ = QFileDialog.getSaveFileName(
-                    self, "CSV Export (Origin)", default_name, "CSV Files (*.csv);;All Files (*)"
+                    self, "CSV Export (Origin)", default_name, f"{file_format.upper()} Files (*{suffix});;All Files (*)"
                 )
                 if not file_name:
                     return
-                n = utils.export_origin_to_csv(engine, schema, t, where, file_name, chunk_size=10_000)
-                self.log_to_console(f"[내보내기] {t}: {n}건을 CSV로 내보냈습니다 → {file_name}")
+                files = []
+                n = export_one(
+                    engine, schema, t, where, file_name, compression=compression, files=files, **export_kwargs
+                )
+                self.log_to_console(f"[내보내기] {t}: {n}건을 {file_format.upper()}로 내보냈습니다 → {', '.join(files)}")
             else:
-                # 다수 테이블: 폴더를 선택해 테이블별 파일 생성
-                dir_path = QFileDialog.getExistingDirectory(self, "Select folder to export CSVs")
+                # 다수 테이블: 폴더를 선택해 테이블별 파일을 동시에 생성
+                dir_path = QFileDialog.getExistingDirectory(self, "Select folder to export files")
                 if not dir_path:
                     return
                 grand_total = 0
-                for t in tables:
-                    path = os.path.join(dir_path, f"{t}.csv")
-                    n = utils.export_origin_to_csv(engine, schema, t, where, path, chunk_size=10_000)
+                for t, n, files, err in utils.export_tables_to_csv(
+                    engine, schema, tables, where, dir_path,
+                    max_workers=int(self.options.get("export_workers", 4) or 1),
+                    compression=compression, file_format=file_format, **export_kwargs,
+                ):
+                    if err:
+                        self.log_to_console(f"[오류] {t} 내보내기 실패: {err}")
+                        continue
                     grand_total += n
-                    self.log_to_console(f"[내보내기] {t}: {n}건 → {path}")
+                    self.log_to_console(f"[내보내기] {t}: {n}건 → {', '.join(files)}")
                 self.log_to_console(f"[내보내기] 총 {grand_total}건 내보내기 완료.")
         except Exception as e:
             self.log_to_console(f"CSV 내보내기 오류: {e}")
-    
+
+    def import_file(self) -> None:
+        """하단 '파일 가져오기': CSV / Parquet / Arrow 파일을 Destination(connection_2) 테이블로 적재"""
+        try:
+            if self._worker is not None and self._worker.isRunning():
+                self.log_to_console("이미 작업이 진행 중입니다.")
+                return
+            file_name, _ = QFileDialog.getOpenFileName(
+                self, "파일 가져오기 (Destination)", "",
+                "Data Files (*.csv *.csv.gz *.csv.zst *.parquet *.arrow *.feather);;All Files (*)",
+            )
+            if not file_name:
+                return
+
+            # 목적지: Destination 입력값 → 비어 있으면 Origin 스키마 / 파일명(확장자 제외)
+            dst_schema = self.dest_schema_input.text().strip() if hasattr(self, "dest_schema_input") else ""
+            dst_table  = self.dest_table_input.text().strip()  if hasattr(self, "dest_table_input")  else ""
+            dst_schema = dst_schema or self.schema_input.text().strip()
+            dst_table = dst_table.split(",")[0].strip() or os.path.basename(file_name).split(".")[0]
+            if not dst_schema:
+                self.log_to_console("Destination의 Schema는 필수입니다.")
+                return
+
+            self._append_result("실행", f"{os.path.basename(file_name)} → {dst_schema}.{dst_table} 가져오기를 시작합니다…")
+            self._worker = ImportWorker(
+                self.settings, file_name, dst_schema, dst_table,
+                chunk_size=int(self.options.get("chunk_size", 10_000)),
+                options=self.options,
+                state_path=state_path_for_preset(self._preset_path),
+            )
+            self._worker.log.connect(self.log_to_console)
+            self._worker.progress.connect(self._on_progress)
+            self._worker.errors.connect(self._on_errors)
+            self._worker.done.connect(self._on_done)
+            self._worker.start()
+        except Exception as e:
+            self.log_to_console(f"파일 가져오기 오류: {e}")
+
     def save_preset(self) -> None:
         """상단 '설정 내보내기': connection_1/2 + Origin/Dest + WHERE를 .txt(JSON)로 저장"""
         try:
@@ -240,7 +396,7 @@ class DataShuttleApp(QWidget):
             dest_tables = self.dest_table_input.text().strip() if hasattr(self, "dest_table_input") else ""
 
             data = {
-                "version": 1,
+                "version": PRESET_VERSION,
                 "settings": self.settings,
                 "origin": {
                     "schema": origin_schema,
@@ -251,6 +407,7 @@ class DataShuttleApp(QWidget):
                     "schema": dest_schema,
                     "tables": dest_tables,
                 },
+                "options": self.options,
             }
 
             default_name = "data_shuttle_preset.txt"
@@ -265,6 +422,7 @@ class DataShuttleApp(QWidget):
             
             with open(file_name, "w", encoding="utf-8-sig") as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
+            self._preset_path = file_name
 
             self.log_to_console(f"[내보내기] 설정을 저장했습니다: {file_name}")
         except Exception as e:
@@ -285,12 +443,17 @@ class DataShuttleApp(QWidget):
             
             with open(file_name, "r", encoding="utf-8-sig") as f:
                 data = json.load(f)
+            self._preset_path = file_name
 
             if "settings" in data and isinstance(data["settings"], dict):
                 self.settings = data["settings"]
+                self._release_connections()
             else:
                 QMessageBox.warning(self, "설정 불러오기", "settings 객체가 없어 연결 정보는 갱신하지 않았습니다.")
 
+            if isinstance(data.get("options"), dict):
+                self.options = data["options"]
+
             origin = data.get("origin", {})
             dest   = data.get("destination", {})
 
@@ -313,14 +476,32 @@ class DataShuttleApp(QWidget):
     # ─────────────────────────────────
 
     # ─────────────────────────────────
-    def _on_progress(self, inserted: int, total: int):
-        self._append_result("진행", f"누적 {inserted}/{total}건 마이그레이션 성공")
-
-    def _on_error(self, row_index: int, err: str):
-        idx_text = f"row {row_index}" if row_index >= 0 else "row ?"
-        self._append_result("에러", f"{idx_text}: {err}")
-
-    def _on_done(self, inserted_total: int, source_total: int):
-        self._append_result("완료", f"총 {source_total}건 중 {inserted_total}건 마이그레이션 완료")
+    def _on_progress(self, inserted: int, total: int, total_kind: str = "exact"):
+        # 연속된 진행 보고는 한 행을 갱신 (행이 끝없이 늘지 않도록)
+        self.result_model.upsert_last("진행", f"누적 {inserted}{self._total_suffix(inserted, total, total_kind)} 마이그레이션 성공")
+        self.result_table.scrollToBottom()
+
+    @staticmethod
+    def _total_suffix(inserted: int, total: int, total_kind: str) -> str:
+        """전체 건수 표기: 정확 "/N건", 추정 "/약 N건"(초과 시 표시), 미확인은 합계 없이 안내"""
+        if total_kind == "unknown" or total < 0:
+            return "건 (전체 건수 미확인)"
+        if total_kind == "estimate":
+            return f"/약 {total}건" + (" (추정치 초과)" if inserted > total else "")
+        return f"/{total}건"
+
+    def _on_errors(self, errors: list):
+        self.result_model.append_rows([
+            ("에러", f"{f'row {row_index}' if row_index >= 0 else 'row ?'}: {err}")
+            for row_index, err in errors
+        ])
+        self.result_table.scrollToBottom()
+
+    def _on_done(self, inserted_total: int, source_total: int, total_kind: str = "exact"):
+        if total_kind == "unknown" or source_total < 0:
+            self._append_result("완료", f"총 {inserted_total}건 마이그레이션 완료 (원본 건수 미확인)")
+        else:
+            about = "약 " if total_kind == "estimate" else ""
+            self._append_result("완료", f"총 {about}{source_total}건 중 {inserted_total}건 마이그레이션 완료")
         self.log_to_console("[완료] 마이그레이션이 종료되었습니다.")
     # ─────────────────────────────────
@@ -0,0 +1,219 @@
+"""
+로컬 파일(CSV[.gz|.zst] / Parquet / Arrow IPC)을 Destination(connection_2) 테이블로 적재합니다.
+- 파일 파싱은 백그라운드 스레드에서 청크 단위로 진행되어 적재와 겹칩니다. (prefetch_chunks)
+- 적재는 run_migration_stream과 같은 load_chunk_stream을 사용합니다.
+  (PostgreSQL COPY, Oracle 배열 DML, 이분/개별행 재시도, 거부 파일, 중간 커밋)
+- CSV 첫 줄은 헤더(목적지 컬럼명)여야 합니다. 값은 목적지 컬럼 타입에 맞춰 변환합니다.
+"""
+import base64
+import csv
+import os
+from datetime import date, datetime, time as dtime
+from decimal import Decimal
+from functools import partial
+from typing import Callable, Dict, Generator, Iterable, List
+from sqlalchemy import inspect, types as sqltypes
+from sqlalchemy.engine import Engine
+from data_shuttle import utils
+from data_shuttle.converters import column_kinds, lob_chunk_size
+from data_shuttle.fileio import open_text_input
+from data_shuttle.metadata import metadata_cache
+
+IMPORT_FORMATS = ("csv", "parquet", "arrow")
+
+
+def detect_format(path: str) -> str:
+    lower = path.lower()
+    if lower.endswith(".parquet"):
+        return "parquet"
+    if lower.endswith((".arrow", ".feather", ".ipc")):
+        return "arrow"
+    return "csv"
+
+
+def _bool(v: str) -> bool:
+    return v.strip().lower() in ("1", "t", "true", "y", "yes")
+
+
+def _converter(col_type) -> Callable[[str], object] | None:
+    """목적지 컬럼 타입 → CSV 문자열 변환 함수 (None이면 문자열 그대로)"""
+    if isinstance(col_type, sqltypes.Boolean):
+        return _bool
+    if isinstance(col_type, sqltypes.Integer):
+        return int
+    if isinstance(col_type, sqltypes.Float):
+        return float
+    if isinstance(col_type, sqltypes.Numeric):
+        p, s = col_type.precision, col_type.scale
+        return int if p is not None and not s else Decimal
+    if isinstance(col_type, sqltypes.DateTime):
+        return datetime.fromisoformat
+    if isinstance(col_type, sqltypes.Date):
+        return lambda v: date.fromisoformat(v[:10])
+    if isinstance(col_type, sqltypes.Time):
+        return dtime.fromisoformat
+    if isinstance(col_type, sqltypes.LargeBinary):
+        # CSV 내보내기는 바이너리를 base64로 기록합니다.
+        return base64.b64decode
+    return None
+
+
+def _csv_converters(dst_engine: Engine, dst_schema: str, dst_table: str, cols: List[str]) -> List:
+    def build():
+        types = {str(c["name"]).lower(): c["type"] for c in inspect(dst_engine).get_columns(dst_table, schema=dst_schema)}
+        return [_converter(types[c]) if c in types else None for c in cols]
+
+    key = (*metadata_cache.statement_key(dst_engine, dst_schema, dst_table), "csv_converters", tuple(cols))
+    return metadata_cache.statement(key, build)
+
+
+def file_columns(path: str, file_format: str, *, encoding: str = "utf-8-sig", delimiter: str = ",") -> List[str]:
+    """파일의 컬럼명(소문자): CSV는 헤더, Parquet/Arrow는 스키마"""
+    if file_format == "csv":
+        with open_text_input(path, encoding) as f:
+            header = next(csv.reader(f, delimiter=delimiter), [])
+        return [h.strip().lower() for h in header]
+    pa = _pyarrow()
+    if file_format == "parquet":
+        names = pa.parquet.ParquetFile(path).schema_arrow.names
+    else:
+        with pa.memory_map(path) as src:
+            names = pa.ipc.open_file(src).schema.names
+    return [str(n).lower() for n in names]
+
+
+def _pyarrow():
+    from data_shuttle.columnar import _pyarrow as load
+    return load()
+
+
+def read_csv_chunks(
+    path: str,
+    chunk_size,
+    *,
+    converters: List | None = None,
+    encoding: str = "utf-8-sig",
+    delimiter: str = ",",
+    null_value: str = "",
+) -> Generator[List[tuple], None, None]:
+    """
+    CSV를 청크(튜플 리스트)로 읽습니다. 헤더 1줄은 건너뜁니다.
+    - chunk_size: 정수 또는 호출 시 현재 크기를 돌려주는 함수 (AdaptiveChunkSizer)
+    - null_value와 같은 값은 None, 그 외는 converters[i]로 변환합니다.
+    """
+    convs = list(enumerate(converters or []))
+    with open_text_input(path, encoding) as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        next(reader, None)
+        while True:
+            size = chunk_size() if callable(chunk_size) else chunk_size
+            chunk = []
+            for rec in reader:
+                row = [None if v == null_value else v for v in rec]
+                for i, conv in convs:
+                    if conv is not None and row[i] is not None:
+                        row[i] = conv(row[i])
+                chunk.append(tuple(row))
+                if len(chunk) >= size:
+                    break
+            if not chunk:
+                return
+            yield chunk
+
+
+def read_columnar_chunks(path: str, chunk_size, file_format: str = "parquet") -> Generator[List[tuple], None, None]:
+    """
+    Parquet / Arrow IPC 파일을 RecordBatch 단위로 읽어 튜플 청크로 바꿉니다.
+    - chunk_size: 정수 또는 호출 시 현재 크기를 돌려주는 함수 (AdaptiveChunkSizer)
+      파일의 배치 경계와 상관없이 청크마다 현재 크기를 다시 읽어 그만큼 잘라(이어 붙여) 내보냅니다.
+    """
+    pa = _pyarrow()
+    next_size = chunk_size if callable(chunk_size) else (lambda: chunk_size)
+
+    def batches():
+        if file_format == "parquet":
+            # 읽기 단위는 시작 크기로 고정 (청크 크기는 아래에서 맞춥니다)
+            yield from pa.parquet.ParquetFile(path).iter_batches(batch_size=max(1, next_size()))
+            return
+        with pa.memory_map(path) as src:
+            reader = pa.ipc.open_file(src)
+            for i in range(reader.num_record_batches):
+                yield reader.get_batch(i)
+
+    def to_rows(parts) -> List[tuple]:
+        rows = []
+        for part in parts:
+            rows.extend(zip(*(col.to_pylist() for col in part.columns)))
+        return rows
+
+    parts, buffered, size = [], 0, 0
+    for batch in batches():
+        offset = 0
+        while offset < batch.num_rows:
+            if not buffered:
+                size = max(1, next_size())
+            take = min(size - buffered, batch.num_rows - offset)
+            parts.append(batch.slice(offset, take))
+            buffered += take
+            offset += take
+            if buffered >= size:
+                yield to_rows(parts)
+                parts, buffered = [], 0
+    if parts:
+        yield to_rows(parts)
+
+
+def run_import_stream(
+    dst_engine: Engine,
+    file_path: str,
+    *,
+    dst_schema: str,
+    dst_table: str,
+    file_format: str | None = None,
+    encoding: str = "utf-8-sig",
+    delimiter: str = ",",
+    null_value: str = "",
+    lob_chunk_rows: int = 1_000,
+    **load_kwargs,
+) -> Generator[Dict, None, None]:
+    """
+    파일을 목적지 테이블로 적재하며 run_migration_stream과 같은 이벤트(log/progress/error)를 내보냅니다.
+    - file_format: None이면 확장자로 판단 (csv / parquet / arrow)
+    - load_kwargs: chunk_size, load_mode, retry_mode, prefetch_chunks, commit_every, write_mode,
+      merge_keys, reject_sink, max_errors 등 load_chunk_stream 인자
+    - lob_chunk_rows: 목적지에 CLOB/BLOB 컬럼이 있으면 고정 청크 크기 상한 (0이면 제한 없음)
+    """
+    file_format = file_format or detect_format(file_path)
+    if file_format not in IMPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 형식: {file_format}")
+
+    cols = file_columns(file_path, file_format, encoding=encoding, delimiter=delimiter)
+    dst_cols = utils._get_columns(dst_engine, dst_schema, dst_table)
+    if not dst_cols:
+        yield {"type": "log", "message": f"[경고] 열 정보를 가져오지 못했습니다: {dst_schema}.{dst_table}"}
+        return
+    unknown = [c for c in cols if c not in dst_cols]
+    if not cols or unknown:
+        yield {"type": "log", "message": f"[경고] 목적지에 없는 컬럼: {', '.join(unknown) or '(헤더 없음)'}"}
+        return
+
+    if file_format == "csv":
+        source: Callable[..., Iterable[List[tuple]]] = partial(
+            read_csv_chunks, file_path,
+            converters=_csv_converters(dst_engine, dst_schema, dst_table, cols),
+            encoding=encoding, delimiter=delimiter, null_value=null_value,
+        )
+    else:
+        source = partial(read_columnar_chunks, file_path, file_format=file_format)
+
+    kinds = column_kinds(dst_engine, dst_schema, dst_table, cols)
+    if "chunk_size" in load_kwargs:
+        load_kwargs["chunk_size"] = lob_chunk_size(load_kwargs["chunk_size"], kinds, lob_chunk_rows)
+
+    yield {"type": "log", "message": (
+        f"[가져오기] {os.path.basename(file_path)} ({file_format}, {len(cols)}개 컬럼) → {dst_schema}.{dst_table}"
+    )}
+    yield from utils.load_chunk_stream(
+        dst_engine, source, dst_schema=dst_schema, dst_table=dst_table, cols=cols,
+        reject_table=os.path.basename(file_path), **load_kwargs,
+    )
@@ -0,0 +1,532 @@
+"""
+프리셋 하나(Origin → Destination 테이블 목록 + options)의 마이그레이션 실행 로직 (PyQt 없음)
+- GUI(MigrationWorker)와 헤드리스 CLI(data_shuttle.cli)가 같은 코드를 사용합니다.
+- 로그/진행/에러 전달은 _log / _on_progress / _on_error / _flush 를 재정의해 연결합니다.
+"""
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List
+from data_shuttle import bulk_load, utils
+from data_shuttle.engines import engine_registry
+from data_shuttle.metadata import metadata_cache
+from data_shuttle.metrics import describe, merge_summary, open_metrics_sink
+from data_shuttle.rejects import RejectLimitExceeded, RejectWriter
+from data_shuttle.state import StateStore
+
+# 원본 건수 산정 방식 (options.count_mode)
+# - exact: COUNT(*)  - estimate: 통계/실행계획 추정치
+# - concurrent: 별도 커넥션에서 COUNT(*)를 돌리며 바로 복사 시작  - none: 건수 생략
+COUNT_MODES = ("exact", "estimate", "concurrent", "none")
+
+
+class MigrationJob:
+    """
+    테이블 매핑, 건수 산정, 체크포인트/워터마크, 거부 파일, 순차/병렬 실행을 담당합니다.
+    - execute(): 전체 실행 후 총 적재 건수 반환 (테이블별 결과는 self.results)
+    """
+
+    def __init__(self, settings: dict, src_schema: str, src_tables_csv: str, where_text: str,
+                 dst_schema: str, dst_tables: str | None = None, chunk_size: int = 10_000,
+                 options: dict | None = None, resume: bool = False, state_path: str | None = None):
+        self.settings = settings
+        self.src_schema = src_schema
+        self.src_tables_csv = src_tables_csv
+        self.where_text = where_text
+        self.dst_schema = dst_schema
+        self.dst_tables = dst_tables or ""
+        self.chunk_size = chunk_size
+        self.options = options or {}
+        self.resume = resume
+        self.state = StateStore(state_path) if state_path else None
+        self.state_path = state_path
+        self._rejects = None
+        self._metrics_sink = None
+        self._table_metrics = {}   # (src, dst) → 테이블 합계 metrics 이벤트
+        self._pending_watermarks = {}
+        self._totals = {}   # (src, dst) → int | None(미확인) | Future(동시 COUNT 진행 중)
+        # 테이블별 결과: {"source", "destination", "status", "rows", "errors", "source_rows", "seconds", "error", "metrics"}
+        self.results: List[Dict] = []
+
+    # ── 출력 연결부 (GUI/CLI에서 재정의) ──
+    def _log(self, message: str) -> None:
+        pass
+
+    def _on_progress(self, inserted_total: int) -> None:
+        pass
+
+    def _on_error(self, row_index: int, message: str) -> None:
+        pass
+
+    def _on_metrics(self, src_tbl: str, dst_tbl: str, event: dict) -> None:
+        """metrics 이벤트: 싱크에 기록하고, 테이블 합계는 요약 로그와 실행 결과에 남깁니다."""
+        if self._metrics_sink is not None:
+            self._metrics_sink.write(event)
+        if event.get("scope") == "table":
+            key = (src_tbl, dst_tbl)
+            self._table_metrics[key] = merge_summary(self._table_metrics.get(key), event)
+            self._log(f"[지표] {src_tbl}: {describe(event)}")
+
+    def _flush(self, force: bool = False) -> None:
+        pass
+
+    # ── 옵션 / 상태 ──
+    def _table_option(self, src_tbl: str, name: str, default=None):
+        """options.tables.<소스테이블>.<name> → options.<name> 순으로 조회"""
+        for tbl, opts in (self.options.get("tables") or {}).items():
+            if tbl.upper() == src_tbl.upper() and isinstance(opts, dict) and name in opts:
+                return opts[name]
+        return self.options.get(name, default)
+
+    def table_pairs(self) -> List[tuple]:
+        """목적지 테이블 매핑: 개수 같으면 페어 매핑, 아니면 동일명"""
+        src_tables = [t.strip() for t in self.src_tables_csv.split(',') if t.strip()]
+        dst_names  = [t.strip() for t in self.dst_tables.split(',')] if self.dst_tables else []
+        pairs = []
+        for i, s in enumerate(src_tables):
+            d = dst_names[i] if i < len(dst_names) and dst_names[i] else s
+            pairs.append((s, d))
+        return pairs
+
+    def _table_key(self, src_tbl: str, dst_tbl: str) -> str:
+        return StateStore.table_key(self.src_schema, src_tbl, self.dst_schema, dst_tbl)
+
+    def _save_checkpoint(self, src_tbl: str, dst_tbl: str, event: dict) -> None:
+        if self.state:
+            self.state.save_checkpoint(
+                self._table_key(src_tbl, dst_tbl), event["key_column"], event["last_key"], event["rows"]
+            )
+
+    def _clear_checkpoint(self, src_tbl: str, dst_tbl: str) -> None:
+        if self.state:
+            self.state.clear_checkpoint(self._table_key(src_tbl, dst_tbl))
+
+    def _watermark(self, src_tbl: str, dst_tbl: str) -> tuple[str | None, object]:
+        """증분 동기화: (워터마크 컬럼, 지난 실행의 최대값) — 컬럼 미설정이면 (None, None)"""
+        column = self._table_option(src_tbl, "watermark_column") or None
+        if not column or not self.state or self.options.get("full_refresh"):
+            return column, None
+        wm = self.state.get_watermark(self._table_key(src_tbl, dst_tbl))
+        if wm and str(wm.get("column", "")).lower() == column.lower():
+            return column, wm["value"]
+        return column, None
+
+    def _resume_point(self, src_tbl: str, dst_tbl: str) -> tuple[str | None, dict | None]:
+        """(key_column, 이어할 체크포인트) — 이어하기가 아니거나 키 컬럼이 바뀌었으면 체크포인트는 None"""
+        key_column = self._table_option(src_tbl, "key_column") or None
+        if not key_column or not self.resume or not self.state or self.options.get("split_mode"):
+            return key_column, None
+        cp = self.state.get_checkpoint(self._table_key(src_tbl, dst_tbl))
+        if cp and str(cp.get("key_column", "")).lower() == key_column.lower():
+            return key_column, cp
+        return key_column, None
+
+    def _count_mode(self) -> str:
+        mode = str(self.options.get("count_mode", "exact")).lower()
+        return mode if mode in COUNT_MODES else "exact"
+
+    def _count(self, src_engine, src_tbl: str, dst_tbl: str, mode: str | None = None) -> int | None:
+        """count_mode에 따른 원본 건수 (estimate/none은 None = 미확인일 수 있음)"""
+        mode = mode or self._count_mode()
+        if mode == "none":
+            return None
+        wm_col, wm_after = self._watermark(src_tbl, dst_tbl)
+        # 재개면 체크포인트 이후 남은 행만 (진행률·ETA·적재 건수 비교 기준)
+        key_column, cp = self._resume_point(src_tbl, dst_tbl)
+        counter = utils.estimate_rows if mode == "estimate" else utils.count_rows
+        return counter(
+            src_engine, self.src_schema, src_tbl, self.where_text,
+            watermark_column=wm_col, watermark_after=wm_after,
+            key_column=key_column, resume_after=cp["last_key"] if cp else None,
+        )
+
+    def _source_total(self) -> tuple[int, str]:
+        """
+        지금까지 시작한 테이블들의 원본 건수 합계와 종류
+        - 동시 COUNT가 끝난 테이블은 결과값으로 바꿔 둡니다.
+        - 하나라도 모르면 (-1, "unknown")
+        """
+        total, unknown = 0, False
+        for key, cnt in list(self._totals.items()):
+            if isinstance(cnt, Future):
+                if not cnt.done():
+                    unknown = True
+                    continue
+                try:
+                    cnt = cnt.result()
+                    self._log(f"[건수] {key[0]}: 동시 COUNT 완료 ({cnt}건)")
+                except Exception as e:
+                    cnt = None
+                    self._log(f"[경고] {key[0]}: 동시 COUNT 실패: {e}")
+                self._totals[key] = cnt
+            if cnt is None:
+                unknown = True
+            else:
+                total += cnt
+        if unknown:
+            return -1, "unknown"
+        return total, "estimate" if self._count_mode() == "estimate" else "exact"
+
+    def _count_text(self, src_tbl: str, dst_tbl: str) -> str:
+        cnt = self._totals.get((src_tbl, dst_tbl))
+        if not isinstance(cnt, int):
+            return "?건"
+        return f"약 {cnt}건" if self._count_mode() == "estimate" else f"{cnt}건"
+
+    def _note_watermark(self, src_tbl: str, dst_tbl: str, event: dict) -> None:
+        """조각/청크별 watermark 이벤트 중 최대값만 보관 (테이블 완료 시 저장)"""
+        key = (src_tbl, dst_tbl)
+        prev = self._pending_watermarks.get(key)
+        if prev is None or event["value"] > prev[1]:
+            self._pending_watermarks[key] = (event["column"], event["value"])
+
+    def _commit_watermark(self, src_tbl: str, dst_tbl: str) -> None:
+        wm = self._pending_watermarks.pop((src_tbl, dst_tbl), None)
+        if wm and self.state:
+            self.state.save_watermark(self._table_key(src_tbl, dst_tbl), wm[0], wm[1])
+            self._log(f"[증분] {src_tbl}: 다음 실행 기준 {wm[0]} > {wm[1]}")
+
+    def _pool_options(self) -> dict:
+        """options.pool_size / max_overflow (미지정 시 parallel_tables × split_count에 맞춰 확보)"""
+        parallel = max(1, int(self.options.get("parallel_tables", 1) or 1))
+        split = max(1, int(self.options.get("split_count", 1) or 1)) if self.options.get("split_mode") else 1
+        size = int(self.options.get("pool_size", 0) or 0) or max(5, parallel * split + 2)
+        return {"pool_size": size, "max_overflow": int(self.options.get("max_overflow", 10))}
+
+    def _open_rejects(self) -> None:
+        """options.reject_file(.csv → 테이블별 CSV, 그 외 JSONL): 상대 경로는 프리셋 폴더 기준"""
+        path = self.options.get("reject_file")
+        if not path:
+            return
+        if not os.path.isabs(path) and self.state_path:
+            path = os.path.join(os.path.dirname(os.path.abspath(self.state_path)), path)
+        # 이어하기면 이전 시도의 거부 행을 보존하도록 이어 씁니다.
+        self._rejects = RejectWriter(path, append=self.resume)
+        self._log(f"[거부] 실패 행을 파일로 {'이어서 ' if self.resume else ''}보관합니다 → {path}")
+
+    def _close_rejects(self) -> None:
+        if not self._rejects:
+            return
+        rejects, self._rejects = self._rejects, None
+        try:
+            rejects.close()
+        except Exception as e:
+            self._log(f"[경고] 거부 파일 기록 실패: {e}")
+        if rejects.count:
+            self._log(f"[거부] 실패 행 {rejects.count}건 기록: {', '.join(rejects.files)}")
+
+    def _metrics_enabled(self) -> bool:
+        return bool(self.options.get("metrics") or self.options.get("metrics_file"))
+
+    def _open_metrics(self) -> None:
+        """options.metrics_file(.prom → Prometheus textfile, 그 외 JSONL): 상대 경로는 프리셋 폴더 기준"""
+        path = self.options.get("metrics_file")
+        if not path:
+            return
+        if not os.path.isabs(path) and self.state_path:
+            path = os.path.join(os.path.dirname(os.path.abspath(self.state_path)), path)
+        self._metrics_sink = open_metrics_sink(path)
+        self._log(f"[지표] 단계별 계측을 기록합니다 → {path}")
+
+    def _close_metrics(self) -> None:
+        if not self._metrics_sink:
+            return
+        sink, self._metrics_sink = self._metrics_sink, None
+        try:
+            sink.close()
+        except Exception as e:
+            self._log(f"[경고] 지표 파일 기록 실패: {e}")
+
+    def _stream_options(self) -> dict:
+        """프리셋 options 중 run_migration_stream에 전달할 적재 옵션"""
+        return {
+            "chunk_size": self.chunk_size,
+            "load_mode": self.options.get("load_mode", "insert"),
+            "copy_format": self.options.get("copy_format", "text"),
+            "retry_mode": self.options.get("retry_mode", "bisect"),
+            "prefetch_chunks": int(self.options.get("prefetch_chunks", 2)),
+            "adaptive_chunks": bool(self.options.get("adaptive_chunks", False)),
+            "target_chunk_seconds": float(self.options.get("target_chunk_seconds", 2.0)),
+            "memory_budget_mb": int(self.options.get("memory_budget_mb", 256)),
+            "metrics": self._metrics_enabled(),
+            "lob_fetch": self.options.get("lob_fetch", "inline"),
+            "lob_chunk_rows": int(self.options.get("lob_chunk_rows", 1_000)),
+        }
+
+    def _table_stream(self, src_engine, dst_engine, src_tbl: str, dst_tbl: str):
+        """테이블 1개의 이벤트 스트림: options.split_mode가 있으면 조각 병렬 처리"""
+        kwargs = dict(
+            src_schema=self.src_schema, src_table=src_tbl,
+            dst_schema=self.dst_schema, dst_table=dst_tbl,
+            where_text=self.where_text, **self._stream_options(),
+            commit_every=int(self._table_option(src_tbl, "commit_every", 0) or 0),
+            reject_sink=self._rejects,
+            max_errors=int(self._table_option(src_tbl, "max_errors", 0) or 0),
+        )
+        wm_col, wm_after = self._watermark(src_tbl, dst_tbl)
+        if wm_col:
+            kwargs.update(watermark_column=wm_col, watermark_after=wm_after)
+            if wm_after is not None:
+                self._log(f"[증분] {src_tbl}: {wm_col} > {wm_after} 인 변경분만 조회합니다.")
+        merge_keys = self._table_option(src_tbl, "merge_keys") or []
+        if isinstance(merge_keys, str):
+            merge_keys = [k.strip() for k in merge_keys.split(",") if k.strip()]
+        write_mode = self._table_option(src_tbl, "write_mode")
+        if wm_col:
+            merge_keys, write_mode = self._incremental_write(dst_engine, src_tbl, dst_tbl, merge_keys, write_mode)
+        kwargs.update(
+            write_mode=write_mode or ("upsert" if merge_keys else "insert"),
+            merge_keys=merge_keys,
+            merge_scope=self._table_option(src_tbl, "merge_scope", "chunk"),
+        )
+        split_mode = self.options.get("split_mode")
+        if split_mode:
+            # 분할 모드는 조각별로 커밋만 하고 체크포인트/재개는 사용하지 않음
+            return self._bulk_stream(dst_engine, src_tbl, dst_tbl, partial(
+                utils.run_migration_split,
+                src_engine, dst_engine,
+                split_mode=split_mode,
+                split_count=int(self.options.get("split_count", 4) or 1),
+                key_column=self.options.get("split_key") or None,
+                **kwargs,
+            ))
+
+        key_column, cp = self._resume_point(src_tbl, dst_tbl)
+        if cp:
+            kwargs.update(resume_after=cp["last_key"], row_offset=int(cp.get("rows", 0)))
+            self._log(
+                f"[재개] {src_tbl}: {key_column} > {cp['last_key']} 부터 이어서 진행 "
+                f"(이전 커밋 {cp.get('rows', 0)}행, {cp.get('updated_at', '')})"
+            )
+        return self._bulk_stream(dst_engine, src_tbl, dst_tbl, partial(
+            utils.run_migration_stream, src_engine, dst_engine, key_column=key_column, **kwargs
+        ))
+
+    def _incremental_write(self, dst_engine, src_tbl: str, dst_tbl: str, merge_keys: list, write_mode):
+        """
+        워터마크 증분은 이미 적재한 행이 다시 오므로 INSERT만으로는 키 중복/거부가 납니다.
+        - merge_keys가 없으면 목적지 기본키로 upsert, 기본키도 없으면 설정 오류
+        - write_mode="insert"를 명시하면 설정 오류
+        """
+        if write_mode == "insert":
+            raise ValueError(
+                f"{src_tbl}: watermark_column 증분에는 write_mode='insert'를 쓸 수 없습니다. (upsert / merge)"
+            )
+        if merge_keys:
+            return merge_keys, write_mode
+        pk = metadata_cache.primary_key(dst_engine, self.dst_schema, dst_tbl)
+        if not pk:
+            raise ValueError(
+                f"{src_tbl}: watermark_column 증분에는 merge_keys가 필요합니다. "
+                f"(목적지 {self.dst_schema}.{dst_tbl}에 기본키가 없습니다)"
+            )
+        self._log(f"[증분] {src_tbl}: merge_keys 미설정 → 목적지 기본키({', '.join(pk)})로 upsert합니다.")
+        return pk, write_mode
+
+    def _bulk_stream(self, dst_engine, src_tbl: str, dst_tbl: str, stream):
+        """
+        options.bulk_load (테이블별 지정 가능): 목적지 보조 인덱스/FK/트리거를 적재 후로 미룹니다.
+        - bulk_unlogged: PostgreSQL UNLOGGED (Oracle은 경고 후 무시), rebuild_workers: 동시 인덱스 재생성 수
+        """
+        if not self._table_option(src_tbl, "bulk_load", False):
+            return stream()
+        save = partial(self.state.save_bulk_restore, f"{self.dst_schema}.{dst_tbl}") if self.state else None
+        return bulk_load.bulk_load_stream(
+            dst_engine, self.dst_schema, dst_tbl, stream,
+            unlogged=bool(self._table_option(src_tbl, "bulk_unlogged", False)),
+            rebuild_workers=int(self.options.get("rebuild_workers", 2) or 1),
+            save_pending=save,
+        )
+
+    def _restore_pending_bulk(self, dst_engine) -> None:
+        """이전 실행이 비정상 종료되어 남은 벌크 적재 복구 DDL을 먼저 실행합니다."""
+        pending = self.state.pending_bulk_restores() if self.state else {}
+        if not pending:
+            return
+        for event in bulk_load.restore_pending(
+            dst_engine, pending,
+            workers=int(self.options.get("rebuild_workers", 2) or 1),
+            save_pending=self.state.save_bulk_restore,
+        ):
+            self._log(event["message"])
+
+    def _result(self, src_tbl: str, dst_tbl: str, status: str, rows: int, errors: int,
+                started: float, error: str | None = None) -> None:
+        cnt = self._totals.get((src_tbl, dst_tbl))
+        self.results.append({
+            "source": f"{self.src_schema}.{src_tbl}",
+            "destination": f"{self.dst_schema}.{dst_tbl}",
+            "status": status,
+            "rows": rows,
+            "errors": errors,
+            "source_rows": cnt if isinstance(cnt, int) else None,
+            "seconds": round(time.monotonic() - started, 3),
+            "error": error,
+            "metrics": self._table_metrics.get((src_tbl, dst_tbl)),
+        })
+
+    def _fail_table(self, src_tbl: str, dst_tbl: str, error: BaseException, rows: int, errors: int,
+                    started: float) -> None:
+        """
+        테이블 실패 기록 (순차/병렬 공용): max_errors 초과는 "aborted", 그 밖의 예외는 "failed"
+        어느 쪽이든 체크포인트/워터마크는 완료로 처리하지 않고, 남은 테이블은 계속 진행합니다.
+        """
+        self._flush(force=True)
+        if isinstance(error, RejectLimitExceeded):
+            status = "aborted"
+            self._log(f"[중단] {error}")
+        else:
+            status = "failed"
+            self._log(f"[오류] {src_tbl} → {dst_tbl} 마이그레이션 실패: {error}")
+        self._result(src_tbl, dst_tbl, status, rows, errors, started, str(error))
+
+    # ── 실행 ──
+    def execute(self) -> int:
+        """모든 테이블을 실행하고 총 적재 건수를 돌려줍니다. (동시 COUNT도 끝날 때까지 대기)"""
+        table_pairs = self.table_pairs()
+
+        # 엔진: 접속 설정별 공유 풀 (병렬 테이블/조각도 같은 풀에서 커넥션을 받습니다)
+        pool = self._pool_options()
+        src_engine = engine_registry.get(self.settings.get("connection_1", {}), **pool)
+        dst_engine = engine_registry.get(self.settings.get("connection_2", {}), **pool)
+        self._restore_pending_bulk(dst_engine)
+
+        # 컬럼 메타데이터: 대상 테이블들을 딕셔너리 뷰 한 번으로 미리 조회 (테이블별 리플렉션 생략)
+        metadata_cache.ttl_seconds = float(self.options.get("metadata_ttl_seconds", 600))
+        if self.options.get("refresh_metadata"):
+            metadata_cache.invalidate(src_engine, self.src_schema)
+        cached = metadata_cache.prefetch_schema(src_engine, self.src_schema, [s for s, _ in table_pairs])
+        if cached:
+            self._log(f"[메타] {self.src_schema}: 테이블 {cached}개 컬럼 정보를 일괄 조회했습니다.")
+
+        # count_mode=concurrent: 복사와 별도 커넥션에서 COUNT(*)
+        count_pool = ThreadPoolExecutor(max_workers=2) if self._count_mode() == "concurrent" else None
+        self._open_rejects()
+        self._open_metrics()
+        try:
+            parallel = max(1, int(self.options.get("parallel_tables", 1) or 1))
+            if parallel > 1 and len(table_pairs) > 1:
+                return self._run_parallel(src_engine, dst_engine, table_pairs, parallel, count_pool)
+            return self._run_sequential(src_engine, dst_engine, table_pairs, count_pool)
+        finally:
+            if count_pool:
+                count_pool.shutdown(wait=True)
+            self._flush(force=True)
+            self._close_rejects()
+            self._close_metrics()
+
+    def _run_sequential(self, src_engine, dst_engine, table_pairs: list,
+                        count_pool: ThreadPoolExecutor | None = None) -> int:
+        total_inserted = 0
+        for src_tbl, dst_tbl in table_pairs:
+            self._log(f"[실행] 테이블 매핑: {self.src_schema}.{src_tbl}  →  {self.dst_schema}.{dst_tbl}")
+            started = time.monotonic()
+
+            if count_pool:
+                self._totals[(src_tbl, dst_tbl)] = count_pool.submit(
+                    self._count, src_engine, src_tbl, dst_tbl, "exact"
+                )
+                self._log(f"[진행] 건수는 별도 커넥션에서 집계하며 바로 시작합니다. (소스: {src_tbl})")
+            else:
+                self._totals[(src_tbl, dst_tbl)] = self._count(src_engine, src_tbl, dst_tbl)
+                self._log(f"[진행] 전체 조회 {self._count_text(src_tbl, dst_tbl)} 진행 예정 (소스: {src_tbl})")
+
+            inserted_for_table = 0
+            errors_for_table = 0
+            try:
+                for event in self._table_stream(src_engine, dst_engine, src_tbl, dst_tbl):
+                    et = event.get("type")
+                    if et == "log":
+                        self._log(event["message"])
+                    elif et == "progress":
+                        inserted_for_table += event["inserted_delta"]
+                        total_inserted += event["inserted_delta"]
+                        self._on_progress(total_inserted)
+                    elif et == "error":
+                        errors_for_table += 1
+                        self._on_error(event.get("row_index", -1), event.get("error", ""))
+                    elif et == "checkpoint":
+                        self._save_checkpoint(src_tbl, dst_tbl, event)
+                    elif et == "watermark":
+                        self._note_watermark(src_tbl, dst_tbl, event)
+                    elif et == "metrics":
+                        self._on_metrics(src_tbl, dst_tbl, event)
+            except Exception as e:
+                # 이 테이블만 실패 처리 → 다음 테이블 진행 (병렬 실행과 같은 규칙)
+                self._fail_table(src_tbl, dst_tbl, e, inserted_for_table, errors_for_table, started)
+                continue
+
+            self._flush(force=True)
+            self._clear_checkpoint(src_tbl, dst_tbl)
+            self._commit_watermark(src_tbl, dst_tbl)
+            self._log(f"[완료] {src_tbl} → {dst_tbl}: {inserted_for_table}/{self._count_text(src_tbl, dst_tbl)}")
+            self._result(src_tbl, dst_tbl, "ok", inserted_for_table, errors_for_table, started)
+        return total_inserted
+
+    def _run_parallel(self, src_engine, dst_engine, table_pairs: list, parallel: int,
+                      count_pool: ThreadPoolExecutor | None = None) -> int:
+        """
+        테이블 단위 병렬 마이그레이션 (options.parallel_tables)
+        - 테이블마다 풀에서 별도의 소스/목적지 커넥션을 사용합니다.
+        - 건수가 큰 테이블부터 배정하여 전체 소요 시간을 줄입니다. (건수를 모르면 입력 순서)
+        - 로그/에러에는 "[소스테이블]" 접두어를 붙여 구분합니다.
+        """
+        self._log(f"[병렬] 테이블 {len(table_pairs)}개를 최대 {parallel}개씩 동시에 마이그레이션합니다.")
+        if count_pool:
+            counts = [None] * len(table_pairs)
+            for s, d in table_pairs:
+                self._totals[(s, d)] = count_pool.submit(self._count, src_engine, s, d, "exact")
+        else:
+            with ThreadPoolExecutor(max_workers=parallel) as pool:
+                counts = list(pool.map(
+                    lambda pair: self._count(src_engine, pair[0], pair[1]),
+                    table_pairs,
+                ))
+            self._totals.update(zip(table_pairs, counts))
+        jobs_meta = sorted(
+            ((s, d, cnt) for (s, d), cnt in zip(table_pairs, counts)),
+            key=lambda x: x[2] or 0, reverse=True,
+        )
+        for src_tbl, dst_tbl, _ in jobs_meta:
+            self._log(
+                f"[실행] 테이블 매핑: {self.src_schema}.{src_tbl}  →  {self.dst_schema}.{dst_tbl} "
+                f"(전체 조회 {self._count_text(src_tbl, dst_tbl)})"
+            )
+
+        jobs = [
+            (i, partial(self._table_stream, src_engine, dst_engine, src_tbl, dst_tbl))
+            for i, (src_tbl, dst_tbl, _) in enumerate(jobs_meta)
+        ]
+        inserted = [0] * len(jobs_meta)
+        errors = [0] * len(jobs_meta)
+        started = time.monotonic()
+        total_inserted = 0
+        for i, event in utils.merge_event_streams(jobs, max_workers=parallel):
+            src_tbl, dst_tbl, _ = jobs_meta[i]
+            et = event.get("type")
+            if et == "log":
+                self._log(f"[{src_tbl}] {event['message']}")
+            elif et == "progress":
+                inserted[i] += event["inserted_delta"]
+                total_inserted += event["inserted_delta"]
+                self._on_progress(total_inserted)
+            elif et == "error":
+                errors[i] += 1
+                self._on_error(event.get("row_index", -1), f"[{src_tbl}] {event.get('error', '')}")
+            elif et == "checkpoint":
+                self._save_checkpoint(src_tbl, dst_tbl, event)
+            elif et == "watermark":
+                self._note_watermark(src_tbl, dst_tbl, event)
+            elif et == "metrics":
+                self._on_metrics(src_tbl, dst_tbl, event)
+            elif et == "job_done":
+                self._flush(force=True)
+                self._clear_checkpoint(src_tbl, dst_tbl)
+                self._commit_watermark(src_tbl, dst_tbl)
+                self._log(f"[완료] {src_tbl} → {dst_tbl}: {inserted[i]}/{self._count_text(src_tbl, dst_tbl)}")
+                self._result(src_tbl, dst_tbl, "ok", inserted[i], errors[i], started)
+            elif et == "job_error":
+                error = event.get("exception") or RuntimeError(event.get("error", ""))
+                self._fail_table(src_tbl, dst_tbl, error, inserted[i], errors[i], started)
+        return total_inserted
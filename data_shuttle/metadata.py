@@ -0,0 +1,164 @@
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Tuple
+from sqlalchemy import bindparam, inspect, text
+from sqlalchemy.engine import Engine
+
+
+def _engine_key(engine: Engine) -> str:
+    """같은 접속 대상이면 엔진을 새로 만들어도 같은 키 (비밀번호 제외)"""
+    return engine.url.render_as_string(hide_password=True)
+
+
+def _reflect_columns(engine: Engine, schema: str, table: str) -> Tuple[List[str], Dict[str, str]]:
+    """테이블 1개 리플렉션 (일괄 조회에 없던 테이블/뷰/동의어용)"""
+    insp = inspect(engine)
+    info = insp.get_columns(table, schema=schema)
+    cols = [str(c["name"]).lower() for c in info]
+    types = {str(c["name"]).lower(): str(c["type"]) for c in info}
+    if not cols:
+        with engine.connect() as c:
+            r = c.execute(text(f"SELECT * FROM {schema}.{table} FETCH FIRST 1 ROWS ONLY"))
+            if r.returns_rows:
+                cols = [str(k).lower() for k in r.keys()]
+    return cols, types
+
+
+def _bulk_columns(engine: Engine, schema: str, tables: Iterable[str] | None) -> Dict[str, Tuple[List[str], Dict[str, str]]]:
+    """
+    스키마의 컬럼 목록을 딕셔너리 뷰 한 번으로 조회합니다.
+    - Oracle: ALL_TAB_COLUMNS / PostgreSQL: information_schema.columns
+    - 반환: {테이블명(대문자): ([컬럼...], {컬럼: 타입})}
+    """
+    dialect = engine.dialect.name
+    names = sorted({t.upper() for t in tables}) if tables else []
+    if dialect == "oracle":
+        sql = ("SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE FROM ALL_TAB_COLUMNS "
+               "WHERE OWNER = :s" + (" AND TABLE_NAME IN :t" if names else "") +
+               " ORDER BY TABLE_NAME, COLUMN_ID")
+        params = {"s": schema.upper()}
+    elif dialect == "postgresql":
+        sql = ("SELECT upper(table_name), column_name, data_type FROM information_schema.columns "
+               "WHERE table_schema = lower(:s)" + (" AND upper(table_name) IN :t" if names else "") +
+               " ORDER BY table_name, ordinal_position")
+        params = {"s": schema}
+    else:
+        return {}
+    stmt = text(sql)
+    if names:
+        stmt = stmt.bindparams(bindparam("t", expanding=True))
+        params["t"] = names
+
+    out: Dict[str, Tuple[List[str], Dict[str, str]]] = {}
+    with engine.connect() as conn:
+        for tbl, col, typ in conn.execute(stmt, params):
+            cols, types = out.setdefault(str(tbl).upper(), ([], {}))
+            cols.append(str(col).lower())
+            types[str(col).lower()] = str(typ)
+    return out
+
+
+class MetadataCache:
+    """
+    (접속, 스키마, 테이블) 단위 컬럼 메타데이터 + 생성한 SQL 문장 캐시
+    - ttl_seconds가 지나면 다시 조회합니다. (0 이하이면 만료 없음)
+    - prefetch_schema: 여러 테이블의 컬럼을 딕셔너리 뷰 한 번으로 미리 채웁니다.
+    - invalidate: 설정 변경·DDL 후 명시적으로 비웁니다.
+    - statement: 같은 입력이면 같은 SQL 문자열/값을 재사용합니다. (드라이버 문장 캐시 적중)
+    """
+
+    def __init__(self, ttl_seconds: float = 600.0):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._columns: Dict[tuple, Tuple[float, List[str], Dict[str, str]]] = {}
+        self._statements: Dict[tuple, Tuple[float, object]] = {}
+
+    def _fresh(self, stored_at: float) -> bool:
+        return self.ttl_seconds <= 0 or time.monotonic() - stored_at < self.ttl_seconds
+
+    @staticmethod
+    def statement_key(engine: Engine, schema: str, table: str) -> tuple:
+        return (_engine_key(engine), schema.upper(), table.upper())
+
+    def _lookup(self, engine: Engine, schema: str, table: str):
+        key = self.statement_key(engine, schema, table)
+        with self._lock:
+            hit = self._columns.get(key)
+        if hit and self._fresh(hit[0]):
+            return hit
+        cols, types = _reflect_columns(engine, schema, table)
+        if cols:
+            hit = (time.monotonic(), cols, types)
+            with self._lock:
+                self._columns[key] = hit
+        return hit or (0.0, cols, types)
+
+    def columns(self, engine: Engine, schema: str, table: str) -> List[str]:
+        """소문자 컬럼명 목록 (테이블 정의 순서)"""
+        return list(self._lookup(engine, schema, table)[1])
+
+    def column_types(self, engine: Engine, schema: str, table: str) -> Dict[str, str]:
+        """{소문자 컬럼명: 타입 문자열}"""
+        return dict(self._lookup(engine, schema, table)[2])
+
+    def primary_key(self, engine: Engine, schema: str, table: str) -> List[str]:
+        """소문자 기본키 컬럼 목록 (없거나 조회 실패면 빈 목록, 문장 캐시와 같이 만료)"""
+        def build():
+            try:
+                pk = inspect(engine).get_pk_constraint(table, schema=schema)
+            except Exception:
+                return []
+            return [str(c).lower() for c in pk.get("constrained_columns") or []]
+
+        return list(self.statement((*self.statement_key(engine, schema, table), "primary_key"), build))
+
+    def prefetch_schema(self, engine: Engine, schema: str, tables: Iterable[str] | None = None) -> int:
+        """
+        스키마(또는 지정 테이블들)의 컬럼을 일괄 조회해 캐시에 넣습니다.
+        - 반환: 채운 테이블 수 (지원하지 않는 DB이거나 실패하면 0 → 테이블별 리플렉션으로 진행)
+        """
+        try:
+            found = _bulk_columns(engine, schema, tables)
+        except Exception:
+            return 0
+        now = time.monotonic()
+        ek = _engine_key(engine)
+        with self._lock:
+            for tbl, (cols, types) in found.items():
+                self._columns[(ek, schema.upper(), tbl)] = (now, cols, types)
+        return len(found)
+
+    def statement(self, key: tuple, build: Callable[[], object]):
+        """
+        key가 같으면 build() 결과를 재사용합니다.
+        - key는 (statement_key(engine, schema, table), 종류, ...) 형태로 만들어야 invalidate 대상이 됩니다.
+        """
+        with self._lock:
+            hit = self._statements.get(key)
+        if hit and self._fresh(hit[0]):
+            return hit[1]
+        value = build()
+        with self._lock:
+            self._statements[key] = (time.monotonic(), value)
+        return value
+
+    def invalidate(self, engine: Engine | None = None, schema: str | None = None, table: str | None = None) -> None:
+        """조건에 맞는 항목을 비웁니다. 인자 없이 호출하면 전부 비웁니다."""
+        match = (
+            _engine_key(engine) if engine is not None else None,
+            schema.upper() if schema else None,
+            table.upper() if table else None,
+        )
+
+        def hit(key: tuple) -> bool:
+            return all(m is None or k == m for k, m in zip(key, match))
+
+        with self._lock:
+            for k in [k for k in self._columns if hit(k)]:
+                del self._columns[k]
+            for k in [k for k in self._statements if hit(k)]:
+                del self._statements[k]
+
+
+# 프로세스 공용 캐시 (GUI 실행·CSV 내보내기가 함께 사용)
+metadata_cache = MetadataCache()
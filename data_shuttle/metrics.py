@@ -0,0 +1,258 @@
+"""
+적재/내보내기 단계별 계측과 지표 파일 싱크
+- LoadMeter: 청크마다 fetch / wait / transform / write / commit 시간과 행·바이트 수를 재서
+  {"type": "metrics", "scope": "chunk" | "table", ...} 이벤트를 만듭니다. (metrics=True일 때만 생성)
+  rows는 조회한 행이 아니라 실제로 쓴 행(count()로 보고), 거부된 행은 rows_rejected로 따로 셉니다.
+- 싱크: .prom → Prometheus textfile(node_exporter textfile collector), 그 외 → JSON Lines
+"""
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable
+
+# fetch: 소스 조회/파싱, wait: 적재 측이 다음 청크를 기다린 시간(프리페치 대기열이 비었을 때),
+# transform: 청크 후처리(워터마크 등), write: INSERT/COPY(재시도 포함), commit: 커밋
+PHASES = ("fetch", "wait", "transform", "write", "commit")
+
+
+def timed_chunks(factory) -> Iterable:
+    """factory()의 청크를 (청크, 조회 초)로 내보냅니다. (프리페치 스레드 안에서 조회 시간만 측정)"""
+    it = iter(factory())
+    try:
+        while True:
+            t0 = time.perf_counter()
+            try:
+                rows = next(it)
+            except StopIteration:
+                return
+            yield rows, time.perf_counter() - t0
+    finally:
+        close = getattr(it, "close", None)
+        if close:
+            close()
+
+
+class LoadMeter:
+    """
+    단계별 스톱워치: begin() → lap(단계)… → end()가 청크 이벤트, summary()가 테이블 합계 이벤트
+    - count(): 쓴 행/거부 행 보고. 스테이징 MERGE처럼 커밋 때 늦게 보고된 행은 그때의 청크나 합계에 들어갑니다.
+    - skip(): 제너레이터가 이벤트를 yield하고 멈춰 있던(소비 측 처리) 시간은 어느 단계에도 넣지 않습니다.
+    - fetch_inline: 프리페치 없이 같은 스레드에서 조회하면 대기 시간에서 조회 시간을 뺍니다.
+    """
+
+    def __init__(self, table: str, source: str | None = None, fetch_inline: bool = False):
+        self.table = table
+        self.source = source
+        self.fetch_inline = fetch_inline
+        self.chunks = 0
+        self.rows = 0
+        self.rejected = 0
+        self.bytes = 0
+        self.totals = dict.fromkeys(PHASES, 0.0)
+        self._started = time.perf_counter()
+        self._mark = self._started
+        self._cur: Dict[str, float] = {}
+        self._cur_rows = 0
+        self._cur_rejected = 0
+        self._row_bytes = 0.0
+
+    def skip(self) -> None:
+        self._mark = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter()
+        self._cur[phase] = self._cur.get(phase, 0.0) + (now - self._mark)
+        self._mark = now
+
+    def begin(self, rows: int, nbytes: int, fetch_s: float) -> None:
+        """청크를 받은 직전까지를 wait로 기록하고 새 청크 측정을 시작합니다. (rows/nbytes: 조회한 청크)"""
+        now = time.perf_counter()
+        waited = now - self._mark
+        self._cur = {"fetch": fetch_s, "wait": max(0.0, waited - fetch_s) if self.fetch_inline else waited}
+        self._mark = now
+        if rows:
+            self._row_bytes = nbytes / rows
+
+    def count(self, written: int = 0, rejected: int = 0) -> None:
+        self._cur_rows += written
+        self._cur_rejected += rejected
+
+    def _take(self):
+        """보고된 행 수를 합계로 옮기고 (쓴 행, 거부 행, 쓴 행의 추정 바이트)를 돌려줍니다."""
+        rows, rejected = self._cur_rows, self._cur_rejected
+        nbytes = int(self._row_bytes * rows)
+        self.rows += rows
+        self.rejected += rejected
+        self.bytes += nbytes
+        self._cur_rows = self._cur_rejected = 0
+        return rows, rejected, nbytes
+
+    def end(self) -> Dict:
+        self.chunks += 1
+        rows, rejected, nbytes = self._take()
+        phases = {p: round(self._cur.get(p, 0.0), 6) for p in PHASES}
+        for p, v in phases.items():
+            self.totals[p] += v
+        busy = sum(v for p, v in phases.items() if p != "fetch")
+        return {
+            "type": "metrics", "scope": "chunk", "table": self.table, "source": self.source,
+            "chunk": self.chunks, "rows": rows, "rows_rejected": rejected, "bytes": nbytes,
+            "seconds": phases, "rows_per_sec": round(rows / busy, 1) if busy > 0 else None,
+        }
+
+    def summary(self) -> Dict:
+        """마지막 skip() 이후 시간을 최종 커밋으로 더한 테이블 합계"""
+        final_commit = time.perf_counter() - self._mark
+        self.totals["commit"] += final_commit
+        # 마지막 스테이징 MERGE처럼 청크 이벤트 뒤에 보고된 행
+        late_rows, late_rejected, late_bytes = self._take()
+        elapsed = time.perf_counter() - self._started
+        return {
+            "type": "metrics", "scope": "table", "table": self.table, "source": self.source,
+            "chunks": self.chunks, "rows": self.rows, "rows_rejected": self.rejected, "bytes": self.bytes,
+            "late_rows": late_rows, "late_rows_rejected": late_rejected, "late_bytes": late_bytes,
+            "elapsed": round(elapsed, 3), "final_commit": round(final_commit, 6),
+            "seconds": {p: round(v, 3) for p, v in self.totals.items()},
+            "rows_per_sec": round(self.rows / elapsed, 1) if elapsed > 0 else None,
+            "mb_per_sec": round(self.bytes / elapsed / 2**20, 2) if elapsed > 0 else None,
+        }
+
+
+def merge_summary(prev: Dict | None, event: Dict) -> Dict:
+    """같은 테이블의 합계 이벤트를 더합니다. (분할 조각/재시도 실행)"""
+    if not prev:
+        return dict(event, seconds=dict(event.get("seconds", {})))
+    out = dict(prev, seconds=dict(prev["seconds"]))
+    for k in ("chunks", "rows", "rows_rejected", "bytes", "late_rows", "late_rows_rejected", "late_bytes"):
+        out[k] = prev.get(k, 0) + event.get(k, 0)
+    for p in PHASES:
+        out["seconds"][p] = round(prev["seconds"].get(p, 0.0) + event["seconds"].get(p, 0.0), 3)
+    out["elapsed"] = max(prev.get("elapsed", 0.0), event.get("elapsed", 0.0))
+    out["final_commit"] = prev.get("final_commit", 0.0) + event.get("final_commit", 0.0)
+    if out["elapsed"] > 0:
+        out["rows_per_sec"] = round(out["rows"] / out["elapsed"], 1)
+        out["mb_per_sec"] = round(out["bytes"] / out["elapsed"] / 2**20, 2)
+    return out
+
+
+def describe(event: Dict) -> str:
+    """테이블 합계 이벤트 → 한 줄 요약 (가장 오래 걸린 단계 표시)"""
+    sec = event.get("seconds", {})
+    busiest = max(PHASES, key=lambda p: sec.get(p, 0.0))
+    parts = " / ".join(f"{p} {sec.get(p, 0.0):.2f}s" for p in PHASES)
+    rejected = f" (거부 {event['rows_rejected']}행)" if event.get("rows_rejected") else ""
+    return (
+        f"{event.get('rows', 0)}행{rejected}, {event.get('rows_per_sec') or 0:,.0f} rows/s, "
+        f"{event.get('mb_per_sec') or 0:.1f} MB/s ({parts}) → {busiest} 구간이 가장 깁니다."
+    )
+
+
+class JsonlMetricsSink:
+    """metrics 이벤트를 시각과 함께 한 줄씩 기록 (여러 스트림에서 동시에 써도 안전)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._f = open(path, "a", encoding="utf-8")
+
+    def write(self, event: Dict) -> None:
+        line = json.dumps({"ts": datetime.now().isoformat(timespec="milliseconds"), **event}, ensure_ascii=False)
+        with self._lock:
+            self._f.write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            self._f.close()
+
+
+def _label(v: str) -> str:
+    return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class PrometheusTextfileSink:
+    """
+    테이블별 누적 지표를 Prometheus 텍스트 형식으로 기록합니다. (node_exporter --collector.textfile)
+    - 임시 파일에 쓴 뒤 교체하므로 수집기가 반쯤 쓴 파일을 읽지 않습니다.
+    - 청크 이벤트마다 쓰지 않고 flush_seconds 간격과 테이블 완료, close() 때만 다시 씁니다.
+    """
+
+    def __init__(self, path: str, flush_seconds: float = 5.0):
+        self.path = path
+        self.flush_seconds = flush_seconds
+        self._lock = threading.Lock()
+        self._tables: Dict[str, Dict] = {}
+        self._last_flush = 0.0
+
+    def write(self, event: Dict) -> None:
+        with self._lock:
+            t = self._tables.setdefault(event["table"], {
+                "rows": 0, "rejected": 0, "bytes": 0, "chunks": 0, "seconds": dict.fromkeys(PHASES, 0.0), "rate": 0.0, "done": 0,
+            })
+            if event.get("scope") == "chunk":
+                t["rows"] += event["rows"]
+                t["rejected"] += event.get("rows_rejected", 0)
+                t["bytes"] += event["bytes"]
+                t["chunks"] += 1
+                for p in PHASES:
+                    t["seconds"][p] += event["seconds"].get(p, 0.0)
+                t["rate"] = event.get("rows_per_sec") or 0.0
+            else:
+                # 마지막 커밋과 그때 보고된 행은 청크 이벤트에 없고 테이블 합계에만 있습니다.
+                t["seconds"]["commit"] += event.get("final_commit", 0.0)
+                t["rows"] += event.get("late_rows", 0)
+                t["rejected"] += event.get("late_rows_rejected", 0)
+                t["bytes"] += event.get("late_bytes", 0)
+                t["rate"] = event.get("rows_per_sec") or 0.0
+                t["done"] = 1
+            now = time.monotonic()
+            if event.get("scope") == "table" or now - self._last_flush >= self.flush_seconds:
+                self._last_flush = now
+                self._flush()
+
+    def _flush(self) -> None:
+        lines = [
+            "# HELP datashuttle_rows_total Rows written per destination table.",
+            "# TYPE datashuttle_rows_total counter",
+        ]
+        lines += [f'datashuttle_rows_total{{table="{_label(k)}"}} {v["rows"]}' for k, v in self._tables.items()]
+        lines += ["# HELP datashuttle_rows_rejected_total Rows rejected by the destination (reject file).",
+                  "# TYPE datashuttle_rows_rejected_total counter"]
+        lines += [
+            f'datashuttle_rows_rejected_total{{table="{_label(k)}"}} {v["rejected"]}' for k, v in self._tables.items()
+        ]
+        lines += ["# HELP datashuttle_bytes_total Estimated in-memory bytes of rows written.",
+                  "# TYPE datashuttle_bytes_total counter"]
+        lines += [f'datashuttle_bytes_total{{table="{_label(k)}"}} {v["bytes"]}' for k, v in self._tables.items()]
+        lines += ["# HELP datashuttle_chunks_total Chunks processed.", "# TYPE datashuttle_chunks_total counter"]
+        lines += [f'datashuttle_chunks_total{{table="{_label(k)}"}} {v["chunks"]}' for k, v in self._tables.items()]
+        lines += ["# HELP datashuttle_phase_seconds_total Time spent per phase.",
+                  "# TYPE datashuttle_phase_seconds_total counter"]
+        lines += [
+            f'datashuttle_phase_seconds_total{{table="{_label(k)}",phase="{p}"}} {v["seconds"][p]:.6f}'
+            for k, v in self._tables.items() for p in PHASES
+        ]
+        lines += ["# HELP datashuttle_rows_per_second Latest throughput.", "# TYPE datashuttle_rows_per_second gauge"]
+        lines += [f'datashuttle_rows_per_second{{table="{_label(k)}"}} {v["rate"]}' for k, v in self._tables.items()]
+        lines += ["# HELP datashuttle_table_done 1 when the table finished.", "# TYPE datashuttle_table_done gauge"]
+        lines += [f'datashuttle_table_done{{table="{_label(k)}"}} {v["done"]}' for k, v in self._tables.items()]
+        lines += ["# HELP datashuttle_last_update_timestamp_seconds Last write of this file.",
+                  "# TYPE datashuttle_last_update_timestamp_seconds gauge",
+                  f"datashuttle_last_update_timestamp_seconds {time.time():.3f}"]
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp, self.path)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._tables:
+                self._flush()
+
+
+def open_metrics_sink(path: str):
+    """확장자로 싱크 선택: .prom → Prometheus textfile, 그 외 → JSON Lines"""
+    if path.lower().endswith(".prom"):
+        return PrometheusTextfileSink(path)
+    return JsonlMetricsSink(path)
@@ -0,0 +1,134 @@
+import base64
+import csv
+import json
+import os
+import queue
+import threading
+from datetime import date, datetime, time as dtime
+from decimal import Decimal
+from typing import Dict, List
+
+
+class RejectLimitExceeded(RuntimeError):
+    """max_errors를 넘어 테이블 적재를 중단할 때 발생합니다."""
+
+
+def _json_default(v):
+    if isinstance(v, (datetime, date, dtime)):
+        return v.isoformat()
+    if isinstance(v, Decimal):
+        return str(v)
+    if isinstance(v, (bytes, bytearray, memoryview)):
+        return base64.b64encode(bytes(v)).decode("ascii")
+    return str(v)
+
+
+def _csv_value(v):
+    if v is None:
+        return ""
+    if isinstance(v, (bytes, bytearray, memoryview)):
+        return base64.b64encode(bytes(v)).decode("ascii")
+    return v
+
+
+class RejectWriter:
+    """
+    실패 행을 로컬 파일로 보관하는 싱크 (나중에 거부 행만 다시 적재할 수 있도록)
+    - path가 .csv면 테이블별 CSV(<이름>.<SCHEMA.TABLE>.csv, 헤더: row_index, error, 컬럼...)
+      그 외에는 JSONL 한 파일 ({"table", "row_index", "error", "row": {컬럼: 값}})
+    - write()는 대기열에 넣기만 하고, 파일 쓰기·flush는 백그라운드 스레드가 합니다.
+    - 여러 테이블/조각 스트림이 함께 써도 안전합니다.
+    - append=True(체크포인트에서 이어하기): 기존 파일 뒤에 이어 씁니다. CSV 헤더는 새 파일에만 씁니다.
+      (체크포인트가 이미 지나간 행의 거부 기록이 덮어써져 사라지지 않도록)
+    """
+
+    _CLOSE = object()
+
+    def __init__(self, path: str, flush_seconds: float = 0.5, queue_size: int = 10_000, append: bool = False):
+        self.path = path
+        self.append = append
+        self.format = "csv" if path.lower().endswith(".csv") else "jsonl"
+        self.count = 0
+        self.files: List[str] = []
+        self._flush_seconds = flush_seconds
+        self._q: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._handles: Dict[str, tuple] = {}
+        self._error: Exception | None = None
+        self._thread = threading.Thread(target=self._run, name="reject-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, table: str, cols: List[str], row_index: int, row, error: str) -> None:
+        with self._lock:
+            self.count += 1
+        self._q.put((table, cols, row_index, row, error))
+
+    def close(self) -> None:
+        """남은 행을 모두 기록하고 파일을 닫습니다."""
+        self._q.put(self._CLOSE)
+        self._thread.join()
+        if self._error:
+            raise self._error
+
+    # ── 백그라운드 ──
+    def _handle(self, table: str, cols: List[str]):
+        key = table if self.format == "csv" else ""
+        h = self._handles.get(key)
+        if h:
+            return h
+        if self.format == "csv":
+            base, ext = os.path.splitext(self.path)
+            path = f"{base}.{table}{ext}"
+            new = not (self.append and os.path.exists(path) and os.path.getsize(path) > 0)
+            # 이어 쓸 때 utf-8-sig는 파일 중간에 BOM을 다시 쓰지 않습니다.
+            f = open(path, "w" if new else "a", newline="", encoding="utf-8-sig")
+            w = csv.writer(f)
+            if new:
+                w.writerow(["row_index", "error", *cols])
+        else:
+            path = self.path
+            f = open(path, "a" if self.append else "w", encoding="utf-8")
+            w = None
+        self.files.append(path)
+        h = self._handles[key] = (f, w)
+        return h
+
+    def _write_one(self, table, cols, row_index, row, error) -> None:
+        f, w = self._handle(table, cols)
+        values = list(row) if row is not None else [None] * len(cols)
+        if w is not None:
+            w.writerow([row_index, error, *(_csv_value(v) for v in values)])
+        else:
+            f.write(json.dumps(
+                {"table": table, "row_index": row_index, "error": error, "row": dict(zip(cols, values))},
+                ensure_ascii=False, default=_json_default,
+            ) + "\n")
+
+    def _run(self) -> None:
+        closing = False
+        while not closing:
+            try:
+                item = self._q.get(timeout=self._flush_seconds)
+            except queue.Empty:
+                item = None
+            # 쌓인 항목을 한꺼번에 기록한 뒤 flush
+            batch = [] if item is None else [item]
+            while True:
+                try:
+                    batch.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+            for it in batch:
+                if it is self._CLOSE:
+                    closing = True
+                    continue
+                if self._error is None:
+                    try:
+                        self._write_one(*it)
+                    except Exception as e:
+                        self._error = e
+            for f, _ in self._handles.values():
+                f.flush()
+        for f, _ in self._handles.values():
+            f.close()
+        self._handles.clear()
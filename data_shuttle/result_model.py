@@ -0,0 +1,73 @@
+from collections import deque
+from typing import List, Tuple
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class ResultModel(QAbstractTableModel):
+    """
+    Result(Step / Detail) 목록 모델 — 최근 max_rows 행만 보관하는 링 버퍼
+    - 행이 아무리 많이 들어와도 메모리·그리기 비용이 일정합니다.
+    - 밀려난 행 수는 dropped로 세고, 세로 헤더에는 전체 기준 순번을 표시합니다.
+    - "진행" 행은 마지막 행이 같은 단계면 새로 추가하지 않고 갱신합니다.
+    """
+
+    HEADERS = ("Step", "Detail")
+
+    def __init__(self, max_rows: int = 5_000, parent=None):
+        super().__init__(parent)
+        self._rows: deque = deque(maxlen=max_rows)
+        self.dropped = 0
+
+    # ── Qt 모델 인터페이스 ──
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if role in (Qt.DisplayRole, Qt.ToolTipRole) and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(self.dropped + section + 1)
+
+    # ── 추가/갱신 ──
+    def append_rows(self, rows: List[Tuple[str, str]]) -> None:
+        """여러 행을 한 번에 추가 (넘치는 앞쪽 행은 버림)"""
+        if not rows:
+            return
+        cap = self._rows.maxlen
+        rows = rows[-cap:]
+        overflow = len(self._rows) + len(rows) - cap
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._rows.popleft()
+            self.dropped += overflow
+            self.endRemoveRows()
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def upsert_last(self, step: str, detail: str) -> None:
+        """마지막 행이 같은 step이면 내용만 바꾸고, 아니면 새 행을 추가합니다."""
+        if self._rows and self._rows[-1][0] == step:
+            last = len(self._rows) - 1
+            self._rows[last] = (step, detail)
+            idx = self.index(last, 1)
+            self.dataChanged.emit(idx, idx)
+        else:
+            self.append_rows([(step, detail)])
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._rows.clear()
+        self.dropped = 0
+        self.endResetModel()
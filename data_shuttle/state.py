@@ -0,0 +1,134 @@
+import json
+import os
+import threading
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict
+
+
+def state_path_for_preset(preset_path: str | None) -> str:
+    """프리셋 파일 옆의 상태 파일 경로 (예: data_shuttle_preset.txt → data_shuttle_preset.state.json)"""
+    if preset_path:
+        return os.path.splitext(preset_path)[0] + ".state.json"
+    return os.path.abspath("data_shuttle.state.json")
+
+
+def _encode_value(v: Any) -> Dict:
+    """체크포인트 키 값을 JSON으로 저장할 수 있게 타입과 함께 인코딩합니다."""
+    if isinstance(v, bool) or v is None:
+        return {"t": "raw", "v": v}
+    if isinstance(v, int):
+        return {"t": "int", "v": v}
+    if isinstance(v, Decimal):
+        return {"t": "decimal", "v": str(v)}
+    if isinstance(v, float):
+        return {"t": "float", "v": v}
+    if isinstance(v, datetime):
+        return {"t": "datetime", "v": v.isoformat()}
+    if isinstance(v, date):
+        return {"t": "date", "v": v.isoformat()}
+    return {"t": "str", "v": str(v)}
+
+
+def _decode_value(d: Dict) -> Any:
+    t, v = d.get("t"), d.get("v")
+    if t == "decimal":
+        return Decimal(v)
+    if t == "datetime":
+        return datetime.fromisoformat(v)
+    if t == "date":
+        return date.fromisoformat(v)
+    return v
+
+
+class StateStore:
+    """
+    마이그레이션 상태(체크포인트, 워터마크) JSON 파일
+    - 테이블 키: "SRC_SCHEMA.SRC_TABLE->DST_SCHEMA.DST_TABLE"
+    - 임시 파일에 쓴 뒤 교체하여 중간에 죽어도 파일이 깨지지 않습니다.
+    - 병렬 테이블 워커에서 함께 쓰므로 잠금으로 보호합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data = self._read()
+
+    def _read(self) -> Dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _flush(self) -> None:
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    @staticmethod
+    def table_key(src_schema: str, src_table: str, dst_schema: str, dst_table: str) -> str:
+        return f"{src_schema}.{src_table}->{dst_schema}.{dst_table}".upper()
+
+    # ── 체크포인트 (커밋된 마지막 키) ──
+    def get_checkpoint(self, table_key: str) -> Dict | None:
+        """{"key_column", "last_key", "rows", "updated_at"} 또는 None"""
+        with self._lock:
+            cp = self._data.get("checkpoints", {}).get(table_key)
+        if not cp:
+            return None
+        return {**cp, "last_key": _decode_value(cp["last_key"])}
+
+    def save_checkpoint(self, table_key: str, key_column: str, last_key: Any, rows: int) -> None:
+        with self._lock:
+            self._data.setdefault("checkpoints", {})[table_key] = {
+                "key_column": key_column,
+                "last_key": _encode_value(last_key),
+                "rows": rows,
+                "updated_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            self._flush()
+
+    def clear_checkpoint(self, table_key: str) -> None:
+        with self._lock:
+            if self._data.get("checkpoints", {}).pop(table_key, None) is not None:
+                self._flush()
+
+    # ── 워터마크 (증분 동기화 기준값) ──
+    def get_watermark(self, table_key: str) -> Dict | None:
+        """{"column", "value", "updated_at"} 또는 None"""
+        with self._lock:
+            wm = self._data.get("watermarks", {}).get(table_key)
+        if not wm:
+            return None
+        return {**wm, "value": _decode_value(wm["value"])}
+
+    def save_watermark(self, table_key: str, column: str, value: Any) -> None:
+        with self._lock:
+            self._data.setdefault("watermarks", {})[table_key] = {
+                "column": column,
+                "value": _encode_value(value),
+                "updated_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            self._flush()
+
+    # ── 벌크 적재 복구 DDL (준비 후 아직 되돌리지 못한 인덱스/제약/트리거) ──
+    def pending_bulk_restores(self) -> Dict[str, Dict]:
+        """{"SCHEMA.TABLE": {단계: [DDL...]}}"""
+        with self._lock:
+            return {k: dict(v["steps"]) for k, v in self._data.get("bulk_restores", {}).items()}
+
+    def save_bulk_restore(self, target: str, steps: Dict | None) -> None:
+        """steps가 None이면 항목을 지웁니다. (복구 완료)"""
+        key = target.upper()
+        with self._lock:
+            pending = self._data.setdefault("bulk_restores", {})
+            if steps:
+                pending[key] = {"steps": steps, "updated_at": datetime.now().isoformat(timespec="seconds")}
+            elif pending.pop(key, None) is None:
+                return
+            self._flush()
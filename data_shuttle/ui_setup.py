@@ -3,15 +3,22 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
     QLabel,
     QTextEdit,
+    QPlainTextEdit,
     QPushButton,
-    QTableWidget,
+    QTableView,
     QHBoxLayout,
     QGroupBox,
     QToolButton,
     QLineEdit,
     QHeaderView,
+    QCheckBox,
 )
 from PyQt5.QtCore import Qt
+from data_shuttle.result_model import ResultModel
+
+# 콘솔/결과 목록 보관 한도 (넘치면 오래된 것부터 버림)
+CONSOLE_MAX_LINES = 2_000
+RESULT_MAX_ROWS = 5_000
 
 
 def init_ui(app_instance):
@@ -101,8 +108,9 @@ def init_ui(app_instance):
     # ─────────────────────────────────
 
     # ─────────────────────────────────
-    app_instance.console_output = QTextEdit()
+    app_instance.console_output = QPlainTextEdit()
     app_instance.console_output.setReadOnly(True)
+    app_instance.console_output.setMaximumBlockCount(CONSOLE_MAX_LINES)
     app_instance.console_output.setMaximumHeight(120)
     layout.addWidget(QLabel("Console Output:"))
     layout.addWidget(app_instance.console_output)
@@ -115,27 +123,41 @@ def init_ui(app_instance):
     if hasattr(app_instance, "start_migration"):
         app_instance.migrate_button.clicked.connect(app_instance.start_migration)
     buttom_layout.addWidget(app_instance.migrate_button)
+    app_instance.resume_checkbox = QCheckBox("체크포인트에서 이어하기")
+    app_instance.resume_checkbox.setToolTip("프리셋 key_column + commit_every로 저장된 체크포인트부터 재개합니다.")
+    buttom_layout.addWidget(app_instance.resume_checkbox)
     layout.addLayout(buttom_layout)
     # ─────────────────────────────────
 
     # ─────────────────────────────────
-    app_instance.result_table = QTableWidget()
+    # 모델/뷰: 최근 RESULT_MAX_ROWS 행만 보관하는 링 버퍼 모델
+    app_instance.result_model = ResultModel(max_rows=RESULT_MAX_ROWS, parent=app_instance)
+    app_instance.result_table = QTableView()
     app_instance.result_table.setMinimumHeight(200)
-    app_instance.result_table.setColumnCount(2)
-    app_instance.result_table.setHorizontalHeaderLabels(["Step", "Detail"])
+    app_instance.result_table.setModel(app_instance.result_model)
+    app_instance.result_table.verticalHeader().setDefaultSectionSize(22)
 
     h = app_instance.result_table.horizontalHeader()
     h.setStretchLastSection(True)
-    h.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+    h.setSectionResizeMode(0, QHeaderView.Interactive)
+    app_instance.result_table.setColumnWidth(0, 80)  # ResizeToContents는 전체 행을 훑으므로 고정 폭
     h.setSectionResizeMode(1, QHeaderView.Stretch) 
 
     layout.addWidget(QLabel("Result:"))
     layout.addWidget(app_instance.result_table)
     # ─────────────────────────────────
 
+    file_layout = QHBoxLayout()
+    file_layout.addStretch(1)
+    app_instance.import_file_btn = QPushButton("파일 가져오기 (Destination)")
+    app_instance.import_file_btn.setToolTip("CSV(.gz/.zst) / Parquet / Arrow 파일을 Destination 테이블로 적재합니다.")
+    app_instance.import_file_btn.clicked.connect(app_instance.import_file)
+    file_layout.addWidget(app_instance.import_file_btn)
+
     app_instance.export_origin_btn = QPushButton("CSV Export (Origin)")
     app_instance.export_origin_btn.clicked.connect(app_instance.export_origin_csv)
-    layout.addWidget(app_instance.export_origin_btn, alignment=Qt.AlignRight)
+    file_layout.addWidget(app_instance.export_origin_btn)
+    layout.addLayout(file_layout)
 
     app_instance.setLayout(layout)
     app_instance.setWindowTitle("DataShuttle")
@@ -184,7 +206,7 @@ def center(app_instance):
 
 def log_to_console(app_instance, message: str):
     """콘솔 창에 로그 메시지를 출력하는 함수"""
-    app_instance.console_output.append(message)
+    app_instance.console_output.appendPlainText(message)
 
 
 def check_cryptography() -> str:
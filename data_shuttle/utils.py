@@ -1,10 +1,43 @@
 import csv
-from typing import Dict, Tuple, Generator, Iterable
-from sqlalchemy import create_engine, text, inspect
+import json
+import os
+import queue
+import sys
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from typing import Callable, Dict, List, Tuple, Generator, Iterable
+from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine, Row
+from data_shuttle import converters
+from data_shuttle.fileio import COMPRESSION_SUFFIX, TextOutput, part_path
+from data_shuttle.metadata import metadata_cache
+from data_shuttle.metrics import LoadMeter, timed_chunks
+from data_shuttle.rejects import RejectLimitExceeded, RejectWriter
 
 
-def create_engine_from_config(cfg: Dict, connect_timeout: int | None = None) -> Engine:
+def create_engine_from_config(
+    cfg: Dict, connect_timeout: int | None = None,
+    pool_size: int | None = None, max_overflow: int | None = None,
+) -> Engine:
+    """
+    cfg로 Engine을 만듭니다. 작업마다 새로 만들지 말고 engines.engine_registry.get(cfg)로 공유하세요.
+    - pool_size / max_overflow: 미지정 시 SQLAlchemy 기본값(5 / 10)
+    - db_type: Oracle / PostgreSQL, 그 외 SQLite(service_or_db=파일 경로), URL(cfg["url"])
+    - fetch_size / prefetch_rows: 조회 튜닝 값은 Engine execution_options로 실어 _fetch_chunks가 읽습니다.
+    """
+    pool_kwargs = {"pool_pre_ping": True}
+    if pool_size:
+        pool_kwargs["pool_size"] = pool_size
+    if max_overflow is not None:
+        pool_kwargs["max_overflow"] = max_overflow
+    fetch_opts = fetch_tuning(cfg)
+    if fetch_opts:
+        pool_kwargs["execution_options"] = fetch_opts
+
     db_type = (cfg.get("db_type") or "").lower()
     host = cfg.get("host")
     port = cfg.get("port")
@@ -15,26 +48,58 @@ def create_engine_from_config(cfg: Dict, connect_timeout: int | None = None) ->
     if db_type.startswith("oracle"):
         # 예) oracle+oracledb://user:pw@host:1521/?service_name=ORCL
         url = f"oracle+oracledb://{user}:{pw}@{host}:{port}/?service_name={svc}"
-        engine = create_engine(url, pool_pre_ping=True)
+        engine = create_engine(url, **pool_kwargs)
     elif db_type.startswith("postgre"):
         # 예) postgresql+psycopg://user:pw@host:5432/dbname
         if connect_timeout and connect_timeout > 0:
             url = f"postgresql+psycopg://{user}:{pw}@{host}:{port}/{svc}?connect_timeout={connect_timeout}"
         else:
             url = f"postgresql+psycopg://{user}:{pw}@{host}:{port}/{svc}"
-        engine = create_engine(url, pool_pre_ping=True)
+        engine = create_engine(url, **pool_kwargs)
+    elif db_type == "sqlite":
+        # 예) service_or_db = 파일 경로 (벤치마크/로컬 테스트용), 비우면 메모리 DB
+        path = svc or ":memory:"
+        if path == ":memory:":
+            pool_kwargs = {"execution_options": fetch_opts} if fetch_opts else {}
+        engine = create_engine(f"sqlite:///{path}", **pool_kwargs)
+    elif db_type == "url":
+        # 예) {"db_type": "URL", "url": "postgresql+psycopg://user:pw@host/db"} — 임의 SQLAlchemy URL
+        url = cfg.get("url") or ""
+        if not url:
+            raise ValueError("db_type=URL에는 url 값이 필요합니다.")
+        engine = create_engine(url, **pool_kwargs)
     else:
         raise ValueError(f"지원하지 않는 DB 타입: {cfg.get('db_type')}")
 
     return engine
 
 
+def fetch_tuning(cfg: Dict) -> Dict:
+    """
+    접속 설정의 조회 튜닝 값 → execution_options (0/빈 값은 '자동'이라 넣지 않음)
+    - fetch_size: 드라이버 왕복 1회에 가져올 행 수. 자동이면 마이그레이션 chunk_size와 같게 맞춥니다.
+      (Oracle cursor.arraysize, PostgreSQL 서버측 커서 FETCH 크기)
+    - prefetch_rows: Oracle cursor.prefetchrows — execute 왕복에 함께 받아 둘 행 수. 자동이면 fetch 크기
+    """
+    out = {}
+    for key, opt in (("fetch_size", "ds_fetch_size"), ("prefetch_rows", "ds_prefetch_rows")):
+        try:
+            value = int(cfg.get(key) or 0)
+        except (TypeError, ValueError):
+            value = 0
+        if value > 0:
+            out[opt] = value
+    return out
+
+
 def test_connection(cfg: Dict, timeout: int = 3) -> Tuple[bool, str]:
     """
     입력된 cfg로 실제 연결을 시도하여 (성공 여부, 상세메시지) 반환합니다.
     - Oracle: SELECT 1 FROM DUAL
     - Postgres: SELECT 1
+    - 확인용 Engine은 공유하지 않고 끝나면 바로 정리합니다.
     """
+    engine = None
     try:
         engine = create_engine_from_config(cfg, connect_timeout=timeout)
         test_sql = text("SELECT 1")
@@ -50,25 +115,502 @@ def test_connection(cfg: Dict, timeout: int = 3) -> Tuple[bool, str]:
         return False, f"필요한 드라이버 모듈이 없습니다: {mod}\n→ pip install {suggestion}"
     except Exception as e:
         return False, f"{type(e).__name__}: {e}"
+    finally:
+        if engine is not None:
+            engine.dispose()
     
 
-def count_rows(src_engine: Engine, schema: str, table: str, where_text: str) -> int:
+def _bounded_where(where_text: str, watermark_column, watermark_after, key_column, resume_after):
+    """건수 조회용 WHERE: 워터마크 증분(wm_after)과 체크포인트 재개(resume_after) 조건을 AND로 붙입니다."""
+    params = {}
+    if watermark_column and watermark_after is not None:
+        where_text = _and_where(where_text, f"{watermark_column} > :wm_after")
+        params["wm_after"] = watermark_after
+    if key_column and resume_after is not None:
+        where_text = _and_where(where_text, f"{key_column} > :resume_after")
+        params["resume_after"] = resume_after
+    return where_text, params
+
+
+def count_rows(
+    src_engine: Engine, schema: str, table: str, where_text: str,
+    watermark_column: str | None = None, watermark_after=None,
+    key_column: str | None = None, resume_after=None,
+) -> int:
+    """원본 건수 (COUNT(*)). 재개면 resume_after 이후 남은 행만 셉니다."""
+    where_text, params = _bounded_where(where_text, watermark_column, watermark_after, key_column, resume_after)
     where_sql = f" WHERE {where_text} " if where_text.strip() else ""
     sql = text(f"SELECT COUNT(*) AS cnt FROM {schema}.{table}{where_sql}")
     with src_engine.connect() as conn:
-        r = conn.execute(sql).scalar()
+        r = conn.execute(sql, params).scalar()
         return int(r or 0)
 
 
+def estimate_rows(
+    src_engine: Engine, schema: str, table: str, where_text: str,
+    watermark_column: str | None = None, watermark_after=None,
+    key_column: str | None = None, resume_after=None,
+) -> int | None:
+    """
+    COUNT(*) 스캔 없이 대략적인 건수를 구합니다. 알 수 없으면 None.
+    - 조건 없음: 카탈로그 통계 (Oracle ALL_TABLES.NUM_ROWS / PostgreSQL pg_class.reltuples)
+    - 조건 있음: 실행 계획의 예상 행 수 (EXPLAIN)
+    통계가 없거나(미수집) 권한이 없으면 None을 돌려주고, 호출 측에서 '미확인'으로 처리합니다.
+    """
+    where_text, params = _bounded_where(where_text, watermark_column, watermark_after, key_column, resume_after)
+    dialect = src_engine.dialect.name
+    try:
+        with src_engine.connect() as conn:
+            if dialect == "oracle":
+                if not where_text.strip():
+                    r = conn.execute(
+                        text("SELECT NUM_ROWS FROM ALL_TABLES WHERE OWNER = :o AND TABLE_NAME = :t"),
+                        {"o": schema.upper(), "t": table.upper()},
+                    ).scalar()
+                    return None if r is None else int(r)
+                stmt_id = f"DS_{threading.get_ident() % 10**9}"
+                conn.execute(
+                    text(f"EXPLAIN PLAN SET STATEMENT_ID = '{stmt_id}' FOR "
+                         f"SELECT 1 FROM {schema}.{table} WHERE {where_text}"),
+                    params,
+                )
+                r = conn.execute(
+                    text("SELECT CARDINALITY FROM PLAN_TABLE WHERE STATEMENT_ID = :s AND ID = 0"),
+                    {"s": stmt_id},
+                ).scalar()
+                conn.execute(text("DELETE FROM PLAN_TABLE WHERE STATEMENT_ID = :s"), {"s": stmt_id})
+                conn.commit()
+                return None if r is None else int(r)
+            if dialect == "postgresql":
+                if not where_text.strip():
+                    r = conn.execute(
+                        text(
+                            "SELECT c.reltuples FROM pg_class c "
+                            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                            "WHERE n.nspname = lower(:s) AND c.relname = lower(:t)"
+                        ),
+                        {"s": schema, "t": table},
+                    ).scalar()
+                    # reltuples = -1 (PG14+) / 0 : ANALYZE 전
+                    return int(r) if r is not None and r > 0 else None
+                plan = conn.execute(
+                    text(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {schema}.{table} WHERE {where_text}"),
+                    params,
+                ).scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception:
+        return None
+    return None
+
+
+def has_rows(src_engine: Engine, schema: str, table: str, where_text: str) -> bool:
+    """첫 행만 확인합니다. (COUNT(*) 전체 스캔 대신 '0건 여부' 판단용)"""
+    if src_engine.dialect.name == "oracle":
+        sql = f"SELECT 1 FROM {schema}.{table} WHERE {_and_where(where_text, 'ROWNUM = 1')}"
+    else:
+        where_sql = f" WHERE {where_text} " if where_text.strip() else ""
+        sql = f"SELECT 1 FROM {schema}.{table}{where_sql} LIMIT 1"
+    with src_engine.connect() as conn:
+        return conn.execute(text(sql)).first() is not None
+
+
 def _get_columns(engine: Engine, schema: str, table: str) -> Iterable[str]:
-    insp = inspect(engine)
-    cols = [str(c["name"]).lower() for c in insp.get_columns(table, schema=schema)]
-    if not cols:
-        with engine.connect() as c:
-            r = c.execute(text(f"SELECT * FROM {schema}.{table} FETCH FIRST 1 ROWS ONLY"))
-            if r.returns_rows:
-                cols = [str(k).lower() for k in r.keys()]
-    return cols
+    """소문자 컬럼 목록 (metadata_cache 경유, TTL 내에는 리플렉션 생략)"""
+    return metadata_cache.columns(engine, schema, table)
+
+
+def _savepoint(conn):
+    """
+    PostgreSQL은 문장 하나가 실패하면 트랜잭션 전체가 중단되므로 SAVEPOINT로 감쌉니다.
+    (Oracle 등 문장 단위 롤백 DB는 그대로 진행)
+    """
+    if (conn.dialect.name or "").lower() == "postgresql":
+        return conn.begin_nested()
+    return nullcontext()
+
+
+def _pg_column_oids(cur, schema: str, table: str, cols: List[str]) -> List[int]:
+    """목적지 테이블의 컬럼 타입 OID를 cols 순서대로 반환합니다. (COPY BINARY용)"""
+    cur.execute(
+        "SELECT a.attname, a.atttypid FROM pg_attribute a "
+        "WHERE a.attrelid = %s::regclass AND a.attnum > 0 AND NOT a.attisdropped",
+        (f"{schema}.{table}",),
+    )
+    oids = {str(name).lower(): int(oid) for name, oid in cur.fetchall()}
+    return [oids[c] for c in cols]
+
+
+def _copy_chunk(
+    dst_conn,
+    dst_schema: str,
+    dst_table: str,
+    cols: List[str],
+    rows: Iterable[tuple],
+    copy_format: str = "text",
+    type_oids: List[int] | None = None,
+) -> None:
+    """
+    psycopg의 COPY ... FROM STDIN 으로 청크를 적재합니다. (PostgreSQL 전용)
+    - copy_format: "text" | "binary" (binary는 type_oids 필요)
+    """
+    raw = dst_conn.connection.driver_connection
+    opts = " (FORMAT BINARY)" if copy_format == "binary" else ""
+    sql = f"COPY {dst_schema}.{dst_table} ({', '.join(cols)}) FROM STDIN{opts}"
+    with raw.cursor() as cur:
+        with cur.copy(sql) as cp:
+            if copy_format == "binary":
+                cp.set_types(type_oids)
+            for row in rows:
+                cp.write_row(row)
+
+
+def _oracle_array_insert(dst_conn, insert_sql: str, rows: List[tuple]) -> List[Tuple[int, str]]:
+    """
+    python-oracledb executemany(batcherrors=True)로 청크 전체를 1회 왕복에 적재합니다.
+    - insert_sql: 위치 바인드(:1, :2, ...) INSERT 문
+    - 반환: 실패 행 목록 [(청크 내 0-base offset, 오류 메시지)]
+    """
+    raw = dst_conn.connection.driver_connection
+    with raw.cursor() as cur:
+        cur.executemany(insert_sql, rows, batcherrors=True)
+        return [(err.offset, err.message) for err in cur.getbatcherrors()]
+
+
+def _insert_rows_individually(dst_conn, insert_sql: str, payload: List[tuple], row_ids) -> Generator[Dict, None, None]:
+    """청크 실패 시 개별행 재시도: 성공은 progress, 실패는 error 이벤트로 건너뜁니다."""
+    for row, ridx in zip(payload, row_ids):
+        try:
+            with _savepoint(dst_conn):
+                dst_conn.exec_driver_sql(insert_sql, row)
+            yield {"type": "progress", "inserted_delta": 1}
+        except Exception as e:
+            yield {"type": "error", "row_index": ridx, "error": str(e), "row": row}
+
+
+def _insert_rows_bisect(
+    dst_conn, insert_sql: str, payload: List[tuple], row_ids, min_rows: int = 8
+) -> Generator[Dict, None, None]:
+    """
+    실패한 청크를 절반씩 나눠 배치로 재시도합니다. (불량 행 k개 → 약 k·log n 문장)
+    - 각 하위 배치는 SAVEPOINT 안에서 실행되어 바깥 트랜잭션을 오염시키지 않습니다.
+    - min_rows 이하로 줄어들면 개별행 재시도로 전환합니다.
+    """
+    if len(payload) <= max(1, min_rows):
+        yield from _insert_rows_individually(dst_conn, insert_sql, payload, row_ids)
+        return
+    mid = len(payload) // 2
+    for part, ids in ((payload[:mid], row_ids[:mid]), (payload[mid:], row_ids[mid:])):
+        try:
+            with dst_conn.begin_nested():
+                dst_conn.exec_driver_sql(insert_sql, part)
+            yield {"type": "progress", "inserted_delta": len(part)}
+        except Exception:
+            yield from _insert_rows_bisect(dst_conn, insert_sql, part, ids, min_rows)
+
+
+def _put_until(q: queue.Queue, item, stop: threading.Event) -> bool:
+    """stop이 설정될 때까지 대기열이 빌 때를 기다려 넣습니다. (중단되면 False)"""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.2)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _prefetch(factory: Callable[[], Iterable], depth: int) -> Generator:
+    """
+    factory()가 만드는 제너레이터를 백그라운드 스레드에서 앞서 실행합니다.
+    - depth: 대기열에 쌓아 둘 최대 항목 수 (백프레셔로 메모리 상한)
+    - 생산자에서 발생한 예외는 소비 측에서 그대로 다시 발생합니다.
+    - 소비 측이 닫히면 생산자도 다음 항목에서 멈추고 자원을 정리합니다.
+    """
+    if depth <= 0:
+        yield from factory()
+        return
+
+    q: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    end = object()
+
+    def _produce() -> None:
+        try:
+            gen = factory()
+            try:
+                for item in gen:
+                    if not _put_until(q, (None, item), stop):
+                        return
+            finally:
+                gen.close()
+            _put_until(q, (end, None), stop)
+        except BaseException as e:
+            _put_until(q, (e, None), stop)
+
+    t = threading.Thread(target=_produce, name="ds-prefetch", daemon=True)
+    t.start()
+    try:
+        while True:
+            tag, item = q.get()
+            if tag is end:
+                return
+            if tag is not None:
+                raise tag
+            yield item
+    finally:
+        stop.set()
+        t.join()
+
+
+def _positional_binds(dialect, n: int, start: int = 1) -> str:
+    """드라이버 paramstyle에 맞는 위치 바인드 자리표시자 n개 (튜플 executemany용, start는 :N 번호 시작)"""
+    style = getattr(dialect, "paramstyle", "named")
+    if style == "qmark":
+        return ", ".join("?" for _ in range(n))
+    if style in ("format", "pyformat"):
+        return ", ".join("%s" for _ in range(n))
+    return ", ".join(f":{i}" for i in range(start, start + n))
+
+
+def _upsert_sql(dst_engine: Engine, dst_schema: str, dst_table: str, cols: List[str], keys: List[str]) -> str:
+    """
+    위치 바인드 upsert 문 (cols 순서의 튜플 그대로 사용)
+    - Oracle: MERGE INTO ... USING (SELECT :1 AS c1, ... FROM DUAL)
+    - 그 외(PostgreSQL/SQLite): INSERT ... ON CONFLICT (keys) DO UPDATE SET c = EXCLUDED.c
+    """
+    fq = f"{dst_schema}.{dst_table}"
+    non_keys = [c for c in cols if c not in keys]
+    if (dst_engine.dialect.name or "").lower() == "oracle":
+        src_cols = ", ".join(f":{i} AS {c}" for i, c in enumerate(cols, 1))
+        on = " AND ".join(f"d.{k} = s.{k}" for k in keys)
+        sql = f"MERGE INTO {fq} d USING (SELECT {src_cols} FROM DUAL) s ON ({on})"
+        if non_keys:
+            sql += f" WHEN MATCHED THEN UPDATE SET {', '.join(f'd.{c} = s.{c}' for c in non_keys)}"
+        sql += f" WHEN NOT MATCHED THEN INSERT ({', '.join(cols)}) VALUES ({', '.join(f's.{c}' for c in cols)})"
+        return sql
+    binds = _positional_binds(dst_engine.dialect, len(cols))
+    action = (
+        f"DO UPDATE SET {', '.join(f'{c} = EXCLUDED.{c}' for c in non_keys)}" if non_keys else "DO NOTHING"
+    )
+    return f"INSERT INTO {fq} ({', '.join(cols)}) VALUES ({binds}) ON CONFLICT ({', '.join(keys)}) {action}"
+
+
+MERGE_SCOPES = ("chunk", "commit")
+STAGE_ROW_COLUMN = "ds_row"
+
+
+def _merge_stage_sql(
+    dst_engine: Engine, dst_schema: str, dst_table: str, cols: List[str], keys: List[str]
+) -> Dict[str, str | None]:
+    """
+    스테이징 테이블 경유 집합 MERGE 문장 묶음 (write_mode="merge")
+    - 스테이징: 목적지 컬럼 + 원본 row_index(ds_row). 이름은 목적지·컬럼에서 정해져 같은 테이블이면 같습니다.
+    - PostgreSQL/SQLite: 세션 TEMP 테이블 (스트림 종료 시 DROP)
+    - Oracle: ON COMMIT DELETE ROWS 전역 임시 테이블 (데이터는 세션 전용, 정의는 다음 실행에 재사용)
+    - apply: Oracle MERGE INTO ... USING 스테이징 / 그 외 INSERT ... SELECT ... ON CONFLICT DO UPDATE
+    """
+    fq = f"{dst_schema}.{dst_table}"
+    dialect = (dst_engine.dialect.name or "").lower()
+    col_list = ", ".join(cols)
+    stage = f"ds_stg_{zlib.crc32(f'{fq}:{col_list}'.encode()):08x}"
+    non_keys = [c for c in cols if c not in keys]
+    if dialect == "oracle":
+        ref = f"{dst_schema}.{stage}"
+        create = (
+            f"CREATE GLOBAL TEMPORARY TABLE {ref} ON COMMIT DELETE ROWS AS "
+            f"SELECT {col_list}, CAST(0 AS NUMBER(19)) AS {STAGE_ROW_COLUMN} FROM {fq} WHERE 1 = 0"
+        )
+        on = " AND ".join(f"d.{k} = s.{k}" for k in keys)
+        apply = f"MERGE INTO {fq} d USING {ref} s ON ({on})"
+        if non_keys:
+            apply += f" WHEN MATCHED THEN UPDATE SET {', '.join(f'd.{c} = s.{c}' for c in non_keys)}"
+        apply += f" WHEN NOT MATCHED THEN INSERT ({col_list}) VALUES ({', '.join(f's.{c}' for c in cols)})"
+        clear, drop = f"DELETE FROM {ref}", None
+    else:
+        ref = f"pg_temp.{stage}" if dialect == "postgresql" else f"temp.{stage}"
+        create = (
+            f"CREATE TEMP TABLE IF NOT EXISTS {stage} AS "
+            f"SELECT {col_list}, CAST(0 AS BIGINT) AS {STAGE_ROW_COLUMN} FROM {fq} WHERE 1 = 0"
+        )
+        action = (
+            f"DO UPDATE SET {', '.join(f'{c} = EXCLUDED.{c}' for c in non_keys)}" if non_keys else "DO NOTHING"
+        )
+        # SQLite는 INSERT ... SELECT 뒤 ON CONFLICT 구문 모호성 때문에 WHERE가 필요합니다.
+        apply = (
+            f"INSERT INTO {fq} ({col_list}) SELECT {col_list} FROM {ref} WHERE 1 = 1 "
+            f"ON CONFLICT ({', '.join(keys)}) {action}"
+        )
+        clear = f"TRUNCATE {ref}" if dialect == "postgresql" else f"DELETE FROM {ref}"
+        drop = f"DROP TABLE IF EXISTS {ref}"
+    binds = _positional_binds(dst_engine.dialect, len(cols) + 1)
+    return {
+        "schema": ref.split(".")[0], "table": stage, "create": create, "apply": apply, "clear": clear, "drop": drop,
+        "insert": f"INSERT INTO {ref} ({col_list}, {STAGE_ROW_COLUMN}) VALUES ({binds})",
+        "read": f"SELECT {col_list}, {STAGE_ROW_COLUMN} FROM {ref} ORDER BY {STAGE_ROW_COLUMN}",
+    }
+
+
+@contextmanager
+def _staging_table(conn, stage: Dict | None):
+    """
+    스테이징 테이블을 만들고 스트림이 끝나면(실패·중단 포함) 지웁니다.
+    - 만들기는 적재 트랜잭션 밖에서 (Oracle DDL은 암묵적 커밋). Oracle은 이미 있으면 그대로 사용합니다.
+    """
+    if stage is None:
+        yield
+        return
+    try:
+        with conn.begin():
+            conn.exec_driver_sql(stage["create"])
+    except Exception as e:
+        if "ORA-00955" not in str(e):
+            raise
+    try:
+        yield
+    finally:
+        if stage["drop"]:
+            if conn.in_transaction():
+                conn.rollback()
+            try:
+                with conn.begin():
+                    conn.exec_driver_sql(stage["drop"])
+            except Exception:
+                pass
+
+
+def _escape_for_binds(sql: str, dialect) -> str:
+    """format/pyformat 드라이버에 바인드 값을 넘길 때 SQL 안의 % 문자를 이스케이프합니다."""
+    if getattr(dialect, "paramstyle", "") in ("format", "pyformat"):
+        return sql.replace("%", "%%")
+    return sql
+
+
+def _fetch_chunks(
+    engine: Engine, select_sql: str, chunk_size: "int | Callable[[], int]", params: tuple | None = None,
+    output_handler: Callable | None = None, convert: Callable[[List[tuple]], List[tuple]] | None = None,
+) -> Generator[List[tuple], None, None]:
+    """
+    드라이버 커서로 직접 조회하여 fetchmany 결과(튜플 리스트)를 그대로 내보냅니다.
+    - 행마다 Row/dict를 만들지 않아 넓은 테이블에서 CPU·메모리 부담이 적습니다.
+    - PostgreSQL은 서버측(named) 커서로 스트리밍합니다.
+    - chunk_size에 함수를 주면 매 fetch마다 현재 크기를 다시 읽습니다. (AdaptiveChunkSizer)
+    - params: 드라이버 paramstyle 위치 바인드 값 (_positional_binds 참고)
+    - 왕복 크기: 접속 설정 fetch_size(없으면 청크 크기), Oracle prefetchrows는 prefetch_rows(없으면 왕복 크기)
+      드라이버 기본값(arraysize 100 등)으로 두면 원거리 링크에서 청크 1개에 수십~수백 번 왕복합니다.
+    - output_handler: Oracle outputtypehandler (converters.oracle_output_handler — LOB 인라인 조회)
+    - convert: 청크 변환 함수 (converters.row_converter). LOB 로케이터는 커서가 열려 있을 때만
+      읽을 수 있으므로 여기서 적용합니다. (프리페치 스레드에서 실행)
+    - Engine 실행 옵션 ds_cursor_wrapper: 드라이버 커서를 감싸는 함수 (벤치마크의 fetch 호출 계측용)
+    """
+    next_size = chunk_size if callable(chunk_size) else (lambda: chunk_size)
+    with engine.connect() as conn:
+        opts = conn.get_execution_options()
+        fixed_batch = opts.get("ds_fetch_size")
+        raw = conn.connection.driver_connection
+        dialect = (engine.dialect.name or "").lower()
+        cur = raw.cursor(name="ds_stream") if dialect == "postgresql" else raw.cursor()
+        if opts.get("ds_cursor_wrapper"):
+            cur = opts["ds_cursor_wrapper"](cur)
+        try:
+            batch = fixed_batch or next_size()
+            if dialect == "oracle":
+                # prefetchrows는 execute 전에 정해야 첫 왕복에 행이 함께 옵니다.
+                cur.prefetchrows = opts.get("ds_prefetch_rows") or batch
+                cur.arraysize = batch
+                if output_handler is not None:
+                    cur.outputtypehandler = output_handler
+            elif dialect == "postgresql":
+                cur.itersize = batch
+            else:
+                cur.arraysize = batch
+            if params:
+                cur.execute(select_sql, params)
+            else:
+                cur.execute(select_sql)
+            while True:
+                size = next_size()
+                if dialect == "postgresql" and fixed_batch and fixed_batch < size:
+                    # 서버측 커서는 fetchmany(n) 1회 = FETCH n 1회이므로 왕복 크기로 나눠 채웁니다.
+                    rows = []
+                    while len(rows) < size:
+                        part = cur.fetchmany(min(fixed_batch, size - len(rows)))
+                        if not part:
+                            break
+                        rows.extend(part)
+                else:
+                    if dialect == "oracle" and not fixed_batch:
+                        cur.arraysize = size
+                    rows = cur.fetchmany(size)
+                if not rows:
+                    break
+                yield convert(rows) if convert else rows
+        finally:
+            cur.close()
+
+
+def _lob_handler(engine: Engine, kinds, lob_fetch: str):
+    """Oracle 소스이고 lob_fetch="inline"일 때만 LOB 인라인 outputtypehandler"""
+    if lob_fetch not in converters.LOB_FETCH_MODES:
+        raise ValueError(f"지원하지 않는 lob_fetch: {lob_fetch} (inline / stream)")
+    if lob_fetch != "inline" or (engine.dialect.name or "").lower() != "oracle":
+        return None
+    return converters.oracle_output_handler(kinds)
+
+
+def _estimate_row_bytes(rows: List[tuple], sample: int = 32) -> int:
+    """청크에서 표본 행을 골라 행당 평균 메모리 크기(바이트)를 추정합니다."""
+    if not rows:
+        return 0
+    picked = rows[:: max(1, len(rows) // sample)][:sample]
+    total = sum(sys.getsizeof(r) + sum(sys.getsizeof(v) for v in r) for r in picked)
+    return max(1, total // len(picked))
+
+
+class AdaptiveChunkSizer:
+    """
+    청크 크기 자동 조절기
+    - 청크별 적재 시간이 target_seconds에 가까워지도록 행 수를 늘리거나 줄입니다. (1회 최대 2배/절반)
+    - 행당 추정 크기 × 행 수가 memory_budget_bytes / in_flight 를 넘지 않게 제한합니다.
+      (in_flight: 동시에 메모리에 올라갈 수 있는 청크 수 = prefetch 대기열 + 조회 중 + 적재 중)
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        *,
+        target_seconds: float = 2.0,
+        memory_budget_bytes: int = 256 * 1024 * 1024,
+        in_flight: int = 1,
+        min_rows: int = 100,
+        max_rows: int = 500_000,
+    ):
+        self.min_rows = max(1, min_rows)
+        self.max_rows = max(self.min_rows, max_rows)
+        self.target_seconds = target_seconds
+        self.chunk_budget = max(1, memory_budget_bytes // max(1, in_flight))
+        self.row_bytes = 0
+        self.size = min(max(int(initial), self.min_rows), self.max_rows)
+
+    def __call__(self) -> int:
+        return self.size
+
+    def observe(self, rows: List[tuple], seconds: float) -> bool:
+        """적재가 끝난 청크로 다음 크기를 계산합니다. 크기가 바뀌면 True"""
+        if not rows:
+            return False
+        self.row_bytes = _estimate_row_bytes(rows)
+        factor = self.target_seconds / seconds if seconds > 0 else 2.0
+        # 처리율(행/초) 기준 목표 행 수, 현재 크기 대비 절반~2배로 제한
+        wanted = int(min(self.size * 2, max(self.size / 2, len(rows) * factor)))
+        cap = max(self.min_rows, self.chunk_budget // self.row_bytes)
+        new_size = min(max(wanted, self.min_rows), self.max_rows, cap)
+        # 10% 미만 변화는 무시하여 크기가 흔들리지 않게 함
+        if abs(new_size - self.size) < self.size * 0.1:
+            return False
+        self.size = new_size
+        return True
 
 
 def run_migration_stream(
@@ -81,12 +623,69 @@ def run_migration_stream(
     dst_table: str,
     where_text: str = "",
     chunk_size: int = 10_000,
+    load_mode: str = "insert",
+    copy_format: str = "text",
+    retry_mode: str = "bisect",
+    bisect_min_rows: int = 8,
+    prefetch_chunks: int = 2,
+    adaptive_chunks: bool = False,
+    target_chunk_seconds: float = 2.0,
+    memory_budget_mb: int = 256,
+    key_column: str | None = None,
+    resume_after=None,
+    row_offset: int = 0,
+    commit_every: int = 0,
+    watermark_column: str | None = None,
+    watermark_after=None,
+    write_mode: str = "insert",
+    merge_keys: List[str] | None = None,
+    merge_scope: str = "chunk",
+    reject_sink: RejectWriter | None = None,
+    max_errors: int = 0,
+    metrics: bool = False,
+    lob_fetch: str = "inline",
+    lob_chunk_rows: int = 1_000,
 ) -> Generator[Dict, None, None]:
+    """
+    Origin을 스트리밍 조회하여 Destination에 청크 단위로 적재하며 이벤트를 내보냅니다.
+    - 행은 드라이버 fetchmany 튜플 그대로 위치 바인드 executemany에 전달됩니다. (행별 dict 없음)
+    - load_mode: "insert"(executemany) | "copy"(PostgreSQL COPY FROM STDIN)
+    - copy_format: COPY 사용 시 "text" | "binary"
+    - Oracle 목적지는 executemany(batcherrors=True)로 실패 행만 골라 error 이벤트로 보고합니다.
+    - 그 외 청크 적재 실패 시 retry_mode에 따라 재시도 후 실패 행은 error 이벤트로 건너뜁니다.
+      "bisect": 절반씩 나눠 배치 재시도, bisect_min_rows 이하에서 개별행 / "row": 바로 개별행
+    - prefetch_chunks: 적재 중에 소스에서 미리 읽어 둘 최대 청크 수 (0이면 조회/적재를 번갈아 수행)
+    - adaptive_chunks: chunk_size를 시작값으로, 적재 시간이 target_chunk_seconds에 맞도록 조절하며
+      memory_budget_mb(진행 중인 청크 전체)를 넘지 않게 합니다. 바뀐 크기는 log 이벤트로 보고합니다.
+    - key_column: 소스를 이 키 순으로 조회합니다. resume_after가 있으면 그 키 다음부터 조회하며,
+      row_offset은 이어서 매길 row_index 시작값입니다.
+    - commit_every: N 청크마다 커밋하고 {"type": "checkpoint", "key_column", "last_key", "rows"}
+      이벤트를 내보냅니다. (0이면 테이블 전체를 한 트랜잭션으로 적재)
+    - watermark_column: 증분 동기화 기준 컬럼. watermark_after가 있으면 그 값 초과 행만 조회하며,
+      정상 종료 시 적재된 행(실패 행 제외)의 최대값을 {"type": "watermark", "column", "value"} 이벤트로 내보냅니다.
+    - write_mode: "insert" | "upsert"(merge_keys 기준 MERGE / ON CONFLICT DO UPDATE, 행 단위 바인드)
+      | "merge"(청크를 임시 스테이징 테이블에 적재한 뒤 집합 MERGE / INSERT ... SELECT ... ON CONFLICT 1회)
+    - merge_scope: merge 모드의 반영 단위 "chunk"(청크마다) | "commit"(커밋 직전에 한 번, commit_every=0이면 테이블 전체)
+      집합 문장이 실패하면(키 중복 등) 해당 행들을 행 단위 upsert로 retry_mode에 따라 재시도합니다.
+    - reject_sink: 실패 행의 원본 값을 파일로 보관 (RejectWriter, 백그라운드 기록)
+    - max_errors: 실패 행이 이 수를 넘으면 커밋하지 않은 청크를 버리고 RejectLimitExceeded (0이면 무제한)
+    - metrics: 청크마다 {"type": "metrics", "scope": "chunk"} (fetch/wait/transform/write/commit 초, 행·바이트 수),
+      끝에 {"type": "metrics", "scope": "table"} 합계를 내보냅니다. (data_shuttle.metrics 참고, 기본 꺼짐)
+    - lob_fetch: "inline"(Oracle LOB를 fetch 왕복 안에서 문자열/바이트로) | "stream"(로케이터를 조각 단위로 읽기)
+    - lob_chunk_rows: CLOB/BLOB 컬럼이 있는 테이블의 고정 청크 크기 상한 (0이면 제한 없음)
+    """
     cols = _get_columns(src_engine, src_schema, src_table)
     if not cols:
         yield {"type": "log", "message": f"[경고] 열 정보를 가져오지 못했습니다: {src_schema}.{src_table}"}
         return
 
+    # 컬럼 타입별 변환기는 테이블마다 1회 (metadata_cache)
+    kinds = converters.column_kinds(src_engine, src_schema, src_table, cols)
+    capped = converters.lob_chunk_size(chunk_size, kinds, lob_chunk_rows)
+    if capped != chunk_size:
+        yield {"type": "log", "message": f"[LOB] {src_schema}.{src_table}: 청크 크기 {chunk_size} → {capped}행"}
+        chunk_size = capped
+
     where_sql = f" WHERE {where_text} " if where_text.strip() else ""
 
     # DB별 SELECT 컬럼 표현(소스)
@@ -96,49 +695,602 @@ def run_migration_stream(
     else:
         select_cols = ", ".join(f'"{c}" AS "{c}"' for c in cols)
 
-    # INSERT(목적지): 기본은 따옴표 없이 소문자
+    def col_index(name: str) -> int | None:
+        c = (name or "").strip().lower()
+        return cols.index(c) if c in cols else None
+
+    def col_expr(i: int) -> str:
+        return cols[i].upper() if src_dialect == "oracle" else f'"{cols[i]}"'
+
+    # 사용자 WHERE 뒤에 AND로 붙는 바인드 조건: [(컬럼 위치, 초과 기준값)]
+    bound_conds = []
+    key_idx = None
+    if key_column:
+        key_idx = col_index(key_column)
+        if key_idx is None:
+            yield {"type": "log", "message": f"[경고] 키 컬럼을 찾지 못했습니다: {src_schema}.{src_table}.{key_column}"}
+            return
+        if resume_after is not None:
+            bound_conds.append((key_idx, resume_after))
+    wm_idx = None
+    if watermark_column:
+        wm_idx = col_index(watermark_column)
+        if wm_idx is None:
+            yield {"type": "log", "message": f"[경고] 워터마크 컬럼을 찾지 못했습니다: {src_schema}.{src_table}.{watermark_column}"}
+            return
+        if watermark_after is not None:
+            bound_conds.append((wm_idx, watermark_after))
+
+    select_sql = f"SELECT {select_cols} FROM {src_schema}.{src_table}{where_sql}"
+    select_params = None
+    if bound_conds:
+        # (사용자 WHERE) AND key > :1 AND watermark > :2
+        prefix = f" WHERE ({where_text}) AND " if where_text.strip() else " WHERE "
+        select_sql = _escape_for_binds(
+            f"SELECT {select_cols} FROM {src_schema}.{src_table}{prefix}", src_engine.dialect
+        ) + " AND ".join(
+            f"{col_expr(i)} > {_positional_binds(src_engine.dialect, 1, start=n)}"
+            for n, (i, _) in enumerate(bound_conds, 1)
+        )
+        select_params = tuple(v for _, v in bound_conds)
+    if key_idx is not None:
+        select_sql += f" ORDER BY {col_expr(key_idx)}"
+
+    # 워터마크 최대값은 적재된 행만: 청크의 실패 행(error 이벤트)이 모두 나온 뒤 확정합니다.
+    # (merge_scope="commit"이면 실패가 커밋 직전 MERGE에서 나오므로 커밋 때까지 보류)
+    wm_max = watermark_after
+    wm_pending: List[Tuple[int, list]] = []
+    rejected = set()
+    next_row = row_offset
+    defer_wm = write_mode == "merge" and merge_scope == "commit"
+
+    def settle_watermark():
+        nonlocal wm_max
+        for start, values in wm_pending:
+            written = (v for off, v in enumerate(values) if start + off not in rejected) if rejected else values
+            chunk_max = max((v for v in written if v is not None), default=None)
+            if chunk_max is not None and (wm_max is None or chunk_max > wm_max):
+                wm_max = chunk_max
+        wm_pending.clear()
+        rejected.clear()
+
+    def on_chunk(payload):
+        nonlocal next_row
+        if wm_idx is not None:
+            if not defer_wm:
+                settle_watermark()
+            wm_pending.append((next_row + 1, [r[wm_idx] for r in payload]))
+            next_row += len(payload)
+
+    def on_commit(payload, row_index):
+        settle_watermark()
+        if key_idx is not None:
+            last_key = payload[-1][key_idx]
+            yield {"type": "checkpoint", "key_column": key_column, "last_key": last_key, "rows": row_index}
+            yield {"type": "log", "message": f"[커밋] {row_index}행까지 커밋 (마지막 키: {last_key})"}
+        else:
+            yield {"type": "log", "message": f"[커밋] {row_index}행까지 커밋"}
+
+    for ev in load_chunk_stream(
+        dst_engine,
+        partial(
+            _fetch_chunks, src_engine, select_sql, params=select_params,
+            output_handler=_lob_handler(src_engine, kinds, lob_fetch),
+            convert=converters.row_converter(kinds, "load"),
+        ),
+        dst_schema=dst_schema, dst_table=dst_table, cols=cols,
+        chunk_size=chunk_size, load_mode=load_mode, copy_format=copy_format,
+        retry_mode=retry_mode, bisect_min_rows=bisect_min_rows, prefetch_chunks=prefetch_chunks,
+        adaptive_chunks=adaptive_chunks, target_chunk_seconds=target_chunk_seconds,
+        memory_budget_mb=memory_budget_mb, row_offset=row_offset, commit_every=commit_every,
+        write_mode=write_mode, merge_keys=merge_keys, merge_scope=merge_scope,
+        reject_sink=reject_sink, max_errors=max_errors,
+        reject_table=f"{src_schema}.{src_table}".upper(), on_chunk=on_chunk, on_commit=on_commit,
+        metrics=metrics,
+    ):
+        if ev["type"] == "error" and wm_idx is not None:
+            rejected.add(ev["row_index"])
+        yield ev
+
+    settle_watermark()
+    if wm_idx is not None and wm_max is not None:
+        yield {"type": "watermark", "column": watermark_column, "value": wm_max}
+
+
+def load_chunk_stream(
+    dst_engine: Engine,
+    source: Callable[..., Iterable[List[tuple]]],
+    *,
+    dst_schema: str,
+    dst_table: str,
+    cols: List[str],
+    chunk_size: int = 10_000,
+    load_mode: str = "insert",
+    copy_format: str = "text",
+    retry_mode: str = "bisect",
+    bisect_min_rows: int = 8,
+    prefetch_chunks: int = 2,
+    adaptive_chunks: bool = False,
+    target_chunk_seconds: float = 2.0,
+    memory_budget_mb: int = 256,
+    row_offset: int = 0,
+    commit_every: int = 0,
+    write_mode: str = "insert",
+    merge_keys: List[str] | None = None,
+    merge_scope: str = "chunk",
+    reject_sink: RejectWriter | None = None,
+    max_errors: int = 0,
+    reject_table: str | None = None,
+    on_chunk: Callable[[List[tuple]], None] | None = None,
+    on_commit: Callable[[List[tuple], int], Iterable[Dict]] | None = None,
+    metrics: bool = False,
+) -> Generator[Dict, None, None]:
+    """
+    청크(튜플 리스트) 스트림을 Destination에 적재하며 이벤트를 내보냅니다. (DB→DB, 파일→DB 공용)
+    - source(chunk_size): 청크를 내보내는 이터러블을 만드는 함수. chunk_size는 정수 또는 호출 시
+      현재 크기를 돌려주는 함수(adaptive_chunks)입니다. prefetch_chunks > 0이면 별도 스레드에서 실행됩니다.
+    - cols: 청크 튜플의 컬럼 순서 (목적지 컬럼명, 소문자)
+    - on_chunk(payload): 적재 전에 청크마다 호출 / on_commit(payload, row_index): 중간 커밋 직후 추가 이벤트
+    - 그 밖의 인자는 run_migration_stream과 같습니다.
+    """
+    dst_table_label = f"{dst_schema}.{dst_table}"
+    reject_table = reject_table or dst_table_label.upper()
+
+    # INSERT(목적지): 기본은 따옴표 없이 소문자, 튜플 그대로 위치 바인드
     insert_cols = ", ".join(cols)
-    binds = ", ".join(f":{c}" for c in cols)
+    binds = _positional_binds(dst_engine.dialect, len(cols))
 
-    select_sql = text(f"SELECT {select_cols} FROM {src_schema}.{src_table}{where_sql}")
-    insert_sql = text(f"INSERT INTO {dst_schema}.{dst_table} ({insert_cols}) VALUES ({binds})")
+    # 같은 테이블·컬럼이면 이전 실행과 동일한 문장을 재사용 (드라이버/서버 문장 캐시 적중)
+    dst_key = metadata_cache.statement_key(dst_engine, dst_schema, dst_table)
+    insert_sql = metadata_cache.statement(
+        (*dst_key, "insert", tuple(cols)),
+        lambda: f"INSERT INTO {dst_schema}.{dst_table} ({insert_cols}) VALUES ({binds})",
+    )
+    stage = None
+    if write_mode in ("upsert", "merge"):
+        keys = [k.strip().lower() for k in (merge_keys or []) if k.strip()]
+        if not keys or any(k not in cols for k in keys):
+            yield {"type": "log", "message": f"[경고] {write_mode} 키 컬럼이 올바르지 않습니다: {merge_keys}"}
+            return
+        # merge 모드도 청크 실패 시 재시도는 행 단위 upsert 문으로 합니다.
+        insert_sql = metadata_cache.statement(
+            (*dst_key, "upsert", tuple(cols), tuple(keys)),
+            lambda: _upsert_sql(dst_engine, dst_schema, dst_table, cols, keys),
+        )
+        if write_mode == "merge":
+            stage = metadata_cache.statement(
+                (*dst_key, "merge_stage", tuple(cols), tuple(keys)),
+                lambda: _merge_stage_sql(dst_engine, dst_schema, dst_table, cols, keys),
+            )
+            if merge_scope not in MERGE_SCOPES:
+                yield {"type": "log", "message": f"[주의] 알 수 없는 merge_scope: {merge_scope} → chunk로 진행"}
+                merge_scope = "chunk"
+        elif load_mode == "copy":
+            yield {"type": "log", "message": "[주의] upsert는 COPY로 적재할 수 없습니다 → INSERT ... 로 진행"}
+            load_mode = "insert"
 
-    inserted = 0
-    row_index = 0
+    use_copy = load_mode == "copy"
+    dst_dialect = (dst_engine.dialect.name or "").lower()
+    # 위치 바인드는 SQLAlchemy bind processor를 거치지 않으므로 드라이버가 못 받는 값만 변환
+    bind = None if use_copy else converters.bind_converter(dst_engine)
+    if use_copy and dst_dialect != "postgresql":
+        yield {"type": "log", "message": "[주의] COPY 적재는 PostgreSQL 목적지에서만 지원됩니다 → INSERT로 진행"}
+        use_copy = False
+    type_oids = None
 
-    with src_engine.connect() as src_conn, dst_engine.begin() as dst_tx:
-        result = src_conn.execution_options(stream_results=True).execute(select_sql)
-        while True:
-            rows = result.fetchmany(chunk_size)
-            if not rows:
-                break
-            payload = []
-            for r in rows:
-                row_index += 1
-                try:
-                    m = r._mapping
-                    payload.append({c: m.get(c) for c in cols})
-                except Exception as e:
-                    yield {"type": "error", "row_index": row_index, "error": str(e)}
-                    continue
+    # Oracle 목적지: 배열 DML(batcherrors)로 불량 행이 있어도 청크당 1회 왕복 (merge는 스테이징 경유)
+    use_batcherrors = dst_dialect == "oracle" and not use_copy and stage is None
+
+    retry_label = "이분 재시도" if retry_mode == "bisect" else "개별행 재시도"
+
+    with dst_engine.connect() as dst_tx, _staging_table(dst_tx, stage):
+        tx = dst_tx.begin()
+
+        def retry_rows(part, ids):
+            if retry_mode == "bisect":
+                return _insert_rows_bisect(dst_tx, insert_sql, part, ids, bisect_min_rows)
+            return _insert_rows_individually(dst_tx, insert_sql, part, ids)
+
+        sizer = None
+        if adaptive_chunks:
+            sizer = AdaptiveChunkSizer(
+                chunk_size,
+                target_seconds=target_chunk_seconds,
+                memory_budget_bytes=memory_budget_mb * 1024 * 1024,
+                in_flight=max(0, prefetch_chunks) + 2,
+            )
 
-            if not payload:
-                continue
+        def tune(payload, started):
+            if not sizer:
+                return
+            prev, elapsed = sizer.size, time.perf_counter() - started
+            if sizer.observe(payload, elapsed):
+                yield {"type": "log", "message": (
+                    f"[청크 크기] {prev} → {sizer.size}행 "
+                    f"(행당 약 {sizer.row_bytes}B, {len(payload)}행 적재 {elapsed:.2f}s)"
+                )}
 
+        def copy_rows(schema, table, copy_cols, rows, extra_oids=()):
+            nonlocal type_oids
+            if copy_format == "binary" and type_oids is None:
+                def _load_oids():
+                    with dst_tx.connection.driver_connection.cursor() as cur:
+                        return _pg_column_oids(cur, dst_schema, dst_table, cols)
+                type_oids = metadata_cache.statement((*dst_key, "pg_oids", tuple(cols)), _load_oids)
+            _copy_chunk(
+                dst_tx, schema, table, copy_cols, rows,
+                copy_format=copy_format, type_oids=type_oids and [*type_oids, *extra_oids],
+            )
+
+        # merge_scope="commit": 스테이징에 쌓인 행 수 (커밋 직전에 한 번에 MERGE)
+        staged = 0
+
+        def merge_chunk(payload, row_ids):
+            """청크를 스테이징에 적재하고 (chunk 범위면) 집합 MERGE 1회로 반영합니다."""
+            nonlocal staged
+            started = time.perf_counter()
+            rows = [(*r, i) for r, i in zip(payload, row_ids)]
             try:
-                dst_tx.execute(insert_sql, payload)
-                inserted += len(payload)
+                with dst_tx.begin_nested():
+                    if use_copy:
+                        # ds_row는 BIGINT (OID 20)
+                        copy_rows(stage["schema"], stage["table"], [*cols, STAGE_ROW_COLUMN], rows, (20,))
+                    else:
+                        dst_tx.exec_driver_sql(stage["insert"], rows)
+                    if merge_scope == "chunk":
+                        dst_tx.exec_driver_sql(stage["apply"])
+                        dst_tx.exec_driver_sql(stage["clear"])
+            except Exception as e:
+                yield {"type": "log", "message": f"[주의] 스테이징 MERGE 실패 → 행 단위 upsert {retry_label}: {e}"}
+                yield from retry_rows(payload, row_ids)
+                return
+            if merge_scope == "chunk":
                 yield {"type": "progress", "inserted_delta": len(payload)}
-                yield {"type": "log", "message": f"[청크] {len(payload)}건 삽입 성공 → {dst_schema}.{dst_table}"}
+                yield {"type": "log", "message": f"[청크] {len(payload)}건 MERGE 성공 (스테이징 경유) → {dst_table_label}"}
+            else:
+                staged += len(payload)
+                yield {"type": "log", "message": f"[청크] {len(payload)}건 스테이징 적재 (커밋 전 MERGE 대기 {staged}건)"}
+            yield from tune(payload, started)
+
+        def apply_staged():
+            """merge_scope="commit": 쌓인 스테이징 행을 집합 MERGE 1회로 반영 (실패 시 행 단위 재시도)"""
+            nonlocal staged
+            if not staged:
+                return
+            n, staged = staged, 0
+            try:
+                with dst_tx.begin_nested():
+                    dst_tx.exec_driver_sql(stage["apply"])
+                    dst_tx.exec_driver_sql(stage["clear"])
             except Exception as e:
-                yield {"type": "log", "message": f"[주의] 청크 삽입 실패 → 개별행 재시도: {e}"}
-                for idx, row in enumerate(payload, 1):
-                    try:
-                        dst_tx.execute(insert_sql, [row])
-                        inserted += 1
-                        yield {"type": "progress", "inserted_delta": 1}
-                    except Exception as e2:
-                        yield {"type": "error", "row_index": row_index - len(payload) + idx, "error": str(e2)}
+                yield {"type": "log", "message": f"[주의] 스테이징 MERGE 실패({n}건) → 행 단위 upsert {retry_label}: {e}"}
+                rows = dst_tx.exec_driver_sql(stage["read"]).fetchall()
+                dst_tx.exec_driver_sql(stage["clear"])
+                yield from retry_rows([tuple(r[:-1]) for r in rows], [int(r[-1]) for r in rows])
+                return
+            yield {"type": "progress", "inserted_delta": n}
+            yield {"type": "log", "message": f"[MERGE] 스테이징 {n}건 반영 → {dst_table_label}"}
+
+        def load_chunk(payload, row_ids):
+            if stage is not None:
+                yield from merge_chunk(payload, row_ids)
+                return
+            started = time.perf_counter()
+            if use_batcherrors:
+                try:
+                    failed = _oracle_array_insert(dst_tx, insert_sql, payload)
+                except Exception as e:
+                    yield {"type": "log", "message": f"[주의] 배열 DML 실패 → {retry_label}: {e}"}
+                    yield from retry_rows(payload, row_ids)
+                    return
+                ok = len(payload) - len(failed)
+                if ok:
+                    yield {"type": "progress", "inserted_delta": ok}
+                yield {"type": "log", "message": f"[청크] {ok}건 삽입 성공 (실패 {len(failed)}건) → {dst_schema}.{dst_table}"}
+                for offset, msg in failed:
+                    yield {"type": "error", "row_index": row_ids[offset], "error": msg, "row": payload[offset]}
+                yield from tune(payload, started)
+                return
+
+            try:
+                # 청크 실패 시 일부 행만 반영되는 드라이버가 있으므로 항상 SAVEPOINT로 감쌉니다.
+                with dst_tx.begin_nested():
+                    if use_copy:
+                        copy_rows(dst_schema, dst_table, cols, payload)
+                    else:
+                        dst_tx.exec_driver_sql(insert_sql, payload)
+            except Exception as e:
+                yield {"type": "log", "message": f"[주의] 청크 삽입 실패 → {retry_label}: {e}"}
+                yield from retry_rows(payload, row_ids)
+                return
+            yield {"type": "progress", "inserted_delta": len(payload)}
+            verb = "COPY" if use_copy else "삽입"
+            yield {"type": "log", "message": f"[청크] {len(payload)}건 {verb} 성공 → {dst_schema}.{dst_table}"}
+            yield from tune(payload, started)
+
+        # 소스 조회/파싱은 별도 스레드에서 최대 prefetch_chunks개 청크까지 미리 진행
+        row_index = row_offset
+        pending_chunks = 0
+        error_count = 0
+        factory = partial(source, sizer or chunk_size)
+        # 계측(metrics)은 켰을 때만: 조회 시간은 프리페치 스레드에서, 나머지는 여기서 잽니다.
+        meter = LoadMeter(dst_table_label, reject_table, fetch_inline=prefetch_chunks <= 0) if metrics else None
+
+        def emit(events, timed=True):
+            """적재 이벤트 전달: 실패 행은 거부 파일에 기록하고 max_errors를 넘으면 중단"""
+            nonlocal error_count
+            for ev in events:
+                if meter and timed:
+                    meter.lap("write")
+                if ev["type"] == "progress" and meter:
+                    meter.count(written=ev["inserted_delta"])
+                if ev["type"] == "error":
+                    row = ev.pop("row", None)
+                    error_count += 1
+                    if meter:
+                        meter.count(rejected=1)
+                    if reject_sink is not None:
+                        reject_sink.write(reject_table, cols, ev["row_index"], row, ev["error"])
+                yield ev
+                if meter and timed:
+                    meter.skip()
+            if meter and timed:
+                meter.lap("write")
+            if max_errors and error_count > max_errors:
+                raise RejectLimitExceeded(
+                    f"실패 행 {error_count}건이 허용치({max_errors})를 넘어 {dst_table_label} 적재를 중단합니다."
+                )
+
+        for item in _prefetch(partial(timed_chunks, factory) if meter else factory, prefetch_chunks):
+            if meter:
+                payload, fetch_s = item
+                meter.begin(len(payload), _estimate_row_bytes(payload) * len(payload), fetch_s)
+            else:
+                payload = item
+            row_ids = range(row_index + 1, row_index + len(payload) + 1)
+            row_index += len(payload)
+            if on_chunk is not None:
+                on_chunk(payload)
+            if bind is not None:
+                payload = bind(payload)
+            if meter:
+                meter.lap("transform")
+            yield from emit(load_chunk(payload, row_ids))
+
+            pending_chunks += 1
+            if commit_every and pending_chunks >= commit_every:
+                yield from emit(apply_staged())
+                tx.commit()
+                tx = dst_tx.begin()
+                pending_chunks = 0
+                if meter:
+                    meter.lap("commit")
+                if on_commit is not None:
+                    yield from on_commit(payload, row_index)
+                else:
+                    yield {"type": "log", "message": f"[커밋] {row_index}행까지 커밋"}
+            if meter:
+                yield meter.end()
+                meter.skip()
+        if meter:
+            meter.skip()
+        # 마지막 스테이징 MERGE 시간은 최종 커밋에 포함됩니다.
+        yield from emit(apply_staged(), timed=False)
+        tx.commit()
+        if meter:
+            yield meter.summary()
+
+
+def merge_event_streams(
+    jobs: List[Tuple[object, Callable[[], Iterable[Dict]]]],
+    max_workers: int = 4,
+) -> Generator[Tuple[object, Dict], None, None]:
+    """
+    여러 이벤트 제너레이터를 스레드 풀에서 동시에 실행하고 하나의 스트림으로 합칩니다.
+    - jobs: [(key, 제너레이터 생성 함수)] — 앞쪽 job부터 워커에 배정됩니다.
+    - 반환: (key, event). job 종료 시 {"type": "job_done"}, 예외 시 {"type": "job_error", "error": 문자열, "exception": 예외}
+    - 소비 측에서 제너레이터를 닫으면 실행 중인 job도 다음 이벤트에서 중단됩니다.
+    """
+    q: "queue.Queue[Tuple[object, Dict]]" = queue.Queue(maxsize=max(1, max_workers) * 64)
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        return _put_until(q, item, stop)
+
+    def _run(key, factory) -> None:
+        try:
+            gen = factory()
+            try:
+                for ev in gen:
+                    if not _put((key, ev)):
+                        return
+            finally:
+                close = getattr(gen, "close", None)
+                if close:
+                    close()
+            _put((key, {"type": "job_done"}))
+        except Exception as e:
+            _put((key, {"type": "job_error", "error": str(e), "exception": e}))
+
+    pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="ds-job")
+    futures = [pool.submit(_run, key, factory) for key, factory in jobs]
+    remaining = len(futures)
+    try:
+        while remaining:
+            key, ev = q.get()
+            if ev.get("type") in ("job_done", "job_error"):
+                remaining -= 1
+            yield key, ev
+    finally:
+        stop.set()
+        for f in futures:
+            f.cancel()
+        pool.shutdown(wait=True)
+
+
+def _and_where(where_text: str, predicate: str) -> str:
+    """사용자 WHERE와 추가 조건을 AND로 결합합니다. (WHERE 키워드 제외)"""
+    if not predicate:
+        return where_text
+    if not where_text.strip():
+        return predicate
+    return f"({where_text}) AND ({predicate})"
+
+
+def plan_table_slices(
+    src_engine: Engine,
+    schema: str,
+    table: str,
+    where_text: str,
+    *,
+    split_mode: str,
+    split_count: int,
+    key_column: str | None = None,
+) -> List[str]:
+    """
+    한 테이블을 서로 겹치지 않는 split_count개 조각으로 나누는 조건식 목록을 반환합니다.
+    - "pk"   : 숫자형 key_column의 MIN~MAX 구간 균등 분할 (NULL 키는 첫 조각)
+    - "hash" : ORA_HASH / hashtext 모듈로 버킷 (key_column 없으면 ROWID / ctid)
+    - "rowid": Oracle ROWID 구간 (NTILE, DBMS_PARALLEL_EXECUTE 방식)
+    - "ctid" : PostgreSQL 블록(ctid) 구간
+    각 조건은 호출 측에서 사용자 WHERE와 AND로 결합합니다.
+    """
+    n = max(1, int(split_count))
+    if n == 1:
+        return [""]
+    dialect = (src_engine.dialect.name or "").lower()
+    fq = f"{schema}.{table}"
+    where_sql = f" WHERE {where_text} " if where_text.strip() else ""
+
+    if split_mode == "hash":
+        if dialect == "oracle":
+            expr = key_column or "ROWID"
+            return [f"ORA_HASH({expr}, {n - 1}) = {i}" for i in range(n)]
+        if dialect == "postgresql":
+            expr = key_column or "ctid"
+            return [f"(hashtext(({expr})::text) & 2147483647) % {n} = {i}" for i in range(n)]
+        raise ValueError(f"hash 분할을 지원하지 않는 DB: {dialect}")
+
+    if split_mode == "pk":
+        if not key_column:
+            raise ValueError("pk 분할에는 key_column이 필요합니다.")
+        with src_engine.connect() as c:
+            lo, hi = c.execute(text(f"SELECT MIN({key_column}), MAX({key_column}) FROM {fq}{where_sql}")).one()
+        if lo is None:
+            return [""]
+        if not isinstance(lo, (int, float)) and not hasattr(lo, "to_integral_value"):
+            raise ValueError(f"pk 분할은 숫자형 키만 지원합니다: {key_column}")
+        lo, hi = int(lo), int(hi)
+        step = max(1, (hi - lo + 1) // n)
+        bounds = sorted({lo + step * i for i in range(1, n)} - {lo})
+        return _range_predicates(key_column, [str(b) for b in bounds], null_first=True)
+
+    if split_mode == "rowid":
+        if dialect != "oracle":
+            raise ValueError("rowid 분할은 Oracle 소스에서만 지원합니다.")
+        sql = text(
+            "SELECT ROWIDTOCHAR(MAX(rid)) FROM ("
+            f"SELECT ROWID AS rid, NTILE({n}) OVER (ORDER BY ROWID) AS nt FROM {fq}{where_sql}"
+            ") GROUP BY nt ORDER BY nt"
+        )
+        with src_engine.connect() as c:
+            uppers = [r[0] for r in c.execute(sql)][:-1]
+        return _range_predicates("ROWID", [f"CHARTOROWID('{u}')" for u in uppers], inclusive_upper=True)
+
+    if split_mode == "ctid":
+        if dialect != "postgresql":
+            raise ValueError("ctid 분할은 PostgreSQL 소스에서만 지원합니다.")
+        sql = text("SELECT pg_relation_size(CAST(:t AS regclass)) / current_setting('block_size')::int")
+        with src_engine.connect() as c:
+            blocks = int(c.execute(sql, {"t": fq}).scalar() or 0)
+        step = max(1, -(-blocks // n))
+        bounds = [step * i for i in range(1, n) if step * i < blocks]
+        return _range_predicates("ctid", [f"'({b},0)'::tid" for b in bounds])
+
+    raise ValueError(f"지원하지 않는 분할 방식: {split_mode}")
+
+
+def _range_predicates(
+    expr: str, bounds: List[str], *, inclusive_upper: bool = False, null_first: bool = False
+) -> List[str]:
+    """경계값 목록으로 빈틈 없는 연속 구간 조건식을 만듭니다."""
+    if not bounds:
+        return [""]
+    lt, ge = ("<=", ">") if inclusive_upper else ("<", ">=")
+    preds = [f"{expr} {lt} {bounds[0]}"]
+    for prev, cur in zip(bounds, bounds[1:]):
+        preds.append(f"{expr} {ge} {prev} AND {expr} {lt} {cur}")
+    preds.append(f"{expr} {ge} {bounds[-1]}")
+    if null_first:
+        preds[0] = f"({preds[0]} OR {expr} IS NULL)"
+    return preds
+
+
+class SplitSliceError(RuntimeError):
+    """분할 적재에서 조각이 하나 이상 실패했을 때 (다른 조각은 끝까지 진행한 뒤) 발생합니다."""
+
+
+def run_migration_split(
+    src_engine: Engine,
+    dst_engine: Engine,
+    *,
+    src_schema: str,
+    src_table: str,
+    dst_schema: str,
+    dst_table: str,
+    where_text: str = "",
+    split_mode: str = "hash",
+    split_count: int = 4,
+    key_column: str | None = None,
+    **stream_kwargs,
+) -> Generator[Dict, None, None]:
+    """
+    한 테이블을 split_count개 조각으로 나눠 동시에 run_migration_stream을 실행합니다.
+    - 사용자 WHERE는 모든 조각 조건에 AND로 결합됩니다.
+    - progress는 그대로 합산되어 테이블 단위 누적에 반영됩니다.
+    - 조각마다 별도 커넥션/트랜잭션을 사용하며, error의 row_index는 조각 내 순번입니다.
+    - 실패한 조각이 있으면 나머지 조각이 끝난 뒤 SplitSliceError로 모아서 알립니다.
+      (테이블이 실패로 남아 체크포인트/워터마크가 앞으로 가지 않음)
+    """
+    preds = plan_table_slices(
+        src_engine, src_schema, src_table, where_text,
+        split_mode=split_mode, split_count=split_count, key_column=key_column,
+    )
+    if len(preds) <= 1:
+        yield from run_migration_stream(
+            src_engine, dst_engine,
+            src_schema=src_schema, src_table=src_table, dst_schema=dst_schema, dst_table=dst_table,
+            where_text=where_text, **stream_kwargs,
+        )
+        return
+
+    yield {"type": "log", "message": f"[분할] {src_schema}.{src_table}: {split_mode} 방식 {len(preds)}개 조각으로 병렬 처리"}
+    jobs = [
+        (i, partial(
+            run_migration_stream, src_engine, dst_engine,
+            src_schema=src_schema, src_table=src_table, dst_schema=dst_schema, dst_table=dst_table,
+            where_text=_and_where(where_text, pred), **stream_kwargs,
+        ))
+        for i, pred in enumerate(preds)
+    ]
+    failed = []
+    for i, ev in merge_event_streams(jobs, max_workers=len(jobs)):
+        tag = f"[조각 {i + 1}/{len(preds)}]"
+        et = ev.get("type")
+        if et == "log":
+            yield {**ev, "message": f"{tag} {ev['message']}"}
+        elif et == "error":
+            yield {**ev, "error": f"{tag} {ev.get('error', '')}"}
+        elif et == "job_error":
+            failed.append(f"{tag} {ev.get('error', '')}")
+            yield {"type": "log", "message": f"[오류] {tag} 조각 실패 ({preds[i]}): {ev.get('error', '')}"}
+        elif et != "job_done":
+            yield ev
+    if failed:
+        raise SplitSliceError(
+            f"{src_schema}.{src_table}: 조각 {len(failed)}/{len(preds)}개 실패 — " + "; ".join(failed)
+        )
+
 
 def export_origin_to_csv(
     engine: Engine,
@@ -149,15 +1301,32 @@ def export_origin_to_csv(
     chunk_size: int = 10_000,
     encoding: str = "utf-8-sig",
     newline_opt: str = "",
+    compression: str | None = None,
+    part_max_bytes: int = 0,
+    buffer_bytes: int = 4 << 20,
+    files: List[str] | None = None,
+    on_metrics: Callable[[Dict], None] | None = None,
+    lob_fetch: str = "inline",
+    lob_chunk_rows: int = 1_000,
+    lob_piece_bytes: int = converters.DEFAULT_PIECE_BYTES,
 ) -> int:
     """
     Origin(소스)에서 where 조건으로 조회한 결과를 CSV로 스트리밍 내보냅니다.
-    - 헤더는 컬럼명 소문자 기준으로 1회 작성
+    - 헤더는 컬럼명 소문자 기준으로 파일마다 1회 작성
+    - compression: None | "gzip" | "zstd" (스트리밍 압축, 파일명은 호출 측에서 .gz/.zst 지정)
+    - part_max_bytes: 0보다 크면 파일이 이 크기(압축 후 기준)를 넘을 때마다 name.part0001.csv… 로 나눕니다.
+    - files: 리스트를 넘기면 실제로 만든 파일 경로를 채웁니다.
+    - on_metrics: 주면 청크마다/끝에 metrics 이벤트(dict)로 호출합니다. (fetch / write, commit은 파일 마무리)
+    - 바이너리(BLOB/BYTEA/RAW) 값은 base64로 씁니다. (importer가 되돌림)
+    - lob_fetch="stream": LOB를 lob_piece_bytes 조각으로 읽어 파일에 바로 씁니다. (큰 LOB도 행 단위 메모리 고정)
     - 반환: 내보낸 총 행 수
     """
     cols = _get_columns(engine, schema, table)
     if not cols:
         return 0
+    kinds = converters.column_kinds(engine, schema, table, cols)
+    chunk_size = converters.lob_chunk_size(chunk_size, kinds, lob_chunk_rows)
+    stream_lobs = lob_fetch == "stream" and converters.has_lobs(kinds)
 
     where_sql = f" WHERE {where_text} " if where_text.strip() else ""
     src_dialect = (engine.dialect.name or "").lower()
@@ -166,21 +1335,93 @@ def export_origin_to_csv(
     else:
         select_cols = ", ".join(f'"{c}" AS "{c}"' for c in cols)
 
-    select_sql = text(f"SELECT {select_cols} FROM {schema}.{table}{where_sql}")
+    select_sql = f"SELECT {select_cols} FROM {schema}.{table}{where_sql}"
+    files = files if files is not None else []
+    part = 0
 
-    out_count = 0
-    with engine.connect() as conn, open(file_path, "w", newline=newline_opt, encoding=encoding) as f:
-        writer = csv.writer(f)
+    def open_next() -> Tuple[TextOutput, object]:
+        nonlocal part
+        part += 1
+        path = part_path(file_path, part) if part_max_bytes > 0 else file_path
+        out = TextOutput(path, compression, encoding=encoding, newline=newline_opt, buffer_bytes=buffer_bytes)
+        files.append(path)
+        writer = csv.writer(out.text)
         writer.writerow(cols)
+        return out, writer
 
-        result = conn.execution_options(stream_results=True).execute(select_sql)
-        while True:
-            rows = result.fetchmany(chunk_size)
-            if not rows:
-                break
-            for r in rows:
-                m = r._mapping
-                writer.writerow([m.get(c) for c in cols])
-                out_count += 1
+    out_count = 0
+    meter = LoadMeter(file_path, f"{schema}.{table}".upper(), fetch_inline=True) if on_metrics else None
+    chunks = partial(
+        _fetch_chunks, engine, select_sql, chunk_size,
+        output_handler=_lob_handler(engine, kinds, lob_fetch),
+        convert=converters.row_converter(kinds, "csv", keep_lobs=stream_lobs),
+    )
+    out, writer = open_next()
+    try:
+        for item in (timed_chunks(chunks) if meter else chunks()):
+            if meter:
+                rows, fetch_s = item
+                meter.begin(len(rows), _estimate_row_bytes(rows) * len(rows), fetch_s)
+            else:
+                rows = item
+            if part_max_bytes > 0 and out.bytes_written >= part_max_bytes:
+                out.close()
+                out, writer = open_next()
+            if stream_lobs:
+                for r in rows:
+                    converters.write_csv_row(out.text, r, lob_piece_bytes)
+            else:
+                writer.writerows(rows)
+            out_count += len(rows)
+            if meter:
+                meter.count(written=len(rows))
+                meter.lap("write")
+                on_metrics(meter.end())
+                meter.skip()
+    finally:
+        out.close()
+    if meter:
+        on_metrics(meter.summary())
 
     return out_count
+
+
+def export_tables_to_csv(
+    engine: Engine,
+    schema: str,
+    tables: List[str],
+    where_text: str,
+    dir_path: str,
+    *,
+    max_workers: int = 4,
+    compression: str | None = None,
+    file_format: str = "csv",
+    **export_kwargs,
+) -> Generator[Tuple[str, int, List[str], str | None], None, None]:
+    """
+    여러 테이블을 폴더에 동시에 내보냅니다. (테이블당 커넥션 1개, 최대 max_workers개)
+    - 파일명: <테이블>.csv[.gz|.zst] / file_format="parquet" | "arrow"이면 <테이블>.parquet / .arrow
+    - 끝난 순서대로 (테이블, 행 수, 파일 목록, 오류 메시지 | None)을 내보냅니다.
+      한 테이블이 실패해도 나머지는 계속 진행합니다.
+    """
+    if file_format == "csv":
+        suffix, export = ".csv" + COMPRESSION_SUFFIX[compression], export_origin_to_csv
+    else:
+        from data_shuttle.columnar import COLUMNAR_SUFFIX, export_origin_to_columnar
+        suffix, export = COLUMNAR_SUFFIX[file_format], partial(export_origin_to_columnar, file_format=file_format)
+
+    def _one(table: str) -> Tuple[str, int, List[str], str | None]:
+        files: List[str] = []
+        try:
+            n = export(
+                engine, schema, table, where_text, os.path.join(dir_path, f"{table}{suffix}"),
+                compression=compression, files=files, **export_kwargs,
+            )
+            return table, n, files, None
+        except Exception as e:
+            return table, 0, files, str(e)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = [pool.submit(_one, t) for t in tables]
+        for fut in as_completed(futures):
+            yield fut.result()
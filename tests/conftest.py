@@ -0,0 +1,30 @@
+import pytest
+from sqlalchemy import create_engine
+
+
+@pytest.fixture
+def make_engines(tmp_path):
+    """
+    SQLite 원본/목적지 쌍을 만듭니다.
+    원본 t(id, v, ts)는 1..rows행이고 null_when(i 기준 SQL 조건)인 행은 v가 NULL입니다.
+    목적지 t의 v는 NOT NULL이라 그 행들은 거부됩니다.
+    """
+    engines = []
+
+    def make(rows: int, null_when: str = "0"):
+        src = create_engine(f"sqlite:///{tmp_path / 'src.db'}")
+        dst = create_engine(f"sqlite:///{tmp_path / 'dst.db'}")
+        engines.extend((src, dst))
+        with src.begin() as c:
+            c.exec_driver_sql("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT, ts INTEGER)")
+            c.exec_driver_sql(
+                f"WITH RECURSIVE r(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM r WHERE i < {int(rows)}) "
+                f"INSERT INTO t SELECT i, CASE WHEN {null_when} THEN NULL ELSE 'x' END, i FROM r"
+            )
+        with dst.begin() as c:
+            c.exec_driver_sql("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT NOT NULL, ts INTEGER)")
+        return src, dst
+
+    yield make
+    for engine in engines:
+        engine.dispose()
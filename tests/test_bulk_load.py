@@ -0,0 +1,45 @@
+from data_shuttle import bulk_load
+
+
+class _OracleCatalog:
+    """_plan_oracle이 읽는 카탈로그 뷰만 흉내 내는 커넥션"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def execute(self, stmt, params=None):
+        sql = str(stmt)
+        for view, rows in self.rows.items():
+            if f"FROM {view} " in sql:
+                return rows
+        return []
+
+
+def test_oracle_rebuilds_partitioned_indexes_per_partition():
+    conn = _OracleCatalog({
+        "all_indexes": [("APP", "IX_PLAIN", "NO"), ("APP", "IX_PART", "YES"), ("APP", "IX_COMP", "YES")],
+        "all_ind_partitions": [("APP", "IX_PART", "P1", "NO"), ("APP", "IX_PART", "P2", "NO"),
+                               ("APP", "IX_COMP", "C1", "YES")],
+        "all_ind_subpartitions": [("APP", "IX_COMP", "C1_S1"), ("APP", "IX_COMP", "C1_S2")],
+        "all_tables": [(1,)],
+    })
+    plan = bulk_load._plan_oracle(conn, "app", "t", unlogged=True, parallel=1)
+    undo = {sql: redo for step, sql, redo in plan if step == "indexes"}
+    assert undo == {
+        'ALTER INDEX "APP"."IX_PLAIN" UNUSABLE': ['ALTER INDEX "APP"."IX_PLAIN" REBUILD'],
+        'ALTER INDEX "APP"."IX_PART" UNUSABLE': [
+            'ALTER INDEX "APP"."IX_PART" REBUILD PARTITION "P1"',
+            'ALTER INDEX "APP"."IX_PART" REBUILD PARTITION "P2"',
+        ],
+        'ALTER INDEX "APP"."IX_COMP" UNUSABLE': [
+            'ALTER INDEX "APP"."IX_COMP" REBUILD SUBPARTITION "C1_S1"',
+            'ALTER INDEX "APP"."IX_COMP" REBUILD SUBPARTITION "C1_S2"',
+        ],
+    }
+    # NOLOGGING은 배열 INSERT에 효과가 없어 계획에 넣지 않습니다.
+    assert not [p for p in plan if p[0] == "logging"]
+
+    parallel = bulk_load._plan_oracle(conn, "app", "t", unlogged=False, parallel=4)
+    redo = [r for step, _, r in parallel if step == "indexes"][1]
+    assert redo[-1] == 'ALTER INDEX "APP"."IX_PART" NOPARALLEL'
+    assert redo[0].endswith('REBUILD PARTITION "P1" PARALLEL 4')
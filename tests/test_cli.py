@@ -0,0 +1,52 @@
+import json
+
+import pytest
+from data_shuttle import cli
+
+
+@pytest.fixture
+def preset(make_engines, tmp_path):
+    """실제로 접속되는 SQLite connection_1 / connection_2 프리셋을 만드는 함수"""
+    make_engines(20)
+    settings = {
+        "connection_1": {"db_type": "SQLite", "service_or_db": str(tmp_path / "src.db")},
+        "connection_2": {"db_type": "SQLite", "service_or_db": str(tmp_path / "dst.db")},
+    }
+
+    def make(origin, options=None):
+        path = tmp_path / "preset.txt"
+        path.write_text(json.dumps({
+            "settings": settings,
+            "origin": origin,
+            "destination": {"schema": "main"},
+            "options": dict({"prefetch_chunks": 0}, **(options or {})),
+        }), encoding="utf-8")
+        return str(path)
+
+    return make
+
+
+def _run(tmp_path, command, preset_path):
+    args = [command, "--preset", preset_path, "--summary", str(tmp_path / "s.json"), "--quiet"]
+    if command == "export":
+        args += ["--out", str(tmp_path / "out")]
+    return cli.main(args)
+
+
+@pytest.mark.parametrize("command", ["migrate", "export"])
+def test_valid_preset_runs(tmp_path, preset, command):
+    # 같은 접속 설정으로 정상 실행되는지 먼저 확인 (아래 사용법 오류가 접속 설정 탓이 아님)
+    assert _run(tmp_path, command, preset({"schema": "main", "tables": "t"})) == cli.EXIT_OK
+
+
+@pytest.mark.parametrize("command, origin, options, message", [
+    ("migrate", {"schema": "main", "tables": ""}, None, "schema와 tables"),
+    ("migrate", {"schema": "", "tables": "t"}, None, "schema와 tables"),
+    ("export", {"schema": "main", "tables": " , "}, None, "schema와 tables"),
+    ("export", {"schema": "main", "tables": "t"}, {"export_format": "xlsx"}, "export_format"),
+])
+def test_usage_errors_exit_2(tmp_path, preset, capsys, command, origin, options, message):
+    assert _run(tmp_path, command, preset(origin, options)) == cli.EXIT_USAGE
+    assert message in capsys.readouterr().err
+    # 실행 전에 끝나므로 요약 파일도 없습니다.
+    assert not (tmp_path / "s.json").exists()
@@ -0,0 +1,27 @@
+from sqlalchemy import create_engine
+from data_shuttle import converters
+
+
+def test_inline_text_and_bytea_are_not_lobs():
+    assert converters.column_kind("CLOB") == "clob"
+    assert converters.column_kind("NCLOB") == "clob"
+    assert converters.column_kind("BLOB") == "blob"
+    for name in ("TEXT", "LONG", "VARCHAR(20)"):
+        assert converters.column_kind(name) is None
+    for name in ("BYTEA", "RAW(16)", "LONG RAW"):
+        assert converters.column_kind(name) == "binary"
+    assert converters.column_kind("BLOB", locators=False) == "binary"
+    assert converters.column_kind("CLOB", locators=False) is None
+
+
+def test_sqlite_text_blob_keep_plain_path(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'src.db'}")
+    with engine.begin() as c:
+        c.exec_driver_sql("CREATE TABLE t (id INTEGER PRIMARY KEY, body TEXT, data BLOB)")
+    kinds = converters.column_kinds(engine, "main", "t", ["id", "body", "data"])
+    assert kinds == [None, None, "binary"]
+    assert converters.lob_chunk_size(10_000, kinds, 1_000) == 10_000
+    assert converters.row_converter(kinds, "load") is None
+    # CSV에서는 바이너리만 base64
+    assert converters.row_converter(kinds, "csv")([(1, "a", b"\x00\x01")]) == [(1, "a", "AAE=")]
+    engine.dispose()
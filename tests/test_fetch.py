@@ -0,0 +1,26 @@
+from data_shuttle import utils
+
+
+def test_cursor_wrapper_execution_option(make_engines):
+    src, _ = make_engines(25)
+    seen = []
+
+    class Wrapper:
+        def __init__(self, cur):
+            object.__setattr__(self, "_cur", cur)
+
+        def fetchmany(self, n):
+            seen.append(n)
+            return self._cur.fetchmany(n)
+
+        def __getattr__(self, name):
+            return getattr(self._cur, name)
+
+        def __setattr__(self, name, value):
+            setattr(self._cur, name, value)
+
+    wrapped = src.execution_options(ds_cursor_wrapper=Wrapper)
+    chunks = list(utils._fetch_chunks(wrapped, "SELECT id FROM t ORDER BY id", 10))
+    assert [len(c) for c in chunks] == [10, 10, 5]
+    # 마지막 빈 fetch까지 4회
+    assert seen == [10, 10, 10, 10]
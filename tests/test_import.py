@@ -0,0 +1,47 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from data_shuttle import importer
+
+
+def test_csv_decimal_into_sqlite(tmp_path):
+    path = tmp_path / "t.csv"
+    path.write_text("id,amount\n1,12.50\n2,0.1\n3,\n", encoding="utf-8")
+    dst = create_engine(f"sqlite:///{tmp_path / 'dst.db'}")
+    with dst.begin() as c:
+        c.exec_driver_sql("CREATE TABLE t (id INTEGER PRIMARY KEY, amount NUMERIC(10, 2))")
+    events = list(importer.run_import_stream(
+        dst, str(path), dst_schema="main", dst_table="t", chunk_size=100, prefetch_chunks=0,
+    ))
+    assert not [ev for ev in events if ev["type"] == "error"]
+    assert sum(ev["inserted_delta"] for ev in events if ev["type"] == "progress") == 3
+    with dst.connect() as c:
+        rows = c.exec_driver_sql("SELECT id, amount FROM t ORDER BY id").all()
+    assert [(i, None if a is None else Decimal(str(a))) for i, a in rows] == [
+        (1, Decimal("12.5")), (2, Decimal("0.1")), (3, None),
+    ]
+    dst.dispose()
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+def test_columnar_chunks_follow_current_size(tmp_path, file_format):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    table = pa.table({"id": list(range(100)), "v": [str(i) for i in range(100)]})
+    path = str(tmp_path / f"t.{file_format}")
+    if file_format == "parquet":
+        pq.write_table(table, path, row_group_size=30)
+    else:
+        with pa.ipc.new_file(path, table.schema) as w:
+            for batch in table.to_batches(max_chunksize=30):
+                w.write_batch(batch)
+    # 적응형 크기처럼 청크를 받을 때마다 현재 크기가 바뀝니다.
+    current = [10]
+    chunks = []
+    for chunk in importer.read_columnar_chunks(path, lambda: current[0], file_format=file_format):
+        chunks.append(chunk)
+        current[0] = {10: 25, 25: 40}.get(current[0], 40)
+    assert [len(c) for c in chunks] == [10, 25, 40, 25]
+    assert [r[0] for c in chunks for r in c] == list(range(100))
@@ -0,0 +1,54 @@
+import pytest
+from data_shuttle import utils
+from data_shuttle.jobs import MigrationJob
+
+
+@pytest.fixture
+def engines(make_engines):
+    return make_engines(250)
+
+
+@pytest.mark.parametrize("write_mode,merge_scope", [("upsert", "chunk"), ("merge", "chunk"), ("merge", "commit")])
+def test_watermark_skips_rejected_rows(engines, write_mode, merge_scope):
+    src, dst = engines
+    with src.begin() as c:
+        c.exec_driver_sql("UPDATE t SET v = NULL WHERE id >= 240")
+    events = list(utils.run_migration_stream(
+        src, dst, src_schema="main", src_table="t", dst_schema="main", dst_table="t",
+        chunk_size=100, prefetch_chunks=0, watermark_column="ts",
+        write_mode=write_mode, merge_keys=["id"], merge_scope=merge_scope,
+    ))
+    assert len([ev for ev in events if ev["type"] == "error"]) == 11
+    assert [ev["value"] for ev in events if ev["type"] == "watermark"] == [239]
+
+
+class _Job(MigrationJob):
+    def _log(self, message):
+        pass
+
+
+def test_incremental_defaults_to_destination_pk(engines):
+    _, dst = engines
+    job = _Job({}, "main", "t", "", dst_schema="main", options={})
+    assert job._incremental_write(dst, "t", "t", [], None) == (["id"], None)
+    with pytest.raises(ValueError, match="insert"):
+        job._incremental_write(dst, "t", "t", ["id"], "insert")
+    with dst.begin() as c:
+        c.exec_driver_sql("CREATE TABLE nopk (id INTEGER, v TEXT)")
+    with pytest.raises(ValueError, match="merge_keys"):
+        job._incremental_write(dst, "nopk", "nopk", [], None)
+
+
+def test_resumed_count_skips_checkpointed_rows(engines, tmp_path):
+    src, _ = engines
+    assert utils.count_rows(src, "main", "t", "", key_column="id", resume_after=200) == 50
+    assert utils.count_rows(src, "main", "t", "id > 100", key_column="id", resume_after=200) == 50
+    assert utils.count_rows(src, "main", "t", "", watermark_column="ts", watermark_after=240,
+                            key_column="id", resume_after=100) == 10
+
+    opts = {"key_column": "id"}
+    job = _Job({}, "main", "t", "", dst_schema="main", options=opts, state_path=str(tmp_path / "p.state.json"))
+    job.state.save_checkpoint(job._table_key("t", "t"), "id", 200, 200)
+    assert job._count(src, "t", "t") == 250
+    job.resume = True
+    assert job._count(src, "t", "t") == 50
@@ -0,0 +1,37 @@
+import pytest
+from data_shuttle.engines import engine_registry
+from data_shuttle.jobs import MigrationJob
+
+
+class _Job(MigrationJob):
+    def _log(self, message):
+        pass
+
+
+@pytest.mark.parametrize("parallel_tables", [1, 3])
+def test_failed_tables_same_status_sequential_and_parallel(make_engines, tmp_path, parallel_tables):
+    src, dst = make_engines(400, "i > 300")
+    for engine in (src, dst):
+        with engine.begin() as c:
+            for name in ("u", "w"):
+                c.exec_driver_sql(f"CREATE TABLE {name} AS SELECT * FROM t WHERE id <= 100")
+    with src.begin() as c:
+        c.exec_driver_sql("UPDATE u SET v = 'x'")
+    with dst.begin() as c:
+        c.exec_driver_sql("DELETE FROM u")
+    settings = {
+        "connection_1": {"db_type": "SQLite", "service_or_db": str(tmp_path / "src.db")},
+        "connection_2": {"db_type": "SQLite", "service_or_db": str(tmp_path / "dst.db")},
+    }
+    options = {
+        "max_errors": 1, "prefetch_chunks": 0, "parallel_tables": parallel_tables,
+        # 워터마크 증분 + insert는 설정 오류 → 예외로 실패
+        "tables": {"W": {"watermark_column": "ts", "write_mode": "insert"}},
+    }
+    job = _Job(settings, "main", "t,u,w", "", dst_schema="main", options=options)
+    try:
+        job.execute()
+    finally:
+        engine_registry.dispose_all()
+    status = {r["source"]: r["status"] for r in job.results}
+    assert status == {"main.t": "aborted", "main.u": "ok", "main.w": "failed"}
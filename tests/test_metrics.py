@@ -0,0 +1,32 @@
+import pytest
+from data_shuttle import utils
+from data_shuttle.metrics import PrometheusTextfileSink
+
+
+@pytest.fixture
+def engines(make_engines):
+    return make_engines(1000, "i % 100 = 0")
+
+
+@pytest.mark.parametrize("options", [
+    {},
+    {"write_mode": "merge", "merge_keys": ["id"], "merge_scope": "commit"},
+])
+def test_rows_count_written_not_fetched(engines, tmp_path, options):
+    src, dst = engines
+    sink = PrometheusTextfileSink(str(tmp_path / "run.prom"))
+    summary = None
+    for ev in utils.run_migration_stream(
+        src, dst, src_schema="main", src_table="t", dst_schema="main", dst_table="t",
+        chunk_size=300, metrics=True, **options,
+    ):
+        if ev["type"] == "metrics":
+            sink.write(ev)
+            if ev["scope"] == "table":
+                summary = ev
+    sink.close()
+    # 1000행 조회, NULL 10행은 NOT NULL 위반으로 거부
+    assert (summary["rows"], summary["rows_rejected"]) == (990, 10)
+    text = (tmp_path / "run.prom").read_text(encoding="utf-8")
+    assert 'datashuttle_rows_total{table="main.t"} 990' in text
+    assert 'datashuttle_rows_rejected_total{table="main.t"} 10' in text
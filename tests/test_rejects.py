@@ -0,0 +1,31 @@
+import json
+
+from data_shuttle.rejects import RejectWriter
+
+
+def _write(path, rows, append):
+    w = RejectWriter(str(path), append=append)
+    for i in rows:
+        w.write("MAIN.T", ["id", "v"], i, (i, None), "NOT NULL")
+    w.close()
+    return w.files
+
+
+def test_resume_appends_jsonl(tmp_path):
+    path = tmp_path / "rejects.jsonl"
+    _write(path, [1, 2], append=False)
+    _write(path, [3], append=True)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(x)["row_index"] for x in lines] == [1, 2, 3]
+    # 새 실행(이어하기 아님)은 덮어씁니다.
+    _write(path, [9], append=False)
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+
+
+def test_resume_appends_csv_without_second_header(tmp_path):
+    path = tmp_path / "rejects.csv"
+    (first,) = _write(path, [1], append=False)
+    _write(path, [2], append=True)
+    with open(first, encoding="utf-8-sig") as f:
+        lines = f.read().splitlines()
+    assert lines == ["row_index,error,id,v", "1,NOT NULL,1,", "2,NOT NULL,2,"]
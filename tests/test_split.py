@@ -0,0 +1,34 @@
+import pytest
+from data_shuttle import utils
+
+
+@pytest.fixture
+def engines(make_engines):
+    return make_engines(400, "i > 300")
+
+
+def test_failed_slice_fails_table_after_other_slices(engines):
+    src, dst = engines
+    events = []
+    # id 301~400 조각만 NOT NULL 위반 → max_errors 초과로 그 조각만 실패
+    with pytest.raises(utils.SplitSliceError, match="1/4"):
+        for ev in utils.run_migration_split(
+            src, dst, src_schema="main", src_table="t", dst_schema="main", dst_table="t",
+            split_mode="pk", split_count=4, key_column="id", max_errors=1, prefetch_chunks=0,
+        ):
+            events.append(ev)
+
+    assert sum(ev["inserted_delta"] for ev in events if ev["type"] == "progress") == 300
+    with dst.connect() as c:
+        assert c.exec_driver_sql("SELECT COUNT(*), MAX(id) FROM t").one() == (300, 300)
+
+
+def test_all_slices_ok(engines):
+    src, dst = engines
+    with src.begin() as c:
+        c.exec_driver_sql("UPDATE t SET v = 'y' WHERE v IS NULL")
+    events = list(utils.run_migration_split(
+        src, dst, src_schema="main", src_table="t", dst_schema="main", dst_table="t",
+        split_mode="pk", split_count=4, key_column="id", prefetch_chunks=0,
+    ))
+    assert sum(ev["inserted_delta"] for ev in events if ev["type"] == "progress") == 400